@@ -1,81 +1,361 @@
 """The Actron Air integration."""
 
+import asyncio
+from datetime import timedelta
+from functools import partial
+import time
+
 from actron_neo_api import ActronAirAPI, ActronAirAPIError, ActronAirAuthError
 from actron_neo_api.models.system import ActronAirSystemInfo
 
 from homeassistant.const import CONF_API_TOKEN, Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
+from homeassistant.helpers import config_validation as cv, device_registry as dr
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.typing import ConfigType
+from homeassistant.util import dt as dt_util
 
-from .const import _LOGGER, DOMAIN
+from .api import create_api
+from .cache import ActronAirStatusCache
+from .const import (
+    _LOGGER,
+    CONF_COMMAND_COALESCE_WINDOW,
+    DEFAULT_COMMAND_COALESCE_WINDOW,
+    DOMAIN,
+)
 from .coordinator import (
+    PUSH_WATCHDOG_INTERVAL,
+    ActronAirAccountCoordinator,
     ActronAirConfigEntry,
+    ActronAirHardware,
     ActronAirRuntimeData,
     ActronAirSystemCoordinator,
 )
+from .metrics import ActronAirConnectionStats
+from .ratelimit import ActronAirRateLimiter
+from .services import async_setup_services
+
+STARTUP_CONCURRENCY = 4
+WARM_START_RETRY_DELAY = timedelta(seconds=30)
+WARM_START_MAX_RETRY_DELAY = timedelta(minutes=5)
+
+PLATFORMS = [
+    Platform.BINARY_SENSOR,
+    Platform.CLIMATE,
+    Platform.COVER,
+    Platform.SENSOR,
+    Platform.SWITCH,
+]
+ZONE_PLATFORMS = {Platform.COVER}
 
-PLATFORMS = [Platform.BINARY_SENSOR, Platform.CLIMATE, Platform.COVER, Platform.SENSOR, Platform.SWITCH]
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Actron Air services."""
+    async_setup_services(hass)
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ActronAirConfigEntry) -> bool:
-    """Set up Actron Air integration from a config entry."""
+    """Set up Actron Air integration from a config entry.
 
-    api = ActronAirAPI(refresh_token=entry.data[CONF_API_TOKEN])
+    When the status cache holds every system, entities are created from it
+    and the cloud is contacted in the background.
+    """
+    setup_started = time.monotonic()
+    command_window = entry.options.get(
+        CONF_COMMAND_COALESCE_WINDOW, DEFAULT_COMMAND_COALESCE_WINDOW
+    )
+    connection_stats = ActronAirConnectionStats()
+    api = create_api(
+        hass,
+        connection_stats,
+        refresh_token=entry.data[CONF_API_TOKEN],
+        debounce_seconds=command_window,
+    )
+    status_cache = ActronAirStatusCache(hass, entry.entry_id)
     systems: list[ActronAirSystemInfo] = []
-
-    try:
-        systems = await api.get_ac_systems()
-        await api.update_status()
-    except ActronAirAuthError as err:
-        raise ConfigEntryAuthFailed(
-            translation_domain=DOMAIN,
-            translation_key="auth_error",
-        ) from err
-    except ActronAirAPIError as err:
-        raise ConfigEntryNotReady(
-            translation_domain=DOMAIN,
-            translation_key="setup_connection_error",
-        ) from err
-
-    serial_numbers = [system.serial for system in systems if system.serial]
     push_updates_enabled = False
-    if serial_numbers:
-        push_updates_enabled = await api.start_push(serial_numbers)
-        if push_updates_enabled:
-            _LOGGER.debug("Realtime push updates enabled for %s systems", len(serial_numbers))
-        else:
-            _LOGGER.info("Realtime push unavailable, using polling fallback")
+
+    if (cached := await status_cache.async_load()) is not None:
+        systems = cached.systems
+        for serial_number, status in cached.statuses.items():
+            api.state_manager.process_status_update(serial_number, status)
+        rate_limiter = ActronAirRateLimiter(
+            [system.serial for system in systems], command_window
+        )
+        setup_timings = {"cache": time.monotonic() - setup_started}
+    else:
+        try:
+            systems = await api.get_ac_systems()
+            discovered = time.monotonic()
+            serial_numbers = [system.serial for system in systems if system.serial]
+            rate_limiter = ActronAirRateLimiter(serial_numbers, command_window)
+            push_updates_enabled = await _async_start_systems(
+                api, rate_limiter, serial_numbers
+            )
+        except ActronAirAuthError as err:
+            raise ConfigEntryAuthFailed(
+                translation_domain=DOMAIN,
+                translation_key="auth_error",
+            ) from err
+        except ActronAirAPIError as err:
+            raise ConfigEntryNotReady(
+                translation_domain=DOMAIN,
+                translation_key="setup_connection_error",
+            ) from err
+        setup_timings = {
+            "discovery": discovered - setup_started,
+            "status": time.monotonic() - discovered,
+        }
 
     system_coordinators: dict[str, ActronAirSystemCoordinator] = {}
     for system in systems:
-        if api.state_manager.get_status(system.serial) is None:
-            await api.update_status(system.serial)
-
         coordinator = ActronAirSystemCoordinator(
             hass,
             entry,
             api,
+            rate_limiter,
             system,
             push_updates_enabled=push_updates_enabled,
         )
         _LOGGER.debug("Setting up coordinator for system: %s", system.serial)
+        if cached is not None:
+            # Entities go unavailable if the cached status is too old.
+            coordinator.async_set_last_seen(cached.last_seen[system.serial])
         if push_updates_enabled:
             api.subscribe_system_updates(system.serial, coordinator.handle_push_update)
         system_coordinators[system.serial] = coordinator
 
+    account_coordinator = ActronAirAccountCoordinator(
+        hass, entry, api, rate_limiter, system_coordinators, live=cached is None
+    )
+    # No entity listens to the account coordinator, so keep its timer running.
+    entry.async_on_unload(account_coordinator.async_add_listener(lambda: None))
+    entry.async_on_unload(
+        async_track_time_interval(
+            hass,
+            account_coordinator.async_check_push_liveness,
+            PUSH_WATCHDOG_INTERVAL,
+        )
+    )
+
     entry.runtime_data = ActronAirRuntimeData(
         api=api,
+        rate_limiter=rate_limiter,
+        connection_stats=connection_stats,
+        account_coordinator=account_coordinator,
         system_coordinators=system_coordinators,
         push_updates_enabled=push_updates_enabled,
+        setup_timings=setup_timings,
+        warm_start=cached is not None,
+        platforms=_async_platforms(system_coordinators),
     )
+    entry.async_on_unload(status_cache.async_track(system_coordinators))
+    if cached is None:
+        _async_remove_stale_devices(hass, entry)
+
+    @callback
+    def async_check_platforms(hardware: ActronAirHardware) -> None:
+        """Reload to set up a platform that new hardware needs."""
+        if set(_async_platforms(system_coordinators)) - set(
+            entry.runtime_data.platforms
+        ):
+            _LOGGER.info("New Actron Air hardware needs more platforms, reloading")
+            hass.config_entries.async_schedule_reload(entry.entry_id)
+
+    for coordinator in system_coordinators.values():
+        entry.async_on_unload(
+            coordinator.async_add_hardware_listener(async_check_platforms)
+        )
+
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    await hass.config_entries.async_forward_entry_setups(
+        entry, entry.runtime_data.platforms
+    )
+    setup_timings["total"] = time.monotonic() - setup_started
+    _LOGGER.debug("Set up %s systems in %.2f s", len(systems), setup_timings["total"])
+    if cached is not None:
+        entry.async_create_background_task(
+            hass, _async_finish_warm_start(hass, entry), "actron_air warm start"
+        )
     return True
 
 
+def _async_platforms(
+    system_coordinators: dict[str, ActronAirSystemCoordinator],
+) -> list[Platform]:
+    """Return the platforms that have entities to create for the systems."""
+    if not system_coordinators:
+        return []
+    has_zones = any(
+        zone.exists
+        for coordinator in system_coordinators.values()
+        for zone in coordinator.data.remote_zone_info
+    )
+    return [
+        platform
+        for platform in PLATFORMS
+        if has_zones or platform not in ZONE_PLATFORMS
+    ]
+
+
+@callback
+def _async_remove_stale_devices(
+    hass: HomeAssistant, entry: ActronAirConfigEntry
+) -> None:
+    """Remove the devices of systems, zones and peripherals no longer reported."""
+    identifiers = _async_device_identifiers(entry)
+    device_registry = dr.async_get(hass)
+    for device in dr.async_entries_for_config_entry(device_registry, entry.entry_id):
+        if not any(
+            domain == DOMAIN and identifier in identifiers
+            for domain, identifier in device.identifiers
+        ):
+            device_registry.async_update_device(
+                device.id, remove_config_entry_id=entry.entry_id
+            )
+
+
+@callback
+def _async_device_identifiers(entry: ActronAirConfigEntry) -> set[str]:
+    """Return the identifiers of every device the entry's systems report."""
+    return {
+        identifier
+        for coordinator in entry.runtime_data.system_coordinators.values()
+        for identifier in coordinator.device_identifiers()
+    }
+
+
+async def _async_finish_warm_start(
+    hass: HomeAssistant, entry: ActronAirConfigEntry
+) -> None:
+    """Replace the cached statuses with live ones and start realtime push."""
+    runtime_data = entry.runtime_data
+    api = runtime_data.api
+    started = time.monotonic()
+    retry_delay = WARM_START_RETRY_DELAY
+    while True:
+        try:
+            systems = await api.get_ac_systems()
+            serial_numbers = [system.serial for system in systems if system.serial]
+            push_updates_enabled = await _async_start_systems(
+                api, runtime_data.rate_limiter, serial_numbers
+            )
+            break
+        except ActronAirAuthError:
+            entry.async_start_reauth(hass)
+            return
+        except ActronAirAPIError as err:
+            _LOGGER.warning(
+                "Unable to refresh cached Actron Air systems, retrying in %s: %s",
+                retry_delay,
+                err,
+            )
+            await asyncio.sleep(retry_delay.total_seconds())
+            retry_delay = min(retry_delay * 2, WARM_START_MAX_RETRY_DELAY)
+
+    if set(serial_numbers) != set(runtime_data.system_coordinators):
+        _LOGGER.info("Actron Air systems changed since they were cached, reloading")
+        hass.config_entries.async_schedule_reload(entry.entry_id)
+        return
+
+    now = dt_util.utcnow()
+    for serial_number, coordinator in runtime_data.system_coordinators.items():
+        if push_updates_enabled:
+            coordinator.push_updates_enabled = True
+            coordinator.last_push = now
+            api.subscribe_system_updates(serial_number, coordinator.handle_push_update)
+        if (status := api.state_manager.get_status(serial_number)) is not None:
+            coordinator.async_set_polled_status(status)
+    runtime_data.push_updates_enabled = push_updates_enabled
+    runtime_data.account_coordinator.live = True
+    runtime_data.account_coordinator.async_update_schedule()
+    _async_remove_stale_devices(hass, entry)
+    runtime_data.setup_timings["live"] = time.monotonic() - started
+
+
+async def _async_start_systems(
+    api: ActronAirAPI, rate_limiter: ActronAirRateLimiter, serial_numbers: list[str]
+) -> bool:
+    """Start realtime push while fetching every status, returning push_enabled.
+
+    Push is stopped again if the fetch fails, so that retrying the setup does
+    not leave another connection open each time.
+    """
+    try:
+        push_updates_enabled, _ = await asyncio.gather(
+            _async_start_push(api, serial_numbers),
+            _async_fetch_initial_status(api, rate_limiter, serial_numbers),
+        )
+    except BaseException:
+        try:
+            await api.stop_push()
+        except Exception:
+            _LOGGER.warning("Failed to stop realtime push after setup", exc_info=True)
+        raise
+    return push_updates_enabled
+
+
+async def _async_start_push(api: ActronAirAPI, serial_numbers: list[str]) -> bool:
+    """Start realtime push updates, returning True if they are available."""
+    if not serial_numbers:
+        return False
+    if await api.start_push(serial_numbers):
+        _LOGGER.debug(
+            "Realtime push updates enabled for %s systems", len(serial_numbers)
+        )
+        return True
+    _LOGGER.info("Realtime push unavailable, using polling fallback")
+    return False
+
+
+async def _async_fetch_initial_status(
+    api: ActronAirAPI, rate_limiter: ActronAirRateLimiter, serial_numbers: list[str]
+) -> None:
+    """Fetch the status of every system once, a few systems at a time."""
+    semaphore = asyncio.Semaphore(STARTUP_CONCURRENCY)
+
+    async def fetch(serial_number: str) -> None:
+        async with semaphore:
+            await rate_limiter.async_call(
+                partial(api.update_status, serial_number), serial_number
+            )
+
+    await asyncio.gather(*(fetch(serial_number) for serial_number in serial_numbers))
+
+
+async def async_update_options(
+    hass: HomeAssistant, entry: ActronAirConfigEntry
+) -> None:
+    """Reload the config entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ActronAirConfigEntry) -> None:
+    """Remove the status cache of a deleted config entry."""
+    await ActronAirStatusCache(hass, entry.entry_id).async_remove()
+
+
+async def async_remove_config_entry_device(
+    hass: HomeAssistant, entry: ActronAirConfigEntry, device: dr.DeviceEntry
+) -> bool:
+    """Allow removing a device only once its hardware is no longer reported."""
+    identifiers = _async_device_identifiers(entry)
+    return not any(
+        domain == DOMAIN and identifier in identifiers
+        for domain, identifier in device.identifiers
+    )
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ActronAirConfigEntry) -> bool:
     """Unload a config entry."""
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    unload_ok = await hass.config_entries.async_unload_platforms(
+        entry, entry.runtime_data.platforms
+    )
 
     try:
         await entry.runtime_data.api.stop_push()
@@ -0,0 +1,49 @@
+"""Actron Air cloud client for the integration."""
+
+import os
+from typing import Any
+
+from actron_neo_api import ActronAirAPI
+from actron_neo_api.const import PLATFORM_QUE
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import (
+    async_create_clientsession,
+    async_get_clientsession,
+)
+
+from .metrics import ActronAirConnectionStats
+
+CLOUD_URL_ENV = "ACTRON_AIR_CLOUD_URL"
+
+
+def create_api(
+    hass: HomeAssistant,
+    connection_stats: ActronAirConnectionStats | None = None,
+    **kwargs: Any,
+) -> ActronAirAPI:
+    """Return a client for the Actron Air cloud.
+
+    Requests go through the connection pool Home Assistant shares between
+    integrations, so kept-alive connections and TLS sessions are reused by
+    polls, commands, token refreshes and every config entry. When
+    connection_stats is given, the client gets its own session on that pool
+    so the requests of one entry can be counted.
+
+    Setting the ACTRON_AIR_CLOUD_URL environment variable points the client
+    at another server, such as the simulator in script/simulator.py. The
+    simulator sends realtime updates over the Que transport, so the client is
+    pinned to that platform instead of picking a server from system types.
+    """
+    if connection_stats is None:
+        kwargs["session"] = async_get_clientsession(hass)
+    else:
+        kwargs["session"] = async_create_clientsession(
+            hass, trace_configs=[connection_stats.trace_config()]
+        )
+    if not (cloud_url := os.environ.get(CLOUD_URL_ENV)):
+        return ActronAirAPI(**kwargs)
+    api = ActronAirAPI(platform=PLATFORM_QUE, **kwargs)
+    api.base_url = cloud_url.rstrip("/")
+    api.oauth2_auth.update_base_url(api.base_url)
+    return api
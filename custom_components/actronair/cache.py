@@ -0,0 +1,148 @@
+"""Persistent status cache for the Actron Air integration."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from actron_neo_api import ActronAirStatus
+from actron_neo_api.models.system import ActronAirSystemInfo
+from pydantic import ValidationError
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.storage import Store
+
+from .const import _LOGGER, DOMAIN
+from .coordinator import ActronAirSystemCoordinator
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 60
+MAX_CACHE_BYTES = 256 * 1024
+CACHED_STATE_SECTIONS = (
+    "AirconSystem",
+    "NV_SystemSettings",
+    "NV_Limits",
+    "UserAirconSettings",
+    "MasterInfo",
+    "LiveAircon",
+    "Alerts",
+    "RemoteZoneInfo",
+)
+
+
+@dataclass(slots=True)
+class ActronAirCachedSystems:
+    """Systems and statuses restored from the cache."""
+
+    systems: list[ActronAirSystemInfo]
+    statuses: dict[str, dict[str, Any]]
+    last_seen: dict[str, datetime]
+
+
+class ActronAirStatusCache:
+    """Keep the last known systems and statuses of a config entry on disk.
+
+    Only the sections of the status that the integration reads are stored,
+    and statuses are left out if the file would grow past MAX_CACHE_BYTES.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the cache."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}"
+        )
+        self._coordinators: dict[str, ActronAirSystemCoordinator] = {}
+        self._save_pending = False
+
+    async def async_load(self) -> ActronAirCachedSystems | None:
+        """Return the cached systems if every one of them has a status."""
+        if (data := await self._store.async_load()) is None:
+            return None
+        try:
+            systems = [
+                ActronAirSystemInfo.model_validate(system) for system in data["systems"]
+            ]
+            statuses: dict[str, dict[str, Any]] = data["statuses"]
+            if not systems or any(system.serial not in statuses for system in systems):
+                return None
+            return ActronAirCachedSystems(
+                systems=systems,
+                statuses={
+                    serial: cached["status"] for serial, cached in statuses.items()
+                },
+                last_seen={
+                    serial: datetime.fromisoformat(cached["last_seen"])
+                    for serial, cached in statuses.items()
+                },
+            )
+        except (KeyError, TypeError, ValueError, ValidationError) as err:
+            # A cache the integration can no longer read only costs a cold start.
+            _LOGGER.debug("Ignoring unreadable status cache: %s", err)
+            return None
+
+    @callback
+    def async_track(
+        self, coordinators: dict[str, ActronAirSystemCoordinator]
+    ) -> CALLBACK_TYPE:
+        """Save the statuses of coordinators whenever they update."""
+        self._coordinators = coordinators
+        unsubs = [
+            coordinator.async_add_listener(self.async_schedule_save)
+            for coordinator in coordinators.values()
+        ]
+        self.async_schedule_save()
+
+        @callback
+        def async_untrack() -> None:
+            for unsub in unsubs:
+                unsub()
+
+        return async_untrack
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Save the cache after SAVE_DELAY unless a save is already pending."""
+        if self._save_pending:
+            return
+        self._save_pending = True
+        self._store.async_delay_save(self._async_data_to_save, SAVE_DELAY)
+
+    @callback
+    def _async_data_to_save(self) -> dict[str, Any]:
+        """Return the compact cache content."""
+        self._save_pending = False
+        data: dict[str, Any] = {
+            "systems": [
+                coordinator.system.model_dump(mode="json", by_alias=True)
+                for coordinator in self._coordinators.values()
+            ],
+            "statuses": {
+                serial: {
+                    "last_seen": coordinator.last_seen.isoformat(),
+                    "status": _compact_status(coordinator.status),
+                }
+                for serial, coordinator in self._coordinators.items()
+            },
+        }
+        if len(json_bytes(data)) > MAX_CACHE_BYTES:
+            _LOGGER.debug("Status cache too large, storing the system list only")
+            data["statuses"] = {}
+        return data
+
+    async def async_remove(self) -> None:
+        """Remove the cache file."""
+        await self._store.async_remove()
+
+
+def _compact_status(status: ActronAirStatus) -> dict[str, Any]:
+    """Return the parts of a status needed to rebuild it."""
+    return {
+        "isOnline": status.is_online,
+        "lastKnownState": {
+            section: status.last_known_state[section]
+            for section in CACHED_STATE_SECTIONS
+            if section in status.last_known_state
+        },
+    }
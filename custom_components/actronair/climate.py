@@ -19,8 +19,17 @@ from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from .const import DOMAIN
-from .coordinator import ActronAirConfigEntry, ActronAirSystemCoordinator
-from .entity import ActronAirAcEntity, ActronAirZoneEntity, actron_air_command
+from .coordinator import (
+    ActronAirConfigEntry,
+    ActronAirStatusIndex,
+    ActronAirSystemCoordinator,
+)
+from .entity import (
+    ActronAirAcEntity,
+    ActronAirZoneEntity,
+    actron_air_command,
+    async_add_hardware_entities,
+)
 
 PARALLEL_UPDATES = 0
 
@@ -46,6 +55,54 @@ HVAC_MODE_MAPPING_HA_TO_ACTRONAIR = {
 }
 
 
+def _supported_hvac_modes(index: ActronAirStatusIndex) -> list[HVACMode]:
+    """Return the HVAC modes supported by a system."""
+    modes = [
+        HVAC_MODE_MAPPING_ACTRONAIR_TO_HA[mode]
+        for mode in index.status.user_aircon_settings.supported_modes
+        if mode in HVAC_MODE_MAPPING_ACTRONAIR_TO_HA
+    ]
+    modes.append(HVACMode.OFF)
+    return modes
+
+
+def _system_hvac_mode(index: ActronAirStatusIndex) -> HVACMode | None:
+    """Return the HVAC mode of a system."""
+    settings = index.status.user_aircon_settings
+    if not settings.is_on:
+        return HVACMode.OFF
+    return HVAC_MODE_MAPPING_ACTRONAIR_TO_HA.get(settings.mode)
+
+
+def _system_fan_mode(index: ActronAirStatusIndex) -> str | None:
+    """Return the fan mode of a system."""
+    fan_mode = index.status.user_aircon_settings.base_fan_mode
+    return FAN_MODE_MAPPING_ACTRONAIR_TO_HA.get(fan_mode)
+
+
+def _system_temperature_limits(index: ActronAirStatusIndex) -> tuple[float, float]:
+    """Return the setpoint limits of a system."""
+    return index.status.min_temp, index.status.max_temp
+
+
+def _zone_temperature_limits(
+    index: ActronAirStatusIndex, zone_id: int
+) -> tuple[float, float]:
+    """Return the setpoint limits of a zone, or the system's if it is missing."""
+    if (zone := index.zones.get(zone_id)) is None:
+        return _system_temperature_limits(index)
+    return zone.min_temp, zone.max_temp
+
+
+def _zone_hvac_mode(index: ActronAirStatusIndex, zone_id: int) -> HVACMode | None:
+    """Return the HVAC mode of a zone."""
+    if (zone := index.zones.get(zone_id)) is None:
+        return None
+    if zone.is_active:
+        return HVAC_MODE_MAPPING_ACTRONAIR_TO_HA.get(zone.hvac_mode)
+    return HVACMode.OFF
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ActronAirConfigEntry,
@@ -53,19 +110,14 @@ async def async_setup_entry(
 ) -> None:
     """Set up Actron Air climate entities."""
     system_coordinators = entry.runtime_data.system_coordinators
-    entities: list[ClimateEntity] = []
-
-    for coordinator in system_coordinators.values():
-        status = coordinator.data
-        entities.append(ActronSystemClimate(coordinator))
-
-        entities.extend(
-            ActronZoneClimate(coordinator, zone)
-            for zone in status.remote_zone_info
-            if zone.exists
-        )
-
-    async_add_entities(entities)
+    async_add_entities(
+        ActronSystemClimate(coordinator) for coordinator in system_coordinators.values()
+    )
+    async_add_hardware_entities(
+        entry,
+        async_add_entities,
+        zone_entities=lambda coordinator, zone: [ActronZoneClimate(coordinator, zone)],
+    )
 
 
 class ActronAirClimateEntity(ClimateEntity):
@@ -96,23 +148,17 @@ class ActronSystemClimate(ActronAirAcEntity, ActronAirClimateEntity):
     @property
     def hvac_modes(self) -> list[HVACMode]:
         """Return the list of supported HVAC modes."""
-        modes = [
-            HVAC_MODE_MAPPING_ACTRONAIR_TO_HA[mode]
-            for mode in self._status.user_aircon_settings.supported_modes
-            if mode in HVAC_MODE_MAPPING_ACTRONAIR_TO_HA
-        ]
-        modes.append(HVACMode.OFF)
-        return modes
+        return self.coordinator.index.derive(_supported_hvac_modes)
 
     @property
     def min_temp(self) -> float:
         """Return the minimum temperature that can be set."""
-        return self._status.min_temp
+        return self.coordinator.index.derive(_system_temperature_limits)[0]
 
     @property
     def max_temp(self) -> float:
         """Return the maximum temperature that can be set."""
-        return self._status.max_temp
+        return self.coordinator.index.derive(_system_temperature_limits)[1]
 
     @property
     def _status(self) -> ActronAirStatus:
@@ -122,17 +168,12 @@ class ActronSystemClimate(ActronAirAcEntity, ActronAirClimateEntity):
     @property
     def hvac_mode(self) -> HVACMode | None:
         """Return the current HVAC mode."""
-        if not self._status.user_aircon_settings.is_on:
-            return HVACMode.OFF
-
-        mode = self._status.user_aircon_settings.mode
-        return HVAC_MODE_MAPPING_ACTRONAIR_TO_HA.get(mode)
+        return self.coordinator.index.derive(_system_hvac_mode)
 
     @property
     def fan_mode(self) -> str | None:
         """Return the current fan mode."""
-        fan_mode = self._status.user_aircon_settings.base_fan_mode
-        return FAN_MODE_MAPPING_ACTRONAIR_TO_HA.get(fan_mode)
+        return self.coordinator.index.derive(_system_fan_mode)
 
     @property
     def current_humidity(self) -> float:
@@ -193,53 +234,49 @@ class ActronZoneClimate(ActronAirZoneEntity, ActronAirClimateEntity):
     @property
     def hvac_modes(self) -> list[HVACMode]:
         """Return the list of supported HVAC modes."""
-        status = self.coordinator.data
-        modes = [
-            HVAC_MODE_MAPPING_ACTRONAIR_TO_HA[mode]
-            for mode in status.user_aircon_settings.supported_modes
-            if mode in HVAC_MODE_MAPPING_ACTRONAIR_TO_HA
-        ]
-        modes.append(HVACMode.OFF)
-        return modes
+        return self.coordinator.index.derive(_supported_hvac_modes)
 
     @property
     def min_temp(self) -> float:
         """Return the minimum temperature that can be set."""
-        return self._zone.min_temp
+        return self.coordinator.index.derive(_zone_temperature_limits, self._zone_id)[0]
 
     @property
     def max_temp(self) -> float:
         """Return the maximum temperature that can be set."""
-        return self._zone.max_temp
+        return self.coordinator.index.derive(_zone_temperature_limits, self._zone_id)[1]
 
     @property
     def hvac_mode(self) -> HVACMode | None:
         """Return the current HVAC mode."""
-        if self._zone.is_active:
-            mode = self._zone.hvac_mode
-            return HVAC_MODE_MAPPING_ACTRONAIR_TO_HA.get(mode)
-        return HVACMode.OFF
+        return self.coordinator.index.derive(_zone_hvac_mode, self._zone_id)
 
     @property
     def current_humidity(self) -> float | None:
         """Return the current humidity."""
-        return self._zone.humidity
+        if (zone := self._zone) is None:
+            return None
+        return zone.humidity
 
     @property
     def current_temperature(self) -> float | None:
         """Return the current temperature."""
-        return self._zone.live_temp_c
+        if (zone := self._zone) is None:
+            return None
+        return zone.live_temp_c
 
     @property
     def target_temperature(self) -> float | None:
         """Return the target temperature."""
-        return self._zone.current_setpoint
+        if (zone := self._zone) is None:
+            return None
+        return zone.current_setpoint
 
     @actron_air_command
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set the HVAC mode."""
         is_enabled = hvac_mode != HVACMode.OFF
-        await self._zone.enable(is_enabled)
+        await self._command_zone().enable(is_enabled)
 
     @actron_air_command
     async def async_set_temperature(self, **kwargs: Any) -> None:
@@ -249,4 +286,4 @@ class ActronZoneClimate(ActronAirZoneEntity, ActronAirClimateEntity):
                 translation_domain=DOMAIN,
                 translation_key="temperature_missing",
             )
-        await self._zone.set_temperature(temperature=temperature)
+        await self._command_zone().set_temperature(temperature=temperature)
@@ -5,12 +5,71 @@ from collections.abc import Mapping
 from typing import Any
 
 from actron_neo_api import ActronAirAPI, ActronAirAuthError
-
-from homeassistant.config_entries import SOURCE_REAUTH, ConfigFlow, ConfigFlowResult
-from homeassistant.const import CONF_API_TOKEN
+import voluptuous as vol
+
+from homeassistant.config_entries import (
+    SOURCE_REAUTH,
+    ConfigEntry,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow,
+)
+from homeassistant.const import CONF_API_TOKEN, UnitOfTime
+from homeassistant.core import callback
 from homeassistant.exceptions import HomeAssistantError
-
-from .const import _LOGGER, DOMAIN
+from homeassistant.helpers.selector import (
+    BooleanSelector,
+    NumberSelector,
+    NumberSelectorConfig,
+    NumberSelectorMode,
+)
+
+from .api import create_api
+from .const import (
+    _LOGGER,
+    CONF_COMMAND_COALESCE_WINDOW,
+    CONF_PUSH_COALESCE_AUTO,
+    CONF_PUSH_COALESCE_WINDOW,
+    CONF_STALE_TIMEOUT_AUTO,
+    DEFAULT_COMMAND_COALESCE_WINDOW,
+    DEFAULT_PUSH_COALESCE_AUTO,
+    DEFAULT_PUSH_COALESCE_WINDOW,
+    DEFAULT_STALE_TIMEOUT_AUTO,
+    DOMAIN,
+)
+
+OPTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Required(
+            CONF_PUSH_COALESCE_WINDOW, default=DEFAULT_PUSH_COALESCE_WINDOW
+        ): NumberSelector(
+            NumberSelectorConfig(
+                min=0,
+                max=1,
+                step=0.05,
+                unit_of_measurement=UnitOfTime.SECONDS,
+                mode=NumberSelectorMode.BOX,
+            )
+        ),
+        vol.Required(
+            CONF_PUSH_COALESCE_AUTO, default=DEFAULT_PUSH_COALESCE_AUTO
+        ): BooleanSelector(),
+        vol.Required(
+            CONF_COMMAND_COALESCE_WINDOW, default=DEFAULT_COMMAND_COALESCE_WINDOW
+        ): NumberSelector(
+            NumberSelectorConfig(
+                min=0,
+                max=2,
+                step=0.05,
+                unit_of_measurement=UnitOfTime.SECONDS,
+                mode=NumberSelectorMode.BOX,
+            )
+        ),
+        vol.Required(
+            CONF_STALE_TIMEOUT_AUTO, default=DEFAULT_STALE_TIMEOUT_AUTO
+        ): BooleanSelector(),
+    }
+)
 
 
 class ActronAirConfigFlow(ConfigFlow, domain=DOMAIN):
@@ -25,13 +84,19 @@ class ActronAirConfigFlow(ConfigFlow, domain=DOMAIN):
         self._expires_minutes: str = "30"
         self.login_task: asyncio.Task[None] | None = None
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
+        """Create the options flow."""
+        return ActronAirOptionsFlow()
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Handle the initial step."""
         if self._api is None:
             _LOGGER.debug("Initiating device authorization")
-            self._api = ActronAirAPI()
+            self._api = create_api(self.hass)
             try:
                 device_code_response = await self._api.request_device_code()
             except ActronAirAuthError as err:
@@ -152,5 +217,23 @@ class ActronAirConfigFlow(ConfigFlow, domain=DOMAIN):
         return await self.async_step_user()
 
 
+class ActronAirOptionsFlow(OptionsFlow):
+    """Handle Actron Air options."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=self.add_suggested_values_to_schema(
+                OPTIONS_SCHEMA, self.config_entry.options
+            ),
+        )
+
+
 class CannotConnect(HomeAssistantError):
     """Error to indicate we cannot connect."""
@@ -4,3 +4,12 @@ import logging
 
 _LOGGER = logging.getLogger(__package__)
 DOMAIN = "actron_air"
+
+CONF_PUSH_COALESCE_WINDOW = "push_coalesce_window"
+CONF_PUSH_COALESCE_AUTO = "push_coalesce_auto"
+CONF_COMMAND_COALESCE_WINDOW = "command_coalesce_window"
+CONF_STALE_TIMEOUT_AUTO = "stale_timeout_auto"
+DEFAULT_PUSH_COALESCE_WINDOW = 0.25
+DEFAULT_PUSH_COALESCE_AUTO = False
+DEFAULT_COMMAND_COALESCE_WINDOW = 0.25
+DEFAULT_STALE_TIMEOUT_AUTO = False
@@ -2,27 +2,81 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import timedelta
+import asyncio
+from collections.abc import Awaitable, Callable
+from copy import deepcopy
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+import time
+from typing import Any
 
 from actron_neo_api import (
     ActronAirAPI,
     ActronAirAPIError,
     ActronAirAuthError,
+    ActronAirPeripheral,
     ActronAirStatus,
+    ActronAirZone,
 )
 from actron_neo_api.models.system import ActronAirSystemInfo
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.const import Platform
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryAuthFailed, HomeAssistantError
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.helpers.json import json_bytes
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
 
-from .const import _LOGGER, DOMAIN
+from .const import (
+    _LOGGER,
+    CONF_PUSH_COALESCE_AUTO,
+    CONF_PUSH_COALESCE_WINDOW,
+    CONF_STALE_TIMEOUT_AUTO,
+    DEFAULT_PUSH_COALESCE_AUTO,
+    DEFAULT_PUSH_COALESCE_WINDOW,
+    DEFAULT_STALE_TIMEOUT_AUTO,
+    DOMAIN,
+)
+from .metrics import ActronAirConnectionStats, ActronAirMetrics
+from .ratelimit import ActronAirRateLimiter
 
 SCAN_INTERVAL = timedelta(seconds=30)
+SCAN_INTERVAL_ACTIVE = timedelta(seconds=15)
+SCAN_INTERVAL_IDLE = timedelta(minutes=3)
+POLL_TOLERANCE = timedelta(seconds=1)
+ZONE_TEMPERATURE_ACTIVITY_DELTA = 0.2
+PUSH_COALESCE_MIN_WINDOW = 0.05
+PUSH_COALESCE_MAX_WINDOW = 1.0
+PUSH_LIVENESS_TIMEOUT = timedelta(minutes=2)
+PUSH_WATCHDOG_INTERVAL = timedelta(seconds=30)
 STALE_DEVICE_TIMEOUT = timedelta(minutes=5)
+# Time for a poll to arrive once due, waiting on the rate limiter and the cloud.
+STALE_DEVICE_POLL_MARGIN = timedelta(minutes=1)
+STALE_DEVICE_MIN_TIMEOUT = SCAN_INTERVAL_IDLE + STALE_DEVICE_POLL_MARGIN
+STALE_DEVICE_MAX_TIMEOUT = timedelta(minutes=15)
+STALE_DEVICE_MISSED_UPDATES = 4
+OPTIMISTIC_CONFIRM_TIMEOUT = timedelta(seconds=60)
+OPTIMISTIC_SETTINGS_FIELDS = (
+    "is_on",
+    "mode",
+    "fan_mode",
+    "away_mode",
+    "quiet_mode_enabled",
+    "turbo_mode_enabled",
+    "temperature_setpoint_cool_c",
+    "temperature_setpoint_heat_c",
+    "enabled_zones",
+)
+OPTIMISTIC_ZONE_FIELDS = ("temperature_setpoint_cool_c", "temperature_setpoint_heat_c")
+# Parts of a status that entities can listen to, besides zones and peripherals.
+STATUS_PART_SETTINGS = "user_aircon_settings"
+STATUS_PART_LIVE = "live_aircon"
+STATUS_PART_SYSTEM = "system"
+ROUTED_STATE_SECTIONS = ("UserAirconSettings", "LiveAircon", "RemoteZoneInfo")
 ERROR_NO_SYSTEMS_FOUND = "no_systems_found"
 ERROR_UNKNOWN = "unknown_error"
 
@@ -32,21 +86,300 @@ class ActronAirRuntimeData:
     """Runtime data for the Actron Air integration."""
 
     api: ActronAirAPI
+    rate_limiter: ActronAirRateLimiter
+    connection_stats: ActronAirConnectionStats
+    account_coordinator: ActronAirAccountCoordinator
     system_coordinators: dict[str, ActronAirSystemCoordinator]
     push_updates_enabled: bool
+    setup_timings: dict[str, float] = field(default_factory=dict)
+    warm_start: bool = False
+    platforms: list[Platform] = field(default_factory=list)
 
 
 type ActronAirConfigEntry = ConfigEntry[ActronAirRuntimeData]
+type ActronAirFieldPath = tuple[str | int, ...]
+
+
+@dataclass(slots=True)
+class ActronAirExpectation:
+    """A value set by a command that the cloud has not confirmed yet."""
+
+    value: Any
+    previous: Any
+    deadline: datetime
+
+
+@dataclass(frozen=True, slots=True)
+class ActronAirActivitySample:
+    """Values used to judge how active a system is."""
+
+    is_on: bool
+    compressor_running: bool
+    mode: str
+    setpoints: tuple[float, ...]
+    zone_temperatures: tuple[float, ...]
+
+    @classmethod
+    def from_status(cls, status: ActronAirStatus) -> ActronAirActivitySample:
+        """Build an activity sample from a status snapshot."""
+        settings = status.user_aircon_settings
+        zones = status.remote_zone_info
+        return cls(
+            is_on=settings.is_on,
+            compressor_running=(
+                status.live_aircon.outdoor_unit.compressor_on
+                or status.live_aircon.compressor_capacity > 0
+            ),
+            mode=settings.mode,
+            setpoints=(
+                settings.temperature_setpoint_cool_c,
+                settings.temperature_setpoint_heat_c,
+                *(zone.temperature_setpoint_cool_c for zone in zones),
+                *(zone.temperature_setpoint_heat_c for zone in zones),
+            ),
+            zone_temperatures=tuple(zone.live_temp_c for zone in zones),
+        )
+
+    def changed_since(self, previous: ActronAirActivitySample) -> bool:
+        """Return True if settings or zone temperatures moved since previous."""
+        if (
+            self.is_on != previous.is_on
+            or self.mode != previous.mode
+            or self.setpoints != previous.setpoints
+            or len(self.zone_temperatures) != len(previous.zone_temperatures)
+        ):
+            return True
+        return any(
+            abs(current - last) >= ZONE_TEMPERATURE_ACTIVITY_DELTA
+            for current, last in zip(
+                self.zone_temperatures, previous.zone_temperatures, strict=True
+            )
+        )
+
+
+class ActronAirStatusIndex:
+    """Lookups and derived values for one status snapshot.
+
+    The coordinator builds a new index every time it notifies its listeners,
+    so values derived through it are computed once per update and shared by
+    all entities of the system.
+    """
+
+    def __init__(self, status: ActronAirStatus) -> None:
+        """Index the zones and peripherals of status."""
+        self.status = status
+        self._derived: dict[tuple[Any, ...], Any] = {}
+        self.zones: dict[int, ActronAirZone] = dict(enumerate(status.remote_zone_info))
+        self.peripherals: dict[str, ActronAirPeripheral] = {
+            peripheral.serial_number: peripheral for peripheral in status.peripherals
+        }
+
+    def derive[T](self, func: Callable[..., T], *args: Any) -> T:
+        """Return func(self, *args), computed once for this snapshot."""
+        key = (func, *args)
+        try:
+            return self._derived[key]
+        except KeyError:
+            value = self._derived[key] = func(self, *args)
+            return value
+
+
+@dataclass(frozen=True, slots=True)
+class ActronAirHardware:
+    """The zones and peripherals of a system, by zone id and serial number."""
+
+    zones: frozenset[int] = frozenset()
+    peripherals: frozenset[str] = frozenset()
+
+    @classmethod
+    def from_index(cls, index: ActronAirStatusIndex) -> ActronAirHardware:
+        """Return the hardware a status snapshot reports."""
+        return cls(
+            zones=frozenset(
+                zone_id for zone_id, zone in index.zones.items() if zone.exists
+            ),
+            peripherals=frozenset(index.peripherals),
+        )
+
+    def __sub__(self, other: ActronAirHardware) -> ActronAirHardware:
+        """Return the hardware that other does not have."""
+        return ActronAirHardware(
+            self.zones - other.zones, self.peripherals - other.peripherals
+        )
+
+    def __or__(self, other: ActronAirHardware) -> ActronAirHardware:
+        """Return the hardware of both."""
+        return ActronAirHardware(
+            self.zones | other.zones, self.peripherals | other.peripherals
+        )
+
+    def __bool__(self) -> bool:
+        """Return True if there is any hardware."""
+        return bool(self.zones or self.peripherals)
+
+
+class ActronAirPollScheduler:
+    """Choose the polling interval for a system from its recent activity.
+
+    Systems that are running or changing are polled every
+    SCAN_INTERVAL_ACTIVE. A system that is on but steady is polled every
+    SCAN_INTERVAL, and a system that is off and steady backs off by doubling
+    the interval up to SCAN_INTERVAL_IDLE.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the scheduler."""
+        self._last_sample: ActronAirActivitySample | None = None
+        self.interval = SCAN_INTERVAL
+
+    def observe(self, status: ActronAirStatus) -> timedelta:
+        """Record a status snapshot and return the next polling interval."""
+        sample = ActronAirActivitySample.from_status(status)
+        previous, self._last_sample = self._last_sample, sample
+
+        if sample.compressor_running or (
+            previous is not None and sample.changed_since(previous)
+        ):
+            self.interval = SCAN_INTERVAL_ACTIVE
+        elif sample.is_on or previous is None:
+            self.interval = SCAN_INTERVAL
+        else:
+            self.interval = max(
+                SCAN_INTERVAL, min(self.interval * 2, SCAN_INTERVAL_IDLE)
+            )
+        return self.interval
+
+
+class ActronAirPushWindowTuner:
+    """Tune the push coalescing window from the gaps seen between pushes.
+
+    Gaps shorter than PUSH_COALESCE_MAX_WINDOW are treated as part of a burst.
+    The window follows twice the smoothed burst gap, so a burst normally
+    lands in a single window without delaying isolated pushes for long.
+    """
+
+    def __init__(self, window: float) -> None:
+        """Initialize the tuner with the configured window."""
+        self.window = window
+        self._last_push: float | None = None
+        self._burst_gap: float | None = None
+
+    def observe(self, now: float) -> float:
+        """Record a push received at monotonic time now and return the window."""
+        last_push, self._last_push = self._last_push, now
+        if last_push is None or (gap := now - last_push) >= PUSH_COALESCE_MAX_WINDOW:
+            return self.window
+        if self._burst_gap is None:
+            self._burst_gap = gap
+        else:
+            self._burst_gap = 0.8 * self._burst_gap + 0.2 * gap
+        self.window = min(
+            max(self._burst_gap * 2, PUSH_COALESCE_MIN_WINDOW),
+            PUSH_COALESCE_MAX_WINDOW,
+        )
+        return self.window
+
+
+class ActronAirStaleTimeoutTuner:
+    """Tune the stale timeout from the gaps seen between status updates.
+
+    A system is considered stale once STALE_DEVICE_MISSED_UPDATES smoothed
+    gaps have passed without an update. The timeout never drops below
+    STALE_DEVICE_MIN_TIMEOUT, which leaves an idle system time for its next
+    poll to arrive and a quiet push stream time to fall back to polling.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the tuner with the default timeout."""
+        self.timeout = STALE_DEVICE_TIMEOUT
+        self._last_seen: datetime | None = None
+        self._gap: float | None = None
+
+    def observe(self, now: datetime) -> timedelta:
+        """Record an update received at now and return the timeout."""
+        last_seen, self._last_seen = self._last_seen, now
+        if last_seen is None:
+            return self.timeout
+        gap = (now - last_seen).total_seconds()
+        if self._gap is None:
+            self._gap = gap
+        else:
+            self._gap = 0.8 * self._gap + 0.2 * gap
+        self.timeout = min(
+            max(
+                timedelta(seconds=self._gap * STALE_DEVICE_MISSED_UPDATES),
+                STALE_DEVICE_MIN_TIMEOUT,
+            ),
+            STALE_DEVICE_MAX_TIMEOUT,
+        )
+        return self.timeout
+
+
+class ActronAirEnergyMeter:
+    """Integrate compressor power samples into energy used.
+
+    Each power reading is held until the next sample arrives, a left
+    Riemann sum, so repeated readings add nothing but a multiplication. A
+    reading is held for at most max_gap, so no energy is counted while the
+    system is not reporting. Integration starts with the first sample after
+    setup, and the energy counted before a restart is added back by restore.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the meter at zero."""
+        self.energy = 0.0
+        self._power: float | None = None
+        self._sampled: float | None = None
+        self._restored = False
+
+    def add_sample(self, power: float, now: float, max_gap: float) -> None:
+        """Record power in W measured at monotonic time now."""
+        if self._power is not None and self._sampled is not None:
+            elapsed = min(now - self._sampled, max_gap)
+            self.energy += self._power * elapsed / 3_600_000
+        self._power = power
+        self._sampled = now
+
+    def restore(self, energy: float) -> None:
+        """Add the energy in kWh counted before the last restart, once."""
+        if not self._restored:
+            self._restored = True
+            self.energy += energy
 
 
 class ActronAirSystemCoordinator(DataUpdateCoordinator[ActronAirStatus]):
-    """System coordinator for Actron Air integration."""
+    """System coordinator for Actron Air integration.
+
+    Polling is driven by the ActronAirAccountCoordinator, which fans fresh
+    statuses out through async_set_polled_status. Realtime pushes arrive
+    through handle_push_update; pushes that repeat the last snapshot are
+    dropped and bursts are coalesced into one listener update.
+
+    A system whose push stream goes quiet for longer than
+    PUSH_LIVENESS_TIMEOUT falls back to polling until pushes resume.
+
+    Values set by commands are held on top of incoming snapshots until the
+    cloud reports them, and rolled back if it has not done so within
+    OPTIMISTIC_CONFIRM_TIMEOUT.
+
+    While anything listens, a timer marks the system unavailable once no
+    status has arrived for stale_timeout, and listeners are only notified
+    when availability changes.
+
+    Listeners registered with a set of status parts as their context are
+    only notified when one of those parts changed, or availability did.
+
+    Zones and peripherals that appear are handed to the hardware listeners,
+    and the devices of those that disappear are removed from the device
+    registry, as are changes to the details of the system's device.
+    """
 
     def __init__(
         self,
         hass: HomeAssistant,
         entry: ActronAirConfigEntry,
         api: ActronAirAPI,
+        rate_limiter: ActronAirRateLimiter,
         system: ActronAirSystemInfo,
         push_updates_enabled: bool,
     ) -> None:
@@ -55,35 +388,77 @@ class ActronAirSystemCoordinator(DataUpdateCoordinator[ActronAirStatus]):
             hass,
             _LOGGER,
             name="Actron Air Status",
-            update_interval=None if push_updates_enabled else SCAN_INTERVAL,
+            update_interval=None,
             config_entry=entry,
         )
         self.system = system
         self.serial_number = system.serial
         self.api = api
+        self.rate_limiter = rate_limiter
         self.push_updates_enabled = push_updates_enabled
         self.status = self.api.state_manager.get_status(self.serial_number)
         if self.status is None:
             raise ValueError(f"Status not available for system {self.serial_number}")
         self.data = self.status
+        self.index = ActronAirStatusIndex(self.status)
+        self.hardware = ActronAirHardware.from_index(self.index)
+        # Hardware ever reported, which has entities until the next setup.
+        self._added_hardware = self.hardware
+        self._hardware_listeners: list[Callable[[ActronAirHardware], None]] = []
+        self._device_details = _device_details(self.status)
+        self._part_hashes = _status_part_hashes(self.status)
         self.last_seen = dt_util.utcnow()
+        self.last_polled = self.last_seen
+        self.last_push = self.last_seen
+        self.available = True
+        self._notified_available = True
+        self.stale_timeout = STALE_DEVICE_TIMEOUT
+        self._stale_tuner: ActronAirStaleTimeoutTuner | None = None
+        if entry.options.get(CONF_STALE_TIMEOUT_AUTO, DEFAULT_STALE_TIMEOUT_AUTO):
+            self._stale_tuner = ActronAirStaleTimeoutTuner()
+        self._unsub_stale: CALLBACK_TYPE | None = None
+        self.metrics = ActronAirMetrics()
+        self.energy_meter = ActronAirEnergyMeter()
+        self.push_fallbacks = 0
+        self.suppressed_state_writes = 0
+        self.skipped_listener_calls = 0
+        self.duplicate_pushes = 0
+        self.coalesced_pushes = 0
+        self.confirmed_commands = 0
+        self.coalesced_command_updates = 0
+        self._command_update_scheduled = False
+        self.rolled_back_commands = 0
+        self._expectations: dict[ActronAirFieldPath, ActronAirExpectation] = {}
+        self._unsub_expiry: CALLBACK_TYPE | None = None
+        self.poll_scheduler = ActronAirPollScheduler()
+        self.poll_scheduler.observe(self.status)
+        self._last_status_hash = _status_hash(self.status)
+        self._pending_push: ActronAirStatus | None = None
+        self.push_window: float = entry.options.get(
+            CONF_PUSH_COALESCE_WINDOW, DEFAULT_PUSH_COALESCE_WINDOW
+        )
+        self._push_window_tuner: ActronAirPushWindowTuner | None = None
+        if entry.options.get(CONF_PUSH_COALESCE_AUTO, DEFAULT_PUSH_COALESCE_AUTO):
+            self._push_window_tuner = ActronAirPushWindowTuner(self.push_window)
+        self._push_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=self.push_window,
+            immediate=False,
+            function=self._async_apply_pending_push,
+        )
 
     async def _async_update_data(self) -> ActronAirStatus:
-        """Fetch updates and merge incremental changes into the full state."""
+        """Fetch the latest status for this system only."""
+        started = time.monotonic()
         try:
-            await self.api.update_status(self.serial_number)
-        except ActronAirAuthError as err:
-            raise ConfigEntryAuthFailed(
-                translation_domain=DOMAIN,
-                translation_key="auth_error",
-            ) from err
-        except ActronAirAPIError as err:
-            raise UpdateFailed(
-                translation_domain=DOMAIN,
-                translation_key="update_error",
-                translation_placeholders={"error": repr(err)},
-            ) from err
-
+            latency = await async_fetch_status(
+                self.api, self.rate_limiter, self.serial_number
+            )
+        except UpdateFailed:
+            self.async_record_failed_update()
+            raise
+        self.metrics.record_poll(time.monotonic() - started, latency)
         status = self.api.state_manager.get_status(self.serial_number)
         if status is None:
             raise UpdateFailed(
@@ -91,18 +466,684 @@ class ActronAirSystemCoordinator(DataUpdateCoordinator[ActronAirStatus]):
                 translation_key="update_error",
                 translation_placeholders={"error": "Status not available"},
             )
-        self.status = status
-        self.last_seen = dt_util.utcnow()
+        self.last_polled = dt_util.utcnow()
+        self._async_process_status(status)
         return self.status
 
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """Listen for updates and watch for staleness while anyone listens."""
+        remove_listener = super().async_add_listener(update_callback, context)
+        self._async_schedule_stale_check()
+
+        @callback
+        def async_remove_listener() -> None:
+            remove_listener()
+            if not self._listeners:
+                self._async_cancel_stale_check()
+
+        return async_remove_listener
+
+    @callback
+    def async_add_hardware_listener(
+        self, hardware_callback: Callable[[ActronAirHardware], None]
+    ) -> CALLBACK_TYPE:
+        """Listen for zones and peripherals that appear."""
+        self._hardware_listeners.append(hardware_callback)
+
+        @callback
+        def async_remove_listener() -> None:
+            self._hardware_listeners.remove(hardware_callback)
+
+        return async_remove_listener
+
+    def device_identifiers(self) -> set[str]:
+        """Return the device identifiers of the system and its hardware."""
+        return {
+            self.serial_number,
+            *(
+                zone_device_identifier(self.serial_number, zone_id)
+                for zone_id in self.hardware.zones
+            ),
+            *self.hardware.peripherals,
+        }
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Index the current snapshot before notifying listeners."""
+        self.index = ActronAirStatusIndex(self.data)
+        hardware = ActronAirHardware.from_index(self.index)
+        if hardware != self.hardware:
+            self._async_update_hardware(hardware)
+        if (details := _device_details(self.data)) != self._device_details:
+            self._async_update_device(details)
+        started = time.monotonic()
+        part_hashes = _status_part_hashes(self.data)
+        changed: set[str] | None = None
+        if self.available == self._notified_available:
+            changed = {
+                part
+                for part in part_hashes.keys() | self._part_hashes.keys()
+                if part_hashes.get(part) != self._part_hashes.get(part)
+            }
+        self._part_hashes = part_hashes
+        self._notified_available = self.available
+        for update_callback, context in list(self._listeners.values()):
+            if changed is None or context is None or not changed.isdisjoint(context):
+                update_callback()
+            else:
+                self.skipped_listener_calls += 1
+        self.metrics.record_fan_out(time.monotonic() - started)
+
+    @callback
+    def _async_update_hardware(self, hardware: ActronAirHardware) -> None:
+        """Add entities for new hardware and note hardware gone missing.
+
+        Missing hardware keeps its devices and its entities go unavailable,
+        so a gap in the readings does not delete them. Devices still missing
+        are removed at the next setup, or by the user.
+        """
+        added = hardware - self._added_hardware
+        if removed := self.hardware - hardware:
+            _LOGGER.debug(
+                "Zones %s and peripherals %s no longer reported by %s",
+                sorted(removed.zones),
+                sorted(removed.peripherals),
+                self.serial_number,
+            )
+        self.hardware = hardware
+        self._added_hardware |= hardware
+        if added:
+            _LOGGER.debug(
+                "Adding zones %s and peripherals %s reported by %s",
+                sorted(added.zones),
+                sorted(added.peripherals),
+                self.serial_number,
+            )
+            for hardware_callback in list(self._hardware_listeners):
+                hardware_callback(added)
+
+    @callback
+    def _async_update_device(self, details: tuple[str, str, str]) -> None:
+        """Write changed system details to the device registry."""
+        self._device_details = details
+        device_registry = dr.async_get(self.hass)
+        if device := device_registry.async_get_device(
+            identifiers={(DOMAIN, self.serial_number)}
+        ):
+            name, model_id, sw_version = details
+            device_registry.async_update_device(
+                device.id, name=name, model_id=model_id, sw_version=sw_version
+            )
+
+    @callback
     def handle_push_update(self, status: ActronAirStatus) -> None:
-        """Handle a realtime update callback from the API client."""
+        """Handle a realtime update callback from the API client.
+
+        Every push carries the full merged status, so coalescing a burst only
+        needs to keep the latest one.
+        """
         if status.serial_number != self.serial_number:
             return
-        self.status = status
-        self.last_seen = dt_util.utcnow()
+        # Even a duplicate push proves the realtime channel is alive.
+        self.last_push = dt_util.utcnow()
+        received = time.monotonic()
+        self.metrics.record_push(received)
+        if not self.push_updates_enabled:
+            _LOGGER.info(
+                "Realtime updates resumed for system %s, stopping polling",
+                self.serial_number,
+            )
+            self.push_updates_enabled = True
+
+        status_hash = _status_hash(status)
+        if status_hash == self._last_status_hash:
+            self.duplicate_pushes += 1
+            return
+        self._last_status_hash = status_hash
+        # Sample before coalescing, so every reading in a burst is counted.
+        self._async_sample_energy(status, received)
+
+        if self._pending_push is not None:
+            self.coalesced_pushes += 1
+        self._pending_push = status
+
+        if self._push_window_tuner is not None:
+            self.push_window = self._push_window_tuner.observe(received)
+            self._push_debouncer.cooldown = self.push_window
+        if self.push_window <= 0:
+            self._async_apply_pending_push()
+            return
+        self._push_debouncer.async_schedule_call()
+
+    @callback
+    def _async_apply_pending_push(self) -> None:
+        """Apply the latest push received during the coalescing window."""
+        if (status := self._pending_push) is None:
+            return
+        self._async_process_status(status)
+        self._pending_push = None
+        self.async_set_updated_data(status)
+
+    def async_set_polled_status(self, status: ActronAirStatus) -> None:
+        """Apply a status fetched by the account coordinator."""
+        self.last_polled = dt_util.utcnow()
+        self._async_process_status(status)
         self.async_set_updated_data(status)
 
-    def is_device_stale(self) -> bool:
-        """Check if a device is stale (not seen for a while)."""
-        return (dt_util.utcnow() - self.last_seen) > STALE_DEVICE_TIMEOUT
+    def _async_process_status(self, status: ActronAirStatus) -> None:
+        """Record a new status snapshot from a poll or push."""
+        if self._expectations:
+            self._async_reconcile_settings(status)
+        self.status = status
+        self.async_set_last_seen(dt_util.utcnow())
+        self.poll_scheduler.observe(status)
+        if self._pending_push is None:
+            self._last_status_hash = _status_hash(status)
+            self._async_sample_energy(status, time.monotonic())
+
+    @callback
+    def _async_sample_energy(self, status: ActronAirStatus, now: float) -> None:
+        """Feed the compressor power of a status to the energy meter."""
+        self.energy_meter.add_sample(
+            status.compressor_power, now, self.stale_timeout.total_seconds()
+        )
+
+    @callback
+    def async_set_last_seen(self, last_seen: datetime) -> None:
+        """Record when the system last reported and update availability.
+
+        Callers notify listeners themselves, as a new status follows.
+        """
+        self.last_seen = last_seen
+        if self._stale_tuner is not None:
+            self.stale_timeout = self._stale_tuner.observe(last_seen)
+        self.available = dt_util.utcnow() - last_seen <= self.stale_timeout
+        self._async_schedule_stale_check()
+
+    @callback
+    def _async_schedule_stale_check(self) -> None:
+        """Check for staleness when the current status would expire."""
+        if self._unsub_stale is not None or not self.available or not self._listeners:
+            return
+        self._unsub_stale = async_track_point_in_utc_time(
+            self.hass, self._async_check_stale, self.last_seen + self.stale_timeout
+        )
+
+    @callback
+    def _async_cancel_stale_check(self) -> None:
+        """Cancel the staleness check."""
+        if self._unsub_stale is not None:
+            self._unsub_stale()
+            self._unsub_stale = None
+
+    @callback
+    def _async_check_stale(self, now: datetime) -> None:
+        """Mark the system unavailable unless a status arrived in time.
+
+        Statuses do not move the timer, so a newer one only reschedules it.
+        """
+        self._unsub_stale = None
+        if now - self.last_seen < self.stale_timeout:
+            self._async_schedule_stale_check()
+            return
+        _LOGGER.info(
+            "No status from system %s since %s, marking it unavailable",
+            self.serial_number,
+            self.last_seen,
+        )
+        self.available = False
+        self.async_update_listeners()
+
+    @callback
+    def async_record_failed_update(self) -> None:
+        """Count a failed poll and let the metric sensors show it."""
+        self.metrics.record_failed_update()
+        self.async_update_listeners()
+
+    @callback
+    def async_capture_settings(self) -> dict[ActronAirFieldPath, Any]:
+        """Return the command controlled values of the current snapshot."""
+        return _settings_values(self.data)
+
+    @callback
+    def async_expect_settings(
+        self, status: ActronAirStatus, before: dict[ActronAirFieldPath, Any]
+    ) -> None:
+        """Hold the values a command changed on status until confirmed.
+
+        The API client updates status locally once a command is accepted, so
+        comparing with the values captured before the command tells which
+        fields to hold.
+        """
+        deadline = dt_util.utcnow() + OPTIMISTIC_CONFIRM_TIMEOUT
+        for path, value in _settings_values(status).items():
+            if path not in before or value == before[path]:
+                continue
+            if (expectation := self._expectations.get(path)) is not None:
+                previous = expectation.previous
+            else:
+                previous = before[path]
+            self._expectations[path] = ActronAirExpectation(value, previous, deadline)
+            if status is not self.data:
+                # A snapshot replaced status while the command was in flight.
+                _set_settings_value(self.data, path, value)
+        self._async_schedule_expiry()
+
+    async def async_send_command(self, send: Callable[[], Awaitable[Any]]) -> None:
+        """Send a command through the rate limiter and show its values.
+
+        send makes the API call, after which the API client has set the
+        changed values on the current status. They are held there while the
+        cloud confirms them.
+        """
+        status = self.data
+        before = self.async_capture_settings()
+        started = time.monotonic()
+        try:
+            await self.rate_limiter.async_call(send, self.serial_number, command=True)
+        except ActronAirAPIError as err:
+            raise HomeAssistantError(
+                translation_domain=DOMAIN,
+                translation_key="api_error",
+                translation_placeholders={"error": str(err)},
+            ) from err
+        self.metrics.record_command(time.monotonic() - started)
+        self.async_expect_settings(status, before)
+        self.async_schedule_command_update()
+
+    @callback
+    def async_schedule_command_update(self) -> None:
+        """Notify listeners once for all commands that completed together.
+
+        Commands sent together are merged into one request by the API client
+        and finish in the same loop iteration, so a single update covers them.
+        """
+        if self._command_update_scheduled:
+            self.coalesced_command_updates += 1
+            return
+        self._command_update_scheduled = True
+        self.hass.loop.call_soon(self._async_command_update)
+
+    @callback
+    def _async_command_update(self) -> None:
+        """Publish the snapshot updated by the completed commands."""
+        self._command_update_scheduled = False
+        self.async_set_updated_data(self.data)
+
+    def _async_reconcile_settings(self, status: ActronAirStatus) -> None:
+        """Confirm, hold or drop expected values against a new snapshot."""
+        now = dt_util.utcnow()
+        values = _settings_values(status)
+        for path, expectation in list(self._expectations.items()):
+            value = values.get(path)
+            if value == expectation.value:
+                del self._expectations[path]
+                self.confirmed_commands += 1
+            elif path not in values or value != expectation.previous:
+                # Changed elsewhere, for example on the wall controller.
+                del self._expectations[path]
+            elif expectation.deadline <= now:
+                del self._expectations[path]
+                self._async_log_rollback(path, expectation)
+            else:
+                _set_settings_value(status, path, expectation.value)
+        self._async_schedule_expiry()
+
+    async def _async_expire_settings(self, now: datetime) -> None:
+        """Roll back expected values that were never confirmed."""
+        self._unsub_expiry = None
+        expired = {
+            path: expectation
+            for path, expectation in self._expectations.items()
+            if expectation.deadline <= now
+        }
+        for path, expectation in expired.items():
+            del self._expectations[path]
+            self._async_log_rollback(path, expectation)
+            _set_settings_value(self.data, path, expectation.previous)
+        self._async_schedule_expiry()
+        if expired:
+            self.async_update_listeners()
+            await self.async_request_refresh()
+
+    def _async_log_rollback(
+        self, path: ActronAirFieldPath, expectation: ActronAirExpectation
+    ) -> None:
+        """Count and log a command the cloud did not confirm."""
+        self.rolled_back_commands += 1
+        _LOGGER.warning(
+            "System %s did not confirm %s=%s within %s, reverting to %s",
+            self.serial_number,
+            ".".join(map(str, path)),
+            expectation.value,
+            OPTIMISTIC_CONFIRM_TIMEOUT,
+            expectation.previous,
+        )
+
+    def _async_schedule_expiry(self) -> None:
+        """Schedule the rollback check for the earliest pending deadline."""
+        if self._unsub_expiry is not None:
+            self._unsub_expiry()
+            self._unsub_expiry = None
+        if self._expectations:
+            self._unsub_expiry = async_track_point_in_utc_time(
+                self.hass,
+                self._async_expire_settings,
+                min(e.deadline for e in self._expectations.values()),
+            )
+
+    @property
+    def pending_commands(self) -> int:
+        """Return the number of values waiting for cloud confirmation."""
+        return len(self._expectations)
+
+    async def async_shutdown(self) -> None:
+        """Cancel pending pushes and shut down the coordinator."""
+        await super().async_shutdown()
+        self._push_debouncer.async_shutdown()
+        self._async_cancel_stale_check()
+        if self._unsub_expiry is not None:
+            self._unsub_expiry()
+            self._unsub_expiry = None
+
+    @callback
+    def async_check_push_liveness(self, now: datetime) -> bool:
+        """Fall back to polling if pushes stopped arriving.
+
+        Returns True if the system switched to polling.
+        """
+        if (
+            not self.push_updates_enabled
+            or now - self.last_push < PUSH_LIVENESS_TIMEOUT
+        ):
+            return False
+        _LOGGER.info(
+            "No realtime updates from system %s since %s, falling back to polling",
+            self.serial_number,
+            self.last_push,
+        )
+        self.push_updates_enabled = False
+        self.push_fallbacks += 1
+        # Make the system due so the next account tick fetches it.
+        self.last_polled = now - self.poll_scheduler.interval
+        return True
+
+    def is_poll_due(self, now: datetime) -> bool:
+        """Return True if this system should be included in the next poll."""
+        if self.push_updates_enabled:
+            return False
+        return now - self.last_polled >= self.poll_scheduler.interval - POLL_TOLERANCE
+
+
+class ActronAirAccountCoordinator(DataUpdateCoordinator[dict[str, ActronAirStatus]]):
+    """Account coordinator that polls all systems of a config entry together.
+
+    Each tick fetches the systems whose adaptive interval has elapsed and fans
+    the results out to their system coordinators. The tick rate follows the
+    shortest interval wanted by any system that is not receiving pushes, so
+    an account can mix pushed and polled systems.
+
+    After a warm start live is False until live statuses have been fetched.
+    Until then nothing is polled, so the cached statuses are not mistaken
+    for fresh ones.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ActronAirConfigEntry,
+        api: ActronAirAPI,
+        rate_limiter: ActronAirRateLimiter,
+        system_coordinators: dict[str, ActronAirSystemCoordinator],
+        live: bool = True,
+    ) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name="Actron Air Account",
+            update_interval=None,
+            config_entry=entry,
+        )
+        self.api = api
+        self.rate_limiter = rate_limiter
+        self.system_coordinators = system_coordinators
+        self.live = live
+        self.data = {
+            serial: coordinator.data
+            for serial, coordinator in system_coordinators.items()
+        }
+        self.async_update_schedule()
+
+    async def _async_update_data(self) -> dict[str, ActronAirStatus]:
+        """Fetch the systems that are due and fan the results out."""
+        if not self.live:
+            return self.data
+        now = dt_util.utcnow()
+        due = [
+            coordinator
+            for coordinator in self.system_coordinators.values()
+            if coordinator.is_poll_due(now)
+        ]
+        fetched = due
+        errors: list[BaseException] = []
+        if due and len(due) == len(self.system_coordinators):
+            await self._async_fetch(due, None)
+        elif due:
+            # Each system waits on its own rate limiter bucket, so the systems
+            # due are fetched together rather than one round trip at a time.
+            results = await asyncio.gather(
+                *(
+                    self._async_fetch([coordinator], coordinator.serial_number)
+                    for coordinator in due
+                ),
+                return_exceptions=True,
+            )
+            errors = [result for result in results if result is not None]
+            fetched = [
+                coordinator
+                for coordinator, result in zip(due, results, strict=True)
+                if result is None
+            ]
+
+        data = dict(self.data or {})
+        for coordinator in fetched:
+            status = self.api.state_manager.get_status(coordinator.serial_number)
+            if status is None:
+                continue
+            data[coordinator.serial_number] = status
+            coordinator.async_set_polled_status(status)
+
+        self.async_update_schedule()
+        if errors:
+            raise errors[0]
+        return data
+
+    async def _async_fetch(
+        self,
+        coordinators: list[ActronAirSystemCoordinator],
+        serial_number: str | None,
+    ) -> None:
+        """Fetch statuses and record the poll in the metrics of coordinators."""
+        started = time.monotonic()
+        try:
+            latency = await async_fetch_status(
+                self.api, self.rate_limiter, serial_number
+            )
+        except UpdateFailed:
+            for coordinator in coordinators:
+                coordinator.async_record_failed_update()
+            raise
+        duration = time.monotonic() - started
+        for coordinator in coordinators:
+            coordinator.metrics.record_poll(duration, latency)
+
+    def async_update_schedule(self) -> None:
+        """Set the tick rate from the systems that currently need polling."""
+        interval = min(
+            (
+                coordinator.poll_scheduler.interval
+                for coordinator in self.system_coordinators.values()
+                if self.live and not coordinator.push_updates_enabled
+            ),
+            default=None,
+        )
+        if interval == self.update_interval:
+            return
+        _LOGGER.debug("Polling Actron Air account every %s", interval)
+        self.update_interval = interval
+
+    async def async_check_push_liveness(self, now: datetime) -> None:
+        """Poll systems whose realtime updates have gone quiet."""
+        fallbacks = [
+            coordinator
+            for coordinator in self.system_coordinators.values()
+            if coordinator.async_check_push_liveness(now)
+        ]
+        # Also drops the polling tick once every system is pushing again.
+        self.async_update_schedule()
+        if fallbacks:
+            await self.async_request_refresh()
+
+
+def _settings_values(status: ActronAirStatus) -> dict[ActronAirFieldPath, Any]:
+    """Return the values of status that commands can change."""
+    settings = status.user_aircon_settings
+    values: dict[ActronAirFieldPath, Any] = {
+        ("user_aircon_settings", name): deepcopy(getattr(settings, name))
+        for name in OPTIMISTIC_SETTINGS_FIELDS
+    }
+    for zone_id, zone in enumerate(status.remote_zone_info):
+        for name in OPTIMISTIC_ZONE_FIELDS:
+            values[("remote_zone_info", zone_id, name)] = getattr(zone, name)
+    return values
+
+
+def _set_settings_value(
+    status: ActronAirStatus, path: ActronAirFieldPath, value: Any
+) -> None:
+    """Write a value returned by _settings_values back onto status."""
+    if path[0] == "user_aircon_settings":
+        setattr(status.user_aircon_settings, str(path[1]), deepcopy(value))
+        return
+    zone_id, name = path[1:]
+    if isinstance(zone_id, int) and zone_id < len(status.remote_zone_info):
+        setattr(status.remote_zone_info[zone_id], str(name), value)
+
+
+def zone_status_part(zone_id: int) -> str:
+    """Return the status part of a zone."""
+    return f"zones[{zone_id}]"
+
+
+def peripheral_status_part(serial_number: str) -> str:
+    """Return the status part of a peripheral."""
+    return f"peripherals[{serial_number}]"
+
+
+def _status_part_hashes(status: ActronAirStatus) -> dict[str, int]:
+    """Return a hash of each part of a status that entities listen to.
+
+    Parts are hashed from the raw state the library already holds rather than
+    from model dumps. Settings and zones also hash the model fields commands
+    change, which hold the values of unconfirmed commands.
+    """
+    raw_state = status.last_known_state
+    system_state = {
+        section: value
+        for section, value in raw_state.items()
+        if section not in ROUTED_STATE_SECTIONS
+    }
+    raw_peripherals: Any = None
+    if isinstance(aircon_system := system_state.get("AirconSystem"), dict):
+        raw_peripherals = aircon_system.get("Peripherals")
+        system_state["AirconSystem"] = {
+            key: value for key, value in aircon_system.items() if key != "Peripherals"
+        }
+    settings = status.user_aircon_settings
+    hashes = {
+        STATUS_PART_SETTINGS: hash(
+            json_bytes(
+                [
+                    raw_state.get("UserAirconSettings"),
+                    [getattr(settings, name) for name in OPTIMISTIC_SETTINGS_FIELDS],
+                ]
+            )
+        ),
+        STATUS_PART_LIVE: hash(json_bytes(raw_state.get("LiveAircon"))),
+        STATUS_PART_SYSTEM: hash((status.is_online, json_bytes(system_state))),
+    }
+    raw_zones = raw_state.get("RemoteZoneInfo")
+    for zone in status.remote_zone_info:
+        raw_zone = raw_zones[zone.zone_id] if isinstance(raw_zones, list) else None
+        hashes[zone_status_part(zone.zone_id)] = hash(
+            (
+                json_bytes(raw_zone),
+                *(getattr(zone, name) for name in OPTIMISTIC_ZONE_FIELDS),
+            )
+        )
+    if isinstance(raw_peripherals, list):
+        for raw_peripheral in raw_peripherals:
+            if isinstance(raw_peripheral, dict) and (
+                serial_number := raw_peripheral.get("SerialNumber")
+            ):
+                hashes[peripheral_status_part(serial_number)] = hash(
+                    json_bytes(raw_peripheral)
+                )
+    return hashes
+
+
+def zone_device_identifier(serial_number: str, zone_id: int) -> str:
+    """Return the device identifier of a zone."""
+    return f"{serial_number}_zone_{zone_id}"
+
+
+def _device_details(status: ActronAirStatus) -> tuple[str, str, str]:
+    """Return the name, model and firmware shown on the system's device."""
+    ac_system = status.ac_system
+    return (
+        ac_system.system_name,
+        ac_system.master_wc_model,
+        ac_system.master_wc_firmware_version,
+    )
+
+
+def _status_hash(status: ActronAirStatus) -> int:
+    """Return a hash of the raw content of a status snapshot."""
+    return hash((status.is_online, json_bytes(status.last_known_state)))
+
+
+async def async_fetch_status(
+    api: ActronAirAPI,
+    rate_limiter: ActronAirRateLimiter,
+    serial_number: str | None = None,
+) -> float:
+    """Refresh one system, or all systems, translating API errors.
+
+    Returns the seconds the cloud took to answer, leaving out the time spent
+    waiting for the rate limiter.
+    """
+    sent = 0.0
+
+    async def update_status() -> None:
+        nonlocal sent
+        sent = time.monotonic()
+        await api.update_status(serial_number)
+
+    try:
+        await rate_limiter.async_call(update_status, serial_number)
+    except ActronAirAuthError as err:
+        raise ConfigEntryAuthFailed(
+            translation_domain=DOMAIN,
+            translation_key="auth_error",
+        ) from err
+    except ActronAirAPIError as err:
+        raise UpdateFailed(
+            translation_domain=DOMAIN,
+            translation_key="update_error",
+            translation_placeholders={"error": repr(err)},
+        ) from err
+    return time.monotonic() - sent
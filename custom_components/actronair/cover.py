@@ -11,7 +11,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from .coordinator import ActronAirConfigEntry, ActronAirSystemCoordinator
-from .entity import ActronAirZoneEntity
+from .entity import ActronAirZoneEntity, async_add_hardware_entities
 
 PARALLEL_UPDATES = 0
 
@@ -22,12 +22,12 @@ async def async_setup_entry(
     async_add_entities: AddConfigEntryEntitiesCallback,
 ) -> None:
     """Set up Actron Air cover entities."""
-    system_coordinators = entry.runtime_data.system_coordinators
-    async_add_entities(
-        ActronAirZoneDamper(coordinator, zone)
-        for coordinator in system_coordinators.values()
-        for zone in coordinator.data.remote_zone_info
-        if zone.exists
+    async_add_hardware_entities(
+        entry,
+        async_add_entities,
+        zone_entities=lambda coordinator, zone: [
+            ActronAirZoneDamper(coordinator, zone)
+        ],
     )
 
 
@@ -50,7 +50,9 @@ class ActronAirZoneDamper(ActronAirZoneEntity, CoverEntity):
     @property
     def current_cover_position(self) -> int | None:
         """Return the current position of the damper."""
-        return self._zone.zone_position
+        if (zone := self._zone) is None:
+            return None
+        return zone.zone_position
 
     @property
     def is_closed(self) -> bool:
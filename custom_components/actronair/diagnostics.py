@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
 from typing import Any
 
+from actron_neo_api import ActronAirStatus
+from actron_neo_api.models.system import ActronAirSystemInfo
+
 from homeassistant.components.diagnostics import async_redact_data
 from homeassistant.const import CONF_API_TOKEN
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 
 from .coordinator import ActronAirConfigEntry
 
@@ -17,19 +22,71 @@ async def async_get_config_entry_diagnostics(
     hass: HomeAssistant,
     entry: ActronAirConfigEntry,
 ) -> dict[str, Any]:
-    """Return diagnostics for a config entry."""
+    """Return diagnostics for a config entry.
+
+    Systems and statuses are serialized on the event loop, as pushes and
+    commands change them there, yielding between systems so large accounts
+    do not hold up the loop.
+    """
+    started = time.monotonic()
     coordinators: dict[int, Any] = {}
+    performance: dict[int, Any] = {}
     for idx, coordinator in enumerate(entry.runtime_data.system_coordinators.values()):
+        if idx:
+            await asyncio.sleep(0)
+        serialize_started = time.monotonic()
+        serialized = _serialize_system(coordinator.system, coordinator.data)
+        now = time.monotonic()
         coordinators[idx] = {
-            "system": async_redact_data(
-                coordinator.system.model_dump(mode="json"), TO_REDACT
-            ),
-            "status": async_redact_data(
-                coordinator.data.model_dump(mode="json", exclude={"last_known_state"}),
-                TO_REDACT,
+            **serialized,
+            "available": coordinator.available,
+            "stale_timeout": coordinator.stale_timeout.total_seconds(),
+            "push_updates_enabled": coordinator.push_updates_enabled,
+            "last_push": coordinator.last_push.isoformat(),
+            "push_fallbacks": coordinator.push_fallbacks,
+            "pending_commands": coordinator.pending_commands,
+            "confirmed_commands": coordinator.confirmed_commands,
+            "rolled_back_commands": coordinator.rolled_back_commands,
+            "coalesced_command_updates": coordinator.coalesced_command_updates,
+            "rate_limit_tokens": entry.runtime_data.rate_limiter.system_tokens(
+                coordinator.serial_number
             ),
+            "suppressed_state_writes": coordinator.suppressed_state_writes,
+            "skipped_listener_calls": coordinator.skipped_listener_calls,
+            "duplicate_pushes": coordinator.duplicate_pushes,
+            "coalesced_pushes": coordinator.coalesced_pushes,
+            "push_window": coordinator.push_window,
+        }
+        performance[idx] = {
+            **coordinator.metrics.as_dict(now),
+            "serialization_time": round(now - serialize_started, 3),
         }
     return {
         "entry_data": async_redact_data(entry.data, TO_REDACT),
         "coordinators": coordinators,
+        "rate_limiter": entry.runtime_data.rate_limiter.as_dict(),
+        "warm_start": entry.runtime_data.warm_start,
+        "setup_timings": {
+            phase: round(duration, 3)
+            for phase, duration in entry.runtime_data.setup_timings.items()
+        },
+        "performance": {
+            "coordinators": performance,
+            "connections": entry.runtime_data.connection_stats.as_dict(),
+            "serialization_time": round(time.monotonic() - started, 3),
+        },
+    }
+
+
+@callback
+def _serialize_system(
+    system: ActronAirSystemInfo, status: ActronAirStatus
+) -> dict[str, Any]:
+    """Return the redacted system and status of a coordinator."""
+    return {
+        "system": async_redact_data(system.model_dump(mode="json"), TO_REDACT),
+        "status": async_redact_data(
+            status.model_dump(mode="json", exclude={"last_known_state"}),
+            TO_REDACT,
+        ),
     }
@@ -1,18 +1,35 @@
 """Base entity classes for Actron Air integration."""
 
-from collections.abc import Callable, Coroutine
-from functools import wraps
+from collections.abc import Callable, Coroutine, Iterable
+from functools import partial, wraps
 from typing import Any, Concatenate
 
-from actron_neo_api import ActronAirAPIError, ActronAirZone
+from actron_neo_api import ActronAirZone
 from actron_neo_api.models.zone import ActronAirPeripheral
 
-from homeassistant.exceptions import HomeAssistantError
+from homeassistant.core import callback
+from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
-from .coordinator import ActronAirSystemCoordinator
+from .coordinator import (
+    STATUS_PART_LIVE,
+    STATUS_PART_SETTINGS,
+    STATUS_PART_SYSTEM,
+    ActronAirConfigEntry,
+    ActronAirHardware,
+    ActronAirSystemCoordinator,
+    peripheral_status_part,
+    zone_device_identifier,
+    zone_status_part,
+)
+
+SYSTEM_STATUS_PARTS = frozenset(
+    {STATUS_PART_SETTINGS, STATUS_PART_LIVE, STATUS_PART_SYSTEM}
+)
 
 
 def actron_air_command[_EntityT: ActronAirEntity, **_P](
@@ -20,40 +37,108 @@ def actron_air_command[_EntityT: ActronAirEntity, **_P](
 ) -> Callable[Concatenate[_EntityT, _P], Coroutine[Any, Any, None]]:
     """Decorator for Actron Air API calls.
 
-    Handles ActronAirAPIError exceptions, and requests a coordinator update
-    to update the status of the devices as soon as possible.
+    Sends the command through the coordinator, which rate limits it, handles
+    ActronAirAPIError exceptions, and shows the values set by the
+    command right away while it waits for the cloud to confirm them.
     """
 
     @wraps(func)
     async def wrapper(self: _EntityT, /, *args: _P.args, **kwargs: _P.kwargs) -> None:
         """Wrap API calls with exception handling."""
-        try:
-            await func(self, *args, **kwargs)
-        except ActronAirAPIError as err:
-            raise HomeAssistantError(
-                translation_domain=DOMAIN,
-                translation_key="api_error",
-                translation_placeholders={"error": str(err)},
-            ) from err
-        self.coordinator.async_set_updated_data(self.coordinator.data)
+        await self.coordinator.async_send_command(partial(func, self, *args, **kwargs))
 
     return wrapper
 
 
+@callback
+def async_add_hardware_entities(
+    entry: ActronAirConfigEntry,
+    async_add_entities: AddConfigEntryEntitiesCallback,
+    *,
+    zone_entities: Callable[
+        [ActronAirSystemCoordinator, ActronAirZone], Iterable[Entity]
+    ]
+    | None = None,
+    peripheral_entities: Callable[
+        [ActronAirSystemCoordinator, ActronAirPeripheral], Iterable[Entity]
+    ]
+    | None = None,
+) -> None:
+    """Add the entities of the zones and peripherals of every system.
+
+    Entities are added for the hardware reported now, and later for each
+    zone or peripheral that appears, without reloading the entry.
+    """
+    for coordinator in entry.runtime_data.system_coordinators.values():
+
+        @callback
+        def async_add_hardware(
+            hardware: ActronAirHardware,
+            coordinator: ActronAirSystemCoordinator = coordinator,
+        ) -> None:
+            entities: list[Entity] = []
+            if zone_entities is not None:
+                for zone_id in sorted(hardware.zones):
+                    zone = coordinator.index.zones[zone_id]
+                    entities.extend(zone_entities(coordinator, zone))
+            if peripheral_entities is not None:
+                for serial_number in sorted(hardware.peripherals):
+                    peripheral = coordinator.index.peripherals[serial_number]
+                    entities.extend(peripheral_entities(coordinator, peripheral))
+            if entities:
+                async_add_entities(entities)
+
+        async_add_hardware(coordinator.hardware)
+        entry.async_on_unload(
+            coordinator.async_add_hardware_listener(async_add_hardware)
+        )
+
+
 class ActronAirEntity(CoordinatorEntity[ActronAirSystemCoordinator]):
-    """Base class for Actron Air entities."""
+    """Base class for Actron Air entities.
+
+    The coordinator context is the set of status parts the entity shows, so
+    it is only updated when one of them changes. None listens to everything.
+    """
 
     _attr_has_entity_name = True
 
-    def __init__(self, coordinator: ActronAirSystemCoordinator) -> None:
+    def __init__(
+        self,
+        coordinator: ActronAirSystemCoordinator,
+        status_parts: frozenset[str] | None = None,
+    ) -> None:
         """Initialize the entity."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, status_parts)
         self._serial_number = coordinator.serial_number
+        self._last_rendered_state: tuple[Any, ...] | None = None
 
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        return not self.coordinator.is_device_stale()
+        return self.coordinator.available
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only if the rendered state or attributes changed."""
+        rendered_state = self._render_state()
+        if rendered_state == self._last_rendered_state:
+            self.coordinator.suppressed_state_writes += 1
+            return
+        self._last_rendered_state = rendered_state
+        super()._handle_coordinator_update()
+
+    def _render_state(self) -> tuple[Any, ...]:
+        """Return the values that would be written to the state machine."""
+        if not self.available:
+            return (False,)
+        return (
+            True,
+            self.state,
+            self.capability_attributes,
+            self.state_attributes,
+            self.extra_state_attributes,
+        )
 
 
 class ActronAirAcEntity(ActronAirEntity):
@@ -61,7 +146,7 @@ class ActronAirAcEntity(ActronAirEntity):
 
     def __init__(self, coordinator: ActronAirSystemCoordinator) -> None:
         """Initialize the entity."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, SYSTEM_STATUS_PARTS)
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, self._serial_number)},
             name=coordinator.data.ac_system.system_name,
@@ -81,9 +166,22 @@ class ActronAirZoneEntity(ActronAirEntity):
         zone: ActronAirZone,
     ) -> None:
         """Initialize the entity."""
-        super().__init__(coordinator)
+        # Zones follow the system's mode, setpoint and limits.
+        super().__init__(
+            coordinator,
+            frozenset(
+                {
+                    zone_status_part(zone.zone_id),
+                    STATUS_PART_SETTINGS,
+                    STATUS_PART_SYSTEM,
+                }
+            ),
+        )
         self._zone_id: int = zone.zone_id
-        self._zone_identifier = f"{self._serial_number}_zone_{zone.zone_id}"
+        self._zone_title = zone.title
+        self._zone_identifier = zone_device_identifier(
+            self._serial_number, zone.zone_id
+        )
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, self._zone_identifier)},
             name=zone.title,
@@ -94,9 +192,24 @@ class ActronAirZoneEntity(ActronAirEntity):
         )
 
     @property
-    def _zone(self) -> ActronAirZone:
+    def available(self) -> bool:
+        """Return True if the system is available and still reports the zone."""
+        return super().available and (zone := self._zone) is not None and zone.exists
+
+    @property
+    def _zone(self) -> ActronAirZone | None:
         """Get the current zone data from the coordinator."""
-        return self.coordinator.data.zones[self._zone_id]
+        return self.coordinator.index.zones.get(self._zone_id)
+
+    def _command_zone(self) -> ActronAirZone:
+        """Return the zone to send a command to, if the system still reports it."""
+        if (zone := self._zone) is None:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="zone_not_found",
+                translation_placeholders={"zone": self._zone_title},
+            )
+        return zone
 
 
 class ActronAirPeripheralEntity(ActronAirEntity):
@@ -108,7 +221,10 @@ class ActronAirPeripheralEntity(ActronAirEntity):
         peripheral: ActronAirPeripheral,
     ) -> None:
         """Initialize the entity."""
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator,
+            frozenset({peripheral_status_part(peripheral.serial_number)}),
+        )
         self._peripheral_serial = peripheral.serial_number
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, peripheral.serial_number)},
@@ -119,10 +235,12 @@ class ActronAirPeripheralEntity(ActronAirEntity):
             via_device=(DOMAIN, self._serial_number),
         )
 
+    @property
+    def available(self) -> bool:
+        """Return True if the system is available and still reports the sensor."""
+        return super().available and self._peripheral is not None
+
     @property
     def _peripheral(self) -> ActronAirPeripheral | None:
         """Get the current peripheral data from the coordinator."""
-        for peripheral in self.coordinator.data.peripherals:
-            if peripheral.serial_number == self._peripheral_serial:
-                return peripheral
-        return None
+        return self.coordinator.index.peripherals.get(self._peripheral_serial)
@@ -0,0 +1,189 @@
+"""Performance metrics for the Actron Air integration."""
+
+from __future__ import annotations
+
+from collections import deque
+import math
+from types import SimpleNamespace
+from typing import Any
+
+from aiohttp import (
+    ClientSession,
+    TraceConfig,
+    TraceConnectionCreateEndParams,
+    TraceConnectionReuseconnParams,
+    TraceRequestEndParams,
+    TraceRequestExceptionParams,
+)
+
+POLL_SAMPLES = 100
+COMMAND_SAMPLES = 20
+FAN_OUT_SAMPLES = 100
+PUSH_RATE_WINDOW = 300.0
+
+
+class ActronAirMetrics:
+    """Timings and rates recorded by a system coordinator.
+
+    Samples are kept in bounded deques and only summarized when read, so
+    recording them costs next to nothing on the update path.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty metrics."""
+        self.poll_durations: deque[float] = deque(maxlen=POLL_SAMPLES)
+        self.command_latencies: deque[float] = deque(maxlen=COMMAND_SAMPLES)
+        self.fan_out_durations: deque[float] = deque(maxlen=FAN_OUT_SAMPLES)
+        self.last_fetch_latency: float | None = None
+        self.failed_updates = 0
+        self._push_times: deque[float] = deque()
+
+    def record_poll(self, duration: float, latency: float) -> None:
+        """Record a poll that took duration seconds, latency of it in the cloud."""
+        self.poll_durations.append(duration)
+        self.last_fetch_latency = latency
+
+    def record_failed_update(self) -> None:
+        """Record a poll that failed."""
+        self.failed_updates += 1
+
+    def record_command(self, latency: float) -> None:
+        """Record a command the cloud accepted after latency seconds."""
+        self.command_latencies.append(latency)
+
+    def record_fan_out(self, duration: float) -> None:
+        """Record listeners taking duration seconds to handle an update."""
+        self.fan_out_durations.append(duration)
+
+    def record_push(self, now: float) -> None:
+        """Record a push received at monotonic time now."""
+        self._push_times.append(now)
+        self._trim_pushes(now)
+
+    def push_rate(self, now: float) -> float:
+        """Return the pushes per minute over the last PUSH_RATE_WINDOW."""
+        self._trim_pushes(now)
+        return len(self._push_times) * 60 / PUSH_RATE_WINDOW
+
+    def poll_duration(self, percentile: float) -> float | None:
+        """Return a percentile of the recent poll durations."""
+        return _percentile(self.poll_durations, percentile)
+
+    def command_latency(self, percentile: float) -> float | None:
+        """Return a percentile of the recent command latencies."""
+        return _percentile(self.command_latencies, percentile)
+
+    def fan_out_duration(self, percentile: float) -> float | None:
+        """Return a percentile of the recent listener fan-out durations."""
+        return _percentile(self.fan_out_durations, percentile)
+
+    def as_dict(self, now: float) -> dict[str, Any]:
+        """Return the metrics for diagnostics."""
+        return {
+            "poll_duration_p50": _round(self.poll_duration(50)),
+            "poll_duration_p95": _round(self.poll_duration(95)),
+            "last_fetch_latency": _round(self.last_fetch_latency),
+            "command_latency_p50": _round(self.command_latency(50)),
+            "fan_out_duration_p50": _round(self.fan_out_duration(50)),
+            "fan_out_duration_p95": _round(self.fan_out_duration(95)),
+            "failed_updates": self.failed_updates,
+            "push_rate": round(self.push_rate(now), 2),
+        }
+
+    def _trim_pushes(self, now: float) -> None:
+        """Forget pushes older than PUSH_RATE_WINDOW."""
+        while self._push_times and self._push_times[0] <= now - PUSH_RATE_WINDOW:
+            self._push_times.popleft()
+
+
+class ActronAirConnectionStats:
+    """Count how often requests of a config entry reuse a pooled connection.
+
+    The counters are updated from aiohttp trace hooks, so they cover every
+    request made through the session, including token refreshes.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty counters."""
+        self.requests = 0
+        self.failed_requests = 0
+        self.new_connections = 0
+        self.reused_connections = 0
+
+    def trace_config(self) -> TraceConfig:
+        """Return a trace config that updates the counters."""
+        trace_config = TraceConfig()
+        trace_config.on_request_end.append(self._async_on_request_end)
+        trace_config.on_request_exception.append(self._async_on_request_exception)
+        trace_config.on_connection_create_end.append(self._async_on_connection_create)
+        trace_config.on_connection_reuseconn.append(self._async_on_connection_reuse)
+        return trace_config
+
+    async def _async_on_request_end(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceRequestEndParams,
+    ) -> None:
+        """Count a completed request."""
+        self.requests += 1
+
+    async def _async_on_request_exception(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceRequestExceptionParams,
+    ) -> None:
+        """Count a request that failed before a response arrived."""
+        self.failed_requests += 1
+
+    async def _async_on_connection_create(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceConnectionCreateEndParams,
+    ) -> None:
+        """Count a request that had to open a connection."""
+        self.new_connections += 1
+
+    async def _async_on_connection_reuse(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceConnectionReuseconnParams,
+    ) -> None:
+        """Count a request sent over a kept-alive connection."""
+        self.reused_connections += 1
+
+    @property
+    def reuse_ratio(self) -> float | None:
+        """Return the share of connections that were reused."""
+        if not (connections := self.new_connections + self.reused_connections):
+            return None
+        return self.reused_connections / connections
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters for diagnostics."""
+        return {
+            "requests": self.requests,
+            "failed_requests": self.failed_requests,
+            "new_connections": self.new_connections,
+            "reused_connections": self.reused_connections,
+            "reuse_ratio": None
+            if (ratio := self.reuse_ratio) is None
+            else round(ratio, 3),
+        }
+
+
+def _percentile(samples: deque[float], percentile: float) -> float | None:
+    """Return the nearest-rank percentile of samples."""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    rank = math.ceil(percentile / 100 * len(ordered))
+    return ordered[max(rank, 1) - 1]
+
+
+def _round(value: float | None) -> float | None:
+    """Round a duration in seconds for display."""
+    return None if value is None else round(value, 3)
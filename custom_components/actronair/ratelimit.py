@@ -0,0 +1,197 @@
+"""Rate limiting for Actron Air cloud requests."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict
+from collections.abc import Awaitable, Callable, Iterable
+import re
+import time
+from typing import Any
+
+from actron_neo_api import ActronAirAPIError
+
+from .const import _LOGGER
+
+ACCOUNT_RATE = 0.5
+ACCOUNT_BURST = 10
+SYSTEM_RATE = 0.2
+SYSTEM_BURST = 5
+MIN_RATE_FACTOR = 0.1
+RATE_RECOVERY_STEP = 0.05
+THROTTLE_PAUSE = 10.0
+MAX_THROTTLE_RETRIES = 3
+RETRY_AFTER_PATTERN = re.compile(r"retry.?after\D{0,5}(\d+(?:\.\d+)?)", re.IGNORECASE)
+
+
+class ActronAirTokenBucket:
+    """Token bucket refilled continuously at rate tokens per second."""
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        """Initialize a full bucket."""
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+
+    def tokens(self, now: float, factor: float = 1.0) -> float:
+        """Return the tokens available at monotonic time now."""
+        refill = (now - self._updated) * self.rate * factor
+        return min(self.capacity, self._tokens + refill)
+
+    def delay(self, now: float, cost: float, factor: float = 1.0) -> float:
+        """Return the seconds to wait until cost tokens are available.
+
+        Costs above the capacity only wait for a full bucket and leave it in
+        debt, so later calls pay for them.
+        """
+        missing = min(cost, self.capacity) - self.tokens(now, factor)
+        return max(0.0, missing / (self.rate * factor))
+
+    def take(self, now: float, cost: float, factor: float = 1.0) -> None:
+        """Remove cost tokens from the bucket."""
+        self._tokens = self.tokens(now, factor) - cost
+        self._updated = now
+
+
+class ActronAirRateLimiter:
+    """Shared limiter for the cloud requests of a config entry.
+
+    Every request takes a token from the account bucket and from the bucket
+    of each system it touches, and waits in line when tokens run out. A
+    throttling response pauses all requests for the retry hint, halves the
+    refill rate and retries the request; successful requests restore the
+    rate gradually.
+
+    Commands sent to a system within command_window of an admitted command
+    share its token, as the API client merges them into a single request.
+
+    Requests for the same system wait in line behind each other; requests
+    for other systems are not held up by a system whose bucket is empty.
+    """
+
+    def __init__(self, serial_numbers: Iterable[str], command_window: float) -> None:
+        """Initialize the limiter with full buckets."""
+        self.account_bucket = ActronAirTokenBucket(ACCOUNT_RATE, ACCOUNT_BURST)
+        self.system_buckets = {
+            serial_number: ActronAirTokenBucket(SYSTEM_RATE, SYSTEM_BURST)
+            for serial_number in serial_numbers
+        }
+        self.command_window = command_window
+        self.rate_factor = 1.0
+        self.queue_depth = 0
+        self.throttled_responses = 0
+        self._resume_at = 0.0
+        self._command_grants: dict[str, float] = {}
+        self._locks: defaultdict[str | None, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+    async def async_call[T](
+        self,
+        func: Callable[[], Awaitable[T]],
+        serial_number: str | None = None,
+        *,
+        command: bool = False,
+    ) -> T:
+        """Run func for one system, or all systems, once tokens are available."""
+        retries = 0
+        while True:
+            await self._async_acquire(serial_number, command)
+            try:
+                result = await func()
+            except ActronAirAPIError as err:
+                if not _is_throttled(err) or retries >= MAX_THROTTLE_RETRIES:
+                    raise
+                retries += 1
+                self._async_throttled(err)
+                continue
+            self.rate_factor = min(1.0, self.rate_factor + RATE_RECOVERY_STEP)
+            return result
+
+    async def _async_acquire(self, serial_number: str | None, command: bool) -> None:
+        """Wait in line until the tokens for a request are available."""
+        self.queue_depth += 1
+        try:
+            # Only the line of this system is held while waiting. Other lines
+            # may take shared tokens meanwhile, so the delay is checked again.
+            async with self._locks[serial_number]:
+                now = time.monotonic()
+                if (
+                    command
+                    and serial_number is not None
+                    and self._command_grants.get(serial_number, 0.0) > now
+                ):
+                    return
+                buckets = self._buckets(serial_number)
+                while (delay := self._delay(now, buckets)) > 0:
+                    await asyncio.sleep(delay)
+                    now = time.monotonic()
+                for bucket, cost in buckets:
+                    bucket.take(now, cost, self.rate_factor)
+                if command and serial_number is not None:
+                    self._command_grants[serial_number] = now + self.command_window
+        finally:
+            self.queue_depth -= 1
+
+    def _buckets(
+        self, serial_number: str | None
+    ) -> list[tuple[ActronAirTokenBucket, int]]:
+        """Return the buckets and costs of a request."""
+        if serial_number is None:
+            # The API client fetches every system with its own request.
+            return [
+                (self.account_bucket, max(1, len(self.system_buckets))),
+                *((bucket, 1) for bucket in self.system_buckets.values()),
+            ]
+        buckets = [(self.account_bucket, 1)]
+        if (bucket := self.system_buckets.get(serial_number)) is not None:
+            buckets.append((bucket, 1))
+        return buckets
+
+    def _delay(
+        self, now: float, buckets: list[tuple[ActronAirTokenBucket, int]]
+    ) -> float:
+        """Return the seconds until a request can be sent."""
+        return max(
+            self._resume_at - now,
+            *(bucket.delay(now, cost, self.rate_factor) for bucket, cost in buckets),
+        )
+
+    def _async_throttled(self, err: ActronAirAPIError) -> None:
+        """Slow down after the cloud throttled a request."""
+        self.throttled_responses += 1
+        self.rate_factor = max(MIN_RATE_FACTOR, self.rate_factor / 2)
+        if (match := RETRY_AFTER_PATTERN.search(str(err))) is not None:
+            pause = float(match.group(1))
+        else:
+            pause = THROTTLE_PAUSE
+        self._resume_at = max(self._resume_at, time.monotonic() + pause)
+        # Commands sharing an earlier grant must also wait out the pause.
+        self._command_grants.clear()
+        _LOGGER.warning(
+            "Actron Air cloud is throttling requests, pausing for %s seconds", pause
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the limiter state for diagnostics."""
+        now = time.monotonic()
+        return {
+            "account_tokens": round(
+                self.account_bucket.tokens(now, self.rate_factor), 2
+            ),
+            "queue_depth": self.queue_depth,
+            "rate_factor": round(self.rate_factor, 2),
+            "throttled_responses": self.throttled_responses,
+            "paused_for": round(max(0.0, self._resume_at - now), 1),
+        }
+
+    def system_tokens(self, serial_number: str) -> float | None:
+        """Return the tokens left for a system."""
+        if (bucket := self.system_buckets.get(serial_number)) is None:
+            return None
+        return round(bucket.tokens(time.monotonic(), self.rate_factor), 2)
+
+
+def _is_throttled(err: ActronAirAPIError) -> bool:
+    """Return True if the cloud rejected a request as too frequent."""
+    message = str(err)
+    return "Status: 429" in message or RETRY_AFTER_PATTERN.search(message) is not None
@@ -2,11 +2,14 @@
 
 from collections.abc import Callable
 from dataclasses import dataclass
+from datetime import datetime, timedelta
+import time
 
 from actron_neo_api import ActronAirStatus
 from actron_neo_api.models.zone import ActronAirPeripheral
 
 from homeassistant.components.sensor import (
+    RestoreSensor,
     SensorDeviceClass,
     SensorEntity,
     SensorEntityDescription,
@@ -14,34 +17,68 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.const import (
     PERCENTAGE,
-    EntityCategory,
     REVOLUTIONS_PER_MINUTE,
+    EntityCategory,
+    UnitOfEnergy,
     UnitOfPower,
     UnitOfTemperature,
+    UnitOfTime,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 
 from .coordinator import ActronAirConfigEntry, ActronAirSystemCoordinator
-from .entity import ActronAirAcEntity, ActronAirPeripheralEntity
+from .entity import (
+    ActronAirAcEntity,
+    ActronAirEntity,
+    ActronAirPeripheralEntity,
+    async_add_hardware_entities,
+)
 
 PARALLEL_UPDATES = 0
 
+# High-churn compressor readings are written at most this often.
+COMPRESSOR_WRITE_INTERVAL = timedelta(seconds=30)
+
+
+@dataclass(frozen=True, kw_only=True)
+class ActronAirThrottledSensorEntityDescription(SensorEntityDescription):
+    """Describes how often an Actron Air sensor writes its state.
+
+    Numeric changes of at most absolute_deadband, or of at most
+    relative_deadband times the last written value, are not written.
+    Other changes are written at most once per min_write_interval.
+    """
+
+    absolute_deadband: float | None = None
+    relative_deadband: float | None = None
+    min_write_interval: timedelta | None = None
+
 
 @dataclass(frozen=True, kw_only=True)
-class ActronAirSensorEntityDescription(SensorEntityDescription):
+class ActronAirSensorEntityDescription(ActronAirThrottledSensorEntityDescription):
     """Describes Actron Air sensor entity."""
 
     value_fn: Callable[[ActronAirStatus], str | float | int | None]
 
 
 @dataclass(frozen=True, kw_only=True)
-class ActronAirPeripheralSensorEntityDescription(SensorEntityDescription):
+class ActronAirPeripheralSensorEntityDescription(
+    ActronAirThrottledSensorEntityDescription
+):
     """Describes Actron Air peripheral sensor entity."""
 
     value_fn: Callable[[ActronAirPeripheral], float | None]
 
 
+@dataclass(frozen=True, kw_only=True)
+class ActronAirMetricSensorEntityDescription(SensorEntityDescription):
+    """Describes Actron Air performance metric sensor entity."""
+
+    value_fn: Callable[[ActronAirSystemCoordinator], datetime | float | int | None]
+
+
 SENSORS: tuple[ActronAirSensorEntityDescription, ...] = (
     ActronAirSensorEntityDescription(
         key="compressor_mode",
@@ -58,6 +95,8 @@ SENSORS: tuple[ActronAirSensorEntityDescription, ...] = (
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
+        absolute_deadband=0.2,
+        min_write_interval=COMPRESSOR_WRITE_INTERVAL,
         value_fn=lambda status: status.compressor_chasing_temperature,
     ),
     ActronAirSensorEntityDescription(
@@ -68,6 +107,8 @@ SENSORS: tuple[ActronAirSensorEntityDescription, ...] = (
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
+        absolute_deadband=0.2,
+        min_write_interval=COMPRESSOR_WRITE_INTERVAL,
         value_fn=lambda status: status.compressor_live_temperature,
     ),
     ActronAirSensorEntityDescription(
@@ -78,6 +119,8 @@ SENSORS: tuple[ActronAirSensorEntityDescription, ...] = (
         native_unit_of_measurement=UnitOfPower.WATT,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
+        relative_deadband=0.05,
+        min_write_interval=COMPRESSOR_WRITE_INTERVAL,
         value_fn=lambda status: status.compressor_power,
     ),
     ActronAirSensorEntityDescription(
@@ -86,6 +129,8 @@ SENSORS: tuple[ActronAirSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
+        relative_deadband=0.05,
+        min_write_interval=COMPRESSOR_WRITE_INTERVAL,
         value_fn=lambda status: status.compressor_speed,
     ),
     ActronAirSensorEntityDescription(
@@ -95,6 +140,8 @@ SENSORS: tuple[ActronAirSensorEntityDescription, ...] = (
         native_unit_of_measurement=PERCENTAGE,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
+        absolute_deadband=1,
+        min_write_interval=COMPRESSOR_WRITE_INTERVAL,
         value_fn=lambda status: status.live_aircon.compressor_capacity,
     ),
     ActronAirSensorEntityDescription(
@@ -104,6 +151,8 @@ SENSORS: tuple[ActronAirSensorEntityDescription, ...] = (
         native_unit_of_measurement=REVOLUTIONS_PER_MINUTE,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
+        absolute_deadband=25,
+        min_write_interval=COMPRESSOR_WRITE_INTERVAL,
         value_fn=lambda status: status.live_aircon.fan_rpm,
     ),
     ActronAirSensorEntityDescription(
@@ -116,6 +165,96 @@ SENSORS: tuple[ActronAirSensorEntityDescription, ...] = (
     ),
 )
 
+ENERGY_SENSOR = SensorEntityDescription(
+    key="compressor_energy",
+    translation_key="compressor_energy",
+    device_class=SensorDeviceClass.ENERGY,
+    state_class=SensorStateClass.TOTAL_INCREASING,
+    native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+    suggested_display_precision=2,
+)
+
+METRIC_SENSORS: tuple[ActronAirMetricSensorEntityDescription, ...] = (
+    ActronAirMetricSensorEntityDescription(
+        key="push_rate",
+        translation_key="push_rate",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement="messages/min",
+        suggested_display_precision=1,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: coordinator.metrics.push_rate(time.monotonic()),
+    ),
+    ActronAirMetricSensorEntityDescription(
+        key="last_push",
+        translation_key="last_push",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: coordinator.last_push,
+    ),
+    ActronAirMetricSensorEntityDescription(
+        key="poll_latency_p50",
+        translation_key="poll_latency_p50",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        suggested_display_precision=0,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: _milliseconds(
+            coordinator.metrics.poll_duration(50)
+        ),
+    ),
+    ActronAirMetricSensorEntityDescription(
+        key="poll_latency_p95",
+        translation_key="poll_latency_p95",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        suggested_display_precision=0,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: _milliseconds(
+            coordinator.metrics.poll_duration(95)
+        ),
+    ),
+    ActronAirMetricSensorEntityDescription(
+        key="failed_updates",
+        translation_key="failed_updates",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: coordinator.metrics.failed_updates,
+    ),
+    ActronAirMetricSensorEntityDescription(
+        key="command_latency",
+        translation_key="command_latency",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        suggested_display_precision=0,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: _milliseconds(
+            coordinator.metrics.command_latency(50)
+        ),
+    ),
+    ActronAirMetricSensorEntityDescription(
+        key="fan_out_time",
+        translation_key="fan_out_time",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        suggested_display_precision=2,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: _milliseconds(
+            coordinator.metrics.fan_out_duration(50)
+        ),
+    ),
+)
+
 PERIPHERAL_SENSORS: tuple[ActronAirPeripheralSensorEntityDescription, ...] = (
     ActronAirPeripheralSensorEntityDescription(
         key="temperature",
@@ -156,19 +295,88 @@ async def async_setup_entry(
 
     for coordinator in system_coordinators.values():
         entities.extend(
-            ActronAirSensor(coordinator, description)
-            for description in SENSORS
+            ActronAirSensor(coordinator, description) for description in SENSORS
         )
+        entities.append(ActronAirEnergySensor(coordinator, ENERGY_SENSOR))
         entities.extend(
-            ActronAirPeripheralSensor(coordinator, peripheral, description)
-            for peripheral in coordinator.data.peripherals
-            for description in PERIPHERAL_SENSORS
+            ActronAirMetricSensor(coordinator, description)
+            for description in METRIC_SENSORS
         )
 
     async_add_entities(entities)
+    async_add_hardware_entities(
+        entry,
+        async_add_entities,
+        peripheral_entities=lambda coordinator, peripheral: [
+            ActronAirPeripheralSensor(coordinator, peripheral, description)
+            for description in PERIPHERAL_SENSORS
+        ],
+    )
+
+
+class ActronAirThrottledSensor(ActronAirEntity, SensorEntity):
+    """Sensor that leaves out insignificant and too frequent state writes.
+
+    Becoming available or unavailable is always written straight away. A
+    change held back by min_write_interval is written once the interval has
+    passed, with the value current at that time.
+    """
+
+    entity_description: ActronAirThrottledSensorEntityDescription
+    _written_value: str | float | int | None = None
+    _written_at: float | None = None
+    _unsub_deferred_write: CALLBACK_TYPE | None = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state unless the change is within the deadband or too soon."""
+        if self._written_at is None or not self.available:
+            super()._handle_coordinator_update()
+            return
+        if self._unsub_deferred_write is None and not _within_deadband(
+            self.native_value, self._written_value, self.entity_description
+        ):
+            if (interval := self.entity_description.min_write_interval) is None or (
+                delay := self._written_at + interval.total_seconds() - time.monotonic()
+            ) <= 0:
+                super()._handle_coordinator_update()
+                return
+            self._unsub_deferred_write = async_call_later(
+                self.hass, delay, self._async_write_deferred
+            )
+        self.coordinator.suppressed_state_writes += 1
 
+    @callback
+    def _async_write_deferred(self, _now: datetime) -> None:
+        """Write the change held back by min_write_interval."""
+        self._unsub_deferred_write = None
+        super()._handle_coordinator_update()
 
-class ActronAirSensor(ActronAirAcEntity, SensorEntity):
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Remember the value written, to compare later updates against."""
+        self._async_cancel_deferred_write()
+        if self.available:
+            self._written_value = self.native_value
+            self._written_at = time.monotonic()
+        else:
+            self._written_value = self._written_at = None
+        super().async_write_ha_state()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Drop a pending write."""
+        await super().async_will_remove_from_hass()
+        self._async_cancel_deferred_write()
+
+    @callback
+    def _async_cancel_deferred_write(self) -> None:
+        """Cancel the write scheduled by min_write_interval."""
+        if self._unsub_deferred_write is not None:
+            self._unsub_deferred_write()
+            self._unsub_deferred_write = None
+
+
+class ActronAirSensor(ActronAirThrottledSensor, ActronAirAcEntity):
     """Representation of an Actron Air sensor."""
 
     entity_description: ActronAirSensorEntityDescription
@@ -189,7 +397,68 @@ class ActronAirSensor(ActronAirAcEntity, SensorEntity):
         return self.entity_description.value_fn(self.coordinator.data)
 
 
-class ActronAirPeripheralSensor(ActronAirPeripheralEntity, SensorEntity):
+class ActronAirEnergySensor(ActronAirAcEntity, RestoreSensor):
+    """Energy used by the compressor, integrated by the coordinator."""
+
+    def __init__(
+        self,
+        coordinator: ActronAirSystemCoordinator,
+        description: SensorEntityDescription,
+    ) -> None:
+        """Initialize the energy sensor."""
+        super().__init__(coordinator)
+        # Energy grows with every update while the compressor draws power.
+        self.coordinator_context = None
+        self.entity_description = description
+        self._attr_unique_id = f"{coordinator.serial_number}_{description.key}"
+
+    async def async_added_to_hass(self) -> None:
+        """Continue counting from the energy reported before a restart."""
+        await super().async_added_to_hass()
+        if (
+            last_data := await self.async_get_last_sensor_data()
+        ) is not None and isinstance(last_data.native_value, (int, float)):
+            self.coordinator.energy_meter.restore(float(last_data.native_value))
+
+    @property
+    def native_value(self) -> float:
+        """Return the energy used in kWh."""
+        return round(self.coordinator.energy_meter.energy, 3)
+
+
+class ActronAirMetricSensor(ActronAirAcEntity, SensorEntity):
+    """Representation of an Actron Air performance metric.
+
+    Metrics are read when the coordinator notifies its listeners, so they
+    add no work to the update path while the sensors are disabled.
+    """
+
+    entity_description: ActronAirMetricSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: ActronAirSystemCoordinator,
+        description: ActronAirMetricSensorEntityDescription,
+    ) -> None:
+        """Initialize the metric sensor."""
+        super().__init__(coordinator)
+        # Metrics change with every update, whichever part of the status did.
+        self.coordinator_context = None
+        self.entity_description = description
+        self._attr_unique_id = f"{coordinator.serial_number}_{description.key}"
+
+    @property
+    def available(self) -> bool:
+        """Return True, as metrics matter most while the system is unreachable."""
+        return True
+
+    @property
+    def native_value(self) -> datetime | float | int | None:
+        """Return the state of the sensor."""
+        return self.entity_description.value_fn(self.coordinator)
+
+
+class ActronAirPeripheralSensor(ActronAirThrottledSensor, ActronAirPeripheralEntity):
     """Representation of an Actron Air peripheral sensor."""
 
     entity_description: ActronAirPeripheralSensorEntityDescription
@@ -203,9 +472,7 @@ class ActronAirPeripheralSensor(ActronAirPeripheralEntity, SensorEntity):
         """Initialize the peripheral sensor."""
         super().__init__(coordinator, peripheral)
         self.entity_description = description
-        self._attr_unique_id = (
-            f"{peripheral.serial_number}_{description.key}"
-        )
+        self._attr_unique_id = f"{peripheral.serial_number}_{description.key}"
 
     @property
     def native_value(self) -> float | None:
@@ -213,3 +480,24 @@ class ActronAirPeripheralSensor(ActronAirPeripheralEntity, SensorEntity):
         if (peripheral := self._peripheral) is None:
             return None
         return self.entity_description.value_fn(peripheral)
+
+
+def _within_deadband(
+    value: str | float | None,
+    written: str | float | None,
+    description: ActronAirThrottledSensorEntityDescription,
+) -> bool:
+    """Return True if value is too close to the written value to write."""
+    if not isinstance(value, (int, float)) or not isinstance(written, (int, float)):
+        return False
+    change = abs(value - written)
+    if (deadband := description.absolute_deadband) is not None and change <= deadband:
+        return True
+    return (
+        deadband := description.relative_deadband
+    ) is not None and change <= deadband * abs(written)
+
+
+def _milliseconds(seconds: float | None) -> float | None:
+    """Convert a duration in seconds to milliseconds."""
+    return None if seconds is None else seconds * 1000
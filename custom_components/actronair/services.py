@@ -0,0 +1,294 @@
+"""Services for the Actron Air integration."""
+
+from __future__ import annotations
+
+from copy import deepcopy
+from typing import Any
+
+from actron_neo_api import ActronAirStatus
+from actron_neo_api.const import (
+    AC_MODE_AUTO,
+    AC_MODE_COOL,
+    AC_MODE_HEAT,
+    TEMP_AUTO_HEAT_MIN,
+)
+import voluptuous as vol
+
+from homeassistant.components.climate import ATTR_TEMPERATURE
+from homeassistant.const import ATTR_DEVICE_ID
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv, device_registry as dr
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN
+from .coordinator import ActronAirConfigEntry, ActronAirSystemCoordinator
+
+SERVICE_SET_ZONES = "set_zones"
+SERVICE_SNAPSHOT = "snapshot"
+SERVICE_RESTORE = "restore"
+ATTR_ZONES = "zones"
+ATTR_ENABLED = "enabled"
+# Snapshots by system serial number, kept across reloads of the config entry.
+DATA_SNAPSHOTS: HassKey[dict[str, dict[str, Any]]] = HassKey(DOMAIN)
+
+POWER_KEY = "UserAirconSettings.isOn"
+MODE_KEY = "UserAirconSettings.Mode"
+TURBO_KEY = "UserAirconSettings.TurboMode.Enabled"
+# Command keys of the system settings a snapshot saves, with their fields.
+SNAPSHOT_SETTINGS = {
+    POWER_KEY: "is_on",
+    MODE_KEY: "mode",
+    "UserAirconSettings.FanMode": "fan_mode",
+    "UserAirconSettings.TemperatureSetpoint_Cool_oC": "temperature_setpoint_cool_c",
+    "UserAirconSettings.TemperatureSetpoint_Heat_oC": "temperature_setpoint_heat_c",
+    "UserAirconSettings.AwayMode": "away_mode",
+    "UserAirconSettings.QuietModeEnabled": "quiet_mode_enabled",
+    "UserAirconSettings.EnabledZones": "enabled_zones",
+}
+SNAPSHOT_ZONE_SETTINGS = {
+    "TemperatureSetpoint_Cool_oC": "temperature_setpoint_cool_c",
+    "TemperatureSetpoint_Heat_oC": "temperature_setpoint_heat_c",
+}
+
+SYSTEM_SCHEMA = vol.Schema({vol.Required(ATTR_DEVICE_ID): cv.string})
+ZONE_SETTINGS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENABLED): cv.boolean,
+        vol.Optional(ATTR_TEMPERATURE): vol.Coerce(float),
+    }
+)
+SET_ZONES_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): cv.string,
+        vol.Required(ATTR_ZONES): vol.All(
+            {cv.string: ZONE_SETTINGS_SCHEMA}, vol.Length(min=1)
+        ),
+    }
+)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the Actron Air services."""
+
+    async def async_set_zones(call: ServiceCall) -> None:
+        """Apply the settings of several zones with a single command."""
+        coordinator = _async_get_coordinator(hass, call.data[ATTR_DEVICE_ID])
+        status = coordinator.data
+        changes = {
+            _zone_id(status, zone): settings
+            for zone, settings in call.data[ATTR_ZONES].items()
+        }
+        command = _set_zones_command(status, changes)
+        if len(command) == 1:
+            return
+
+        async def send() -> None:
+            await coordinator.api.send_command(
+                coordinator.serial_number, {"command": command}
+            )
+            _apply_command(status, command)
+
+        await coordinator.async_send_command(send)
+
+    async def async_snapshot(call: ServiceCall) -> None:
+        """Save the settings of a system to restore later."""
+        coordinator = _async_get_coordinator(hass, call.data[ATTR_DEVICE_ID])
+        snapshots = hass.data.setdefault(DATA_SNAPSHOTS, {})
+        snapshots[coordinator.serial_number] = _snapshot(coordinator.data)
+
+    async def async_restore(call: ServiceCall) -> None:
+        """Send the commands that return a system to its saved settings."""
+        coordinator = _async_get_coordinator(hass, call.data[ATTR_DEVICE_ID])
+        snapshots = hass.data.get(DATA_SNAPSHOTS, {})
+        if (saved := snapshots.get(coordinator.serial_number)) is None:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN, translation_key="no_snapshot"
+            )
+        for command in _plan_restore(saved, _snapshot(coordinator.data)):
+            # A poll or push may have replaced the status since the last command.
+            status = coordinator.data
+
+            async def send(
+                command: dict[str, Any] = command, status: ActronAirStatus = status
+            ) -> None:
+                await coordinator.api.send_command(
+                    coordinator.serial_number, {"command": command}
+                )
+                _apply_command(status, command)
+
+            await coordinator.async_send_command(send)
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_SET_ZONES, async_set_zones, schema=SET_ZONES_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_SNAPSHOT, async_snapshot, schema=SYSTEM_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_RESTORE, async_restore, schema=SYSTEM_SCHEMA
+    )
+
+
+@callback
+def _async_get_coordinator(
+    hass: HomeAssistant, device_id: str
+) -> ActronAirSystemCoordinator:
+    """Return the coordinator of the system a device represents."""
+    if (device := dr.async_get(hass).async_get(device_id)) is not None:
+        entries: list[ActronAirConfigEntry] = hass.config_entries.async_loaded_entries(
+            DOMAIN
+        )
+        for domain, identifier in device.identifiers:
+            if domain != DOMAIN:
+                continue
+            for entry in entries:
+                if coordinator := entry.runtime_data.system_coordinators.get(
+                    identifier
+                ):
+                    return coordinator
+    raise ServiceValidationError(
+        translation_domain=DOMAIN,
+        translation_key="system_not_found",
+        translation_placeholders={"device_id": device_id},
+    )
+
+
+def _zone_id(status: ActronAirStatus, zone: str) -> int:
+    """Return the index of a zone given its name or its number from 1."""
+    zones = [zone_info for zone_info in status.remote_zone_info if zone_info.exists]
+    for zone_info in zones:
+        if zone_info.title.casefold() == zone.casefold():
+            return zone_info.zone_id
+    if zone.isdigit() and 1 <= int(zone) <= len(zones):
+        return zones[int(zone) - 1].zone_id
+    raise ServiceValidationError(
+        translation_domain=DOMAIN,
+        translation_key="zone_not_found",
+        translation_placeholders={"zone": zone},
+    )
+
+
+def _set_zones_command(
+    status: ActronAirStatus, changes: dict[int, dict[str, Any]]
+) -> dict[str, Any]:
+    """Return one set-settings command applying every zone change.
+
+    Setpoints are validated against the limits of each zone first, so that
+    either the whole change is sent or none of it.
+    """
+    settings = status.user_aircon_settings
+    mode = (settings.mode or "").upper()
+    command: dict[str, Any] = {"type": "set-settings"}
+    enabled_zones = list(settings.enabled_zones)
+    for zone_id, zone_settings in changes.items():
+        zone = status.remote_zone_info[zone_id]
+        if ATTR_ENABLED in zone_settings and zone_id < len(enabled_zones):
+            enabled_zones[zone_id] = zone_settings[ATTR_ENABLED]
+        if (temperature := zone_settings.get(ATTR_TEMPERATURE)) is None:
+            continue
+        if mode not in (AC_MODE_COOL, AC_MODE_HEAT, AC_MODE_AUTO):
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="zone_temperature_unavailable",
+                translation_placeholders={"mode": mode},
+            )
+        if not zone.min_temp <= temperature <= zone.max_temp:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="zone_temperature_out_of_range",
+                translation_placeholders={
+                    "zone": zone.title,
+                    "min_temp": str(zone.min_temp),
+                    "max_temp": str(zone.max_temp),
+                },
+            )
+        prefix = f"RemoteZoneInfo[{zone_id}]"
+        if mode in (AC_MODE_COOL, AC_MODE_AUTO):
+            command[f"{prefix}.TemperatureSetpoint_Cool_oC"] = temperature
+        if mode == AC_MODE_HEAT:
+            command[f"{prefix}.TemperatureSetpoint_Heat_oC"] = temperature
+        elif mode == AC_MODE_AUTO:
+            # Keep the heat setpoint as far below as the system setpoints are.
+            differential = (
+                settings.temperature_setpoint_cool_c
+                - settings.temperature_setpoint_heat_c
+            )
+            command[f"{prefix}.TemperatureSetpoint_Heat_oC"] = max(
+                TEMP_AUTO_HEAT_MIN, temperature - differential
+            )
+    if enabled_zones != settings.enabled_zones:
+        command["UserAirconSettings.EnabledZones"] = enabled_zones
+    return command
+
+
+def _snapshot(status: ActronAirStatus) -> dict[str, Any]:
+    """Return the settings of a system keyed by their command keys."""
+    settings = status.user_aircon_settings
+    snapshot = {
+        key: deepcopy(getattr(settings, name))
+        for key, name in SNAPSHOT_SETTINGS.items()
+    }
+    if settings.turbo_supported:
+        snapshot[TURBO_KEY] = settings.turbo_enabled
+    for zone in status.remote_zone_info:
+        if not zone.exists:
+            continue
+        for key, name in SNAPSHOT_ZONE_SETTINGS.items():
+            snapshot[f"RemoteZoneInfo[{zone.zone_id}].{key}"] = getattr(zone, name)
+    return snapshot
+
+
+def _plan_restore(
+    saved: dict[str, Any], current: dict[str, Any]
+) -> list[dict[str, Any]]:
+    """Return the fewest commands that change current back to saved.
+
+    Only values that differ are sent, merged into one command. Turning the
+    system on or off is sent on its own: on before the other settings, so
+    zones are enabled on a running system, and off after them. Settings of
+    zones that no longer exist are left out.
+    """
+    changes = {
+        key: value
+        for key, value in saved.items()
+        if key in current and current[key] != value
+    }
+    power: dict[str, Any] = {}
+    if POWER_KEY in changes:
+        power[POWER_KEY] = changes.pop(POWER_KEY)
+        if MODE_KEY in changes:
+            power[MODE_KEY] = changes.pop(MODE_KEY)
+    commands = [{"type": "set-settings", **changes}] if changes else []
+    if power:
+        command = {"type": "set-settings", **power}
+        if power[POWER_KEY]:
+            commands.insert(0, command)
+        else:
+            commands.append(command)
+    return commands
+
+
+def _apply_command(status: ActronAirStatus, command: dict[str, Any]) -> None:
+    """Set the values of an accepted command on status.
+
+    The API client does this itself for the commands it builds.
+    """
+    settings = status.user_aircon_settings
+    for key, name in SNAPSHOT_SETTINGS.items():
+        if key in command:
+            setattr(settings, name, deepcopy(command[key]))
+    if TURBO_KEY in command:
+        if isinstance(settings.turbo_mode_enabled, dict):
+            settings.turbo_mode_enabled = {
+                **settings.turbo_mode_enabled,
+                "Enabled": command[TURBO_KEY],
+            }
+        else:
+            settings.turbo_mode_enabled = command[TURBO_KEY]
+    for zone in status.remote_zone_info:
+        prefix = f"RemoteZoneInfo[{zone.zone_id}]"
+        for key, name in SNAPSHOT_ZONE_SETTINGS.items():
+            if (value := command.get(f"{prefix}.{key}")) is not None:
+                setattr(zone, name, value)
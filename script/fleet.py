@@ -0,0 +1,144 @@
+"""Synthetic Actron Air fleets for the cloud simulator and benchmarks."""
+
+from collections.abc import Callable
+from typing import Any
+
+from actron_neo_api import ActronAirStatus
+from actron_neo_api.models.system import ActronAirSystemInfo
+from actron_neo_api.state import StateManager
+
+
+def fleet_serial(system: int) -> str:
+    """Return the serial number of a synthetic system."""
+    return f"fleet{system:04d}"
+
+
+def fleet_state(
+    system: int, zones: int, peripherals: int, tick: int = 0
+) -> dict[str, Any]:
+    """Return the last known state of a synthetic system at tick.
+
+    Zone and peripheral readings drift with tick, so consecutive ticks
+    produce distinct snapshots.
+    """
+    return {
+        "AirconSystem": {
+            "MasterSerial": fleet_serial(system),
+            "Peripherals": [
+                {
+                    "SerialNumber": f"{fleet_serial(system)}p{peripheral}",
+                    "DeviceType": "Zone Sensor",
+                    "ZoneAssignment": [peripheral % max(zones, 1) + 1],
+                    "RemainingBatteryCapacity_pc": 100 - peripheral,
+                    "SensorInputs": {
+                        "SHTC1": {
+                            "Temperature_oC": 21 + (peripheral + tick) % 8 * 0.5,
+                            "RelativeHumidity_pc": 45 + (peripheral + tick) % 10,
+                        }
+                    },
+                }
+                for peripheral in range(peripherals)
+            ],
+        },
+        "UserAirconSettings": {
+            "isOn": True,
+            "Mode": "COOL",
+            "FanMode": "AUTO",
+            "TemperatureSetpoint_Cool_oC": 22.0,
+            "TemperatureSetpoint_Heat_oC": 20.0,
+            "EnabledZones": [True] * zones,
+        },
+        "MasterInfo": {
+            "LiveTemp_oC": 23 + tick % 4 * 0.5,
+            "LiveHumidity_pc": 50.0,
+            "LiveOutdoorTemp_oC": 30.0,
+        },
+        "LiveAircon": {
+            "CompressorMode": "COOL",
+            "CompressorCapacity": 40 + tick % 20,
+            "FanRPM": 900,
+            "OutdoorUnit": {"CompressorOn": True},
+        },
+        "RemoteZoneInfo": [
+            {
+                "NV_Exists": True,
+                "NV_Title": f"Zone {zone + 1}",
+                "CanOperate": True,
+                "LiveTemp_oC": 20 + (system + zone + tick) % 10 * 0.5,
+                "LiveHumidity_pc": 50.0,
+                "ZonePosition": 100,
+                "TemperatureSetpoint_Cool_oC": 22.0,
+                "TemperatureSetpoint_Heat_oC": 20.0,
+            }
+            for zone in range(zones)
+        ],
+    }
+
+
+def fleet_status(
+    system: int, zones: int, peripherals: int, tick: int = 0
+) -> ActronAirStatus:
+    """Return the status of a synthetic system at tick."""
+    status = ActronAirStatus.model_validate(
+        {
+            "isOnline": True,
+            "lastKnownState": fleet_state(system, zones, peripherals, tick),
+        }
+    )
+    status.parse_nested_components()
+    return status
+
+
+class FakeActronAirAPI:
+    """In-memory stand-in for ActronAirAPI serving a synthetic fleet.
+
+    Every fetch or push advances the system to its next tick.
+    """
+
+    def __init__(self, systems: int, zones: int, peripherals: int) -> None:
+        """Initialize a fleet of systems with zones and peripherals each."""
+        self.state_manager = StateManager()
+        self.zones = zones
+        self.peripherals = peripherals
+        self.ticks = {fleet_serial(system): 0 for system in range(systems)}
+        self.fetches = 0
+        self._callbacks: dict[str, list[Callable[[ActronAirStatus], None]]] = {}
+
+    async def get_ac_systems(self) -> list[ActronAirSystemInfo]:
+        """Return the systems of the fleet."""
+        return [ActronAirSystemInfo(serial=serial) for serial in self.ticks]
+
+    async def update_status(self, serial_number: str | None = None) -> None:
+        """Advance one system, or every system, and store the new status."""
+        serials = list(self.ticks) if serial_number is None else [serial_number]
+        for serial in serials:
+            self.fetches += 1
+            self._advance(serial)
+
+    async def start_push(self, serial_numbers: list[str]) -> bool:
+        """Pretend realtime push started."""
+        return True
+
+    async def stop_push(self) -> None:
+        """Pretend realtime push stopped."""
+
+    def subscribe_system_updates(
+        self, serial_number: str, callback: Callable[[ActronAirStatus], None]
+    ) -> None:
+        """Call callback with every status pushed for a system."""
+        self._callbacks.setdefault(serial_number, []).append(callback)
+
+    def push(self, serial_number: str) -> None:
+        """Advance a system and push its new status to subscribers."""
+        status = self._advance(serial_number)
+        for callback in self._callbacks.get(serial_number, []):
+            callback(status)
+
+    def _advance(self, serial_number: str) -> ActronAirStatus:
+        """Move a system to its next tick."""
+        tick = self.ticks[serial_number] = self.ticks[serial_number] + 1
+        system = list(self.ticks).index(serial_number)
+        return self.state_manager.process_status_update(
+            serial_number,
+            fleet_status(system, self.zones, self.peripherals, tick),
+        )
@@ -0,0 +1,385 @@
+"""Local Actron Air cloud simulator for load and latency testing.
+
+Serves a synthetic fleet over the same REST and SignalR endpoints as the
+Actron Air cloud. Run it from the repository root:
+
+    python -m script.simulator --systems 50 --zones 8 --latency 0.2
+
+then start Home Assistant with ACTRON_AIR_CLOUD_URL=http://localhost:8080
+and add the integration as usual; any device code is accepted.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from contextlib import suppress
+from dataclasses import dataclass
+import json
+import logging
+import random
+import re
+import time
+from typing import Any
+import uuid
+
+from aiohttp import web
+
+from .fleet import fleet_serial, fleet_state
+
+_LOGGER = logging.getLogger("actron_air_simulator")
+
+API_PREFIX = "/api/v0"
+MESSAGING_PREFIX = f"{API_PREFIX}/messaging/app"
+COMMAND_KEY = re.compile(r"^(\w+)(?:\[(\d+)\])?\.(\w+)$")
+TOKEN_LIFETIME = 3600
+KEEP_ALIVE_INTERVAL = 15
+
+
+@dataclass(slots=True)
+class SimulatorConfig:
+    """Options of a simulator run."""
+
+    systems: int = 1
+    zones: int = 4
+    peripherals: int = 2
+    latency: float = 0.0
+    jitter: float = 0.0
+    rate_limit: float = 0.0
+    burst: int = 20
+    push_interval: float = 30.0
+
+
+class TokenBucket:
+    """Allow rate requests per second with bursts of up to burst requests."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        """Initialize a full bucket."""
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    def take(self) -> float:
+        """Take a token, returning 0 or the seconds until one is available."""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+
+class ActronAirCloudSimulator:
+    """Serve a synthetic fleet the way the Actron Air cloud does.
+
+    Readings of every system drift on a timer and each change is pushed to
+    the SignalR streams subscribed to that system.
+    """
+
+    def __init__(self, config: SimulatorConfig) -> None:
+        """Initialize the fleet."""
+        self.config = config
+        self.states = {
+            fleet_serial(system): fleet_state(system, config.zones, config.peripherals)
+            for system in range(config.systems)
+        }
+        self.requests = 0
+        self.throttled = 0
+        self._ticks = dict.fromkeys(self.states, 0)
+        self._bucket = (
+            TokenBucket(config.rate_limit, config.burst) if config.rate_limit else None
+        )
+        self._device_codes: set[str] = set()
+        self._subscriptions: dict[str, set[str]] = {}
+        self._streams: dict[str, set[web.StreamResponse]] = {}
+        self._tasks: list[asyncio.Task[None]] = []
+        self._closing = asyncio.Event()
+
+    def create_app(self) -> web.Application:
+        """Return the web application of the simulator."""
+        app = web.Application(middlewares=[self._middleware])
+        app.add_routes(
+            [
+                web.post(f"{API_PREFIX}/oauth/token", self._handle_token),
+                web.get(f"{API_PREFIX}/client/account", self._handle_account),
+                web.get(f"{API_PREFIX}/client/ac-systems", self._handle_systems),
+                web.get(
+                    f"{API_PREFIX}/client/ac-systems/{{serial}}/status",
+                    self._handle_status,
+                ),
+                web.post(
+                    f"{API_PREFIX}/client/ac-systems/{{serial}}/commands",
+                    self._handle_command,
+                ),
+                web.post(f"{MESSAGING_PREFIX}/negotiate", self._handle_negotiate),
+                web.get(f"{MESSAGING_PREFIX}/stream", self._handle_stream),
+                web.post(f"{MESSAGING_PREFIX}/subscribe", self._handle_subscribe),
+                web.post(f"{MESSAGING_PREFIX}/unsubscribe", self._handle_unsubscribe),
+            ]
+        )
+        app.on_startup.append(self._async_start)
+        app.on_shutdown.append(self._async_stop)
+        return app
+
+    async def _async_start(self, app: web.Application) -> None:
+        """Start drifting the readings of every system."""
+        if self.config.push_interval > 0:
+            self._tasks = [
+                asyncio.create_task(self._async_drift(serial)) for serial in self.states
+            ]
+
+    async def _async_stop(self, app: web.Application) -> None:
+        """Stop drifting readings and close the streams."""
+        self._closing.set()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler: Any) -> Any:
+        """Delay every request, and throttle the client API."""
+        self.requests += 1
+        if delay := self.config.latency + random.uniform(
+            -self.config.jitter, self.config.jitter
+        ):
+            await asyncio.sleep(max(delay, 0))
+        if (
+            self._bucket is not None
+            and request.path.startswith(f"{API_PREFIX}/client/")
+            and (retry_after := self._bucket.take())
+        ):
+            self.throttled += 1
+            seconds = max(round(retry_after), 1)
+            return web.Response(
+                status=429,
+                text=f"Too many requests, retry after {seconds} seconds",
+                headers={"Retry-After": str(seconds)},
+            )
+        return await handler(request)
+
+    async def _handle_token(self, request: web.Request) -> web.Response:
+        """Issue device codes and exchange them, or refresh tokens, for tokens."""
+        form = await request.post()
+        grant_type = form.get("grant_type")
+        if grant_type is None:
+            device_code = uuid.uuid4().hex
+            self._device_codes.add(device_code)
+            return web.json_response(
+                {
+                    "device_code": device_code,
+                    "user_code": device_code[:8].upper(),
+                    "verification_uri": str(request.url.origin()),
+                    "verification_uri_complete": str(request.url.origin()),
+                    "expires_in": 600,
+                    "interval": 1,
+                }
+            )
+        # Any refresh token is accepted, so existing entries can be pointed
+        # at the simulator.
+        if grant_type == "device_code" and form.get("device_code") not in (
+            self._device_codes
+        ):
+            return web.json_response({"error": "invalid_grant"}, status=400)
+        return web.json_response(
+            {
+                "access_token": uuid.uuid4().hex,
+                "refresh_token": uuid.uuid4().hex,
+                "token_type": "Bearer",
+                "expires_in": TOKEN_LIFETIME,
+            }
+        )
+
+    async def _handle_account(self, request: web.Request) -> web.Response:
+        """Return the simulated account."""
+        return web.json_response({"id": "simulator", "email": "simulator@localhost"})
+
+    async def _handle_systems(self, request: web.Request) -> web.Response:
+        """Return the systems of the fleet with links to their status."""
+        return web.json_response(
+            {
+                "_embedded": {
+                    "ac-system": [
+                        {
+                            "serial": serial,
+                            "type": "que",
+                            "description": f"Simulated {serial}",
+                            "_links": {
+                                "ac-status": {
+                                    "href": f"{request.path}/{serial}/status"
+                                },
+                                "commands": {
+                                    "href": f"{request.path}/{serial}/commands"
+                                },
+                            },
+                        }
+                        for serial in self.states
+                    ]
+                }
+            }
+        )
+
+    async def _handle_status(self, request: web.Request) -> web.Response:
+        """Return the last known state of a system."""
+        if (serial := request.match_info["serial"]) not in self.states:
+            raise web.HTTPNotFound
+        return web.json_response(self._status(serial))
+
+    async def _handle_command(self, request: web.Request) -> web.Response:
+        """Apply the settings of a command and push the new state."""
+        if (serial := request.match_info["serial"]) not in self.states:
+            raise web.HTTPNotFound
+        command: dict[str, Any] = (await request.json())["command"]
+        state = self.states[serial]
+        for key, value in command.items():
+            if (match := COMMAND_KEY.match(key)) is None:
+                continue
+            section, index, field = match.groups()
+            target = state.setdefault(section, [] if index else {})
+            if index is not None:
+                if int(index) >= len(target):
+                    raise web.HTTPBadRequest(text=f"No such item: {key}")
+                target = target[int(index)]
+            target[field] = value
+        await self._async_push(serial)
+        return web.json_response({"type": "ack"})
+
+    async def _handle_negotiate(self, request: web.Request) -> web.Response:
+        """Return the URL of a new SignalR stream."""
+        connection = uuid.uuid4().hex
+        stream_url = request.url.origin().with_path(f"{MESSAGING_PREFIX}/stream")
+        return web.json_response(
+            {
+                "url": str(stream_url.with_query(id=connection)),
+                "connectionId": connection,
+            }
+        )
+
+    async def _handle_stream(self, request: web.Request) -> web.StreamResponse:
+        """Stream status changes as server sent events until disconnected."""
+        token = request.headers.get("Authorization", "")
+        response = web.StreamResponse(
+            headers={"Content-Type": "text/event-stream", "Cache-Control": "no-cache"}
+        )
+        await response.prepare(request)
+        self._streams.setdefault(token, set()).add(response)
+        try:
+            while not self._closing.is_set():
+                with suppress(TimeoutError):
+                    await asyncio.wait_for(self._closing.wait(), KEEP_ALIVE_INTERVAL)
+                await response.write(b": keep-alive\n\n")
+        except ConnectionResetError:
+            pass
+        finally:
+            self._streams[token].discard(response)
+        return response
+
+    async def _handle_subscribe(self, request: web.Request) -> web.Response:
+        """Push the changes of a system to the streams of the caller."""
+        serial = (await request.json())["serial"]
+        token = request.headers.get("Authorization", "")
+        self._subscriptions.setdefault(token, set()).add(serial)
+        return web.json_response({})
+
+    async def _handle_unsubscribe(self, request: web.Request) -> web.Response:
+        """Stop pushing the changes of a system to the caller."""
+        serial = (await request.json())["serial"]
+        token = request.headers.get("Authorization", "")
+        self._subscriptions.get(token, set()).discard(serial)
+        return web.json_response({})
+
+    async def _async_drift(self, serial: str) -> None:
+        """Move the readings of a system on every push interval."""
+        system = list(self.states).index(serial)
+        interval = self.config.push_interval
+        await asyncio.sleep(random.uniform(0, interval))
+        while True:
+            tick = self._ticks[serial] = self._ticks[serial] + 1
+            drifted = fleet_state(
+                system, self.config.zones, self.config.peripherals, tick
+            )
+            state = self.states[serial]
+            state["MasterInfo"] = drifted["MasterInfo"]
+            state["LiveAircon"] = drifted["LiveAircon"]
+            state["AirconSystem"]["Peripherals"] = drifted["AirconSystem"][
+                "Peripherals"
+            ]
+            for zone, drifted_zone in zip(
+                state["RemoteZoneInfo"], drifted["RemoteZoneInfo"], strict=False
+            ):
+                zone["LiveTemp_oC"] = drifted_zone["LiveTemp_oC"]
+            await self._async_push(serial)
+            await asyncio.sleep(interval)
+
+    async def _async_push(self, serial: str) -> None:
+        """Send the state of a system to every subscribed stream."""
+        message = json.dumps({"serial": serial, "Status": self._status(serial)})
+        data = f"data: {message}\n\n".encode()
+        for token, serials in self._subscriptions.items():
+            if serial not in serials:
+                continue
+            for stream in list(self._streams.get(token, ())):
+                try:
+                    await stream.write(data)
+                except ConnectionResetError:
+                    self._streams[token].discard(stream)
+
+    def _status(self, serial: str) -> dict[str, Any]:
+        """Return the status payload of a system."""
+        return {"isOnline": True, "lastKnownState": self.states[serial]}
+
+
+def main() -> None:
+    """Run the simulator until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--systems", type=int, default=1)
+    parser.add_argument("--zones", type=int, default=4)
+    parser.add_argument("--peripherals", type=int, default=2)
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="seconds added to each request"
+    )
+    parser.add_argument(
+        "--jitter", type=float, default=0.0, help="random +/- seconds of latency"
+    )
+    parser.add_argument(
+        "--rate-limit",
+        type=float,
+        default=0.0,
+        help="client API requests per second before answering 429, 0 for none",
+    )
+    parser.add_argument("--burst", type=int, default=20)
+    parser.add_argument(
+        "--push-interval",
+        type=float,
+        default=30.0,
+        help="seconds between pushed changes of each system, 0 for none",
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    simulator = ActronAirCloudSimulator(
+        SimulatorConfig(
+            systems=args.systems,
+            zones=args.zones,
+            peripherals=args.peripherals,
+            latency=args.latency,
+            jitter=args.jitter,
+            rate_limit=args.rate_limit,
+            burst=args.burst,
+            push_interval=args.push_interval,
+        )
+    )
+    _LOGGER.info(
+        "Simulating %s systems, set ACTRON_AIR_CLOUD_URL=http://%s:%s",
+        args.systems,
+        args.host,
+        args.port,
+    )
+    web.run_app(simulator.create_app(), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Common helpers for Actron Air tests."""
+
+import os
+from typing import Any
+from unittest.mock import AsyncMock, Mock
+
+from actron_neo_api import ActronAirStatus
+from actron_neo_api.models.system import ActronAirSystemInfo
+from actron_neo_api.state import StateManager
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.const import CONF_API_TOKEN
+from homeassistant.core import HomeAssistant
+
+from custom_components.actronair.const import DOMAIN
+from custom_components.actronair.coordinator import ActronAirSystemCoordinator
+from custom_components.actronair.ratelimit import ActronAirRateLimiter
+
+# Wall-clock and memory budgets depend on the machine, so they are only
+# checked when asked for.
+RUN_BENCHMARKS = os.environ.get("ACTRON_AIR_BENCHMARKS") == "1"
+
+
+def mock_status(
+    *,
+    is_on: bool = False,
+    compressor_on: bool = False,
+    compressor_power: int = 0,
+    setpoint: float = 22.0,
+    zone_temperature: float = 24.0,
+    zone_count: int = 1,
+    peripherals: dict[str, float] | None = None,
+) -> ActronAirStatus:
+    """Build a status snapshot with zone_count identical zones.
+
+    peripherals maps peripheral serial numbers to their battery level.
+    """
+    state: dict[str, Any] = {
+        "UserAirconSettings": {
+            "isOn": is_on,
+            "Mode": "COOL",
+            "TemperatureSetpoint_Cool_oC": setpoint,
+            "EnabledZones": [True] * zone_count,
+        },
+        "LiveAircon": {
+            "OutdoorUnit": {
+                "CompressorOn": compressor_on,
+                "CompPower": compressor_power,
+            }
+        },
+        "AirconSystem": {
+            "Peripherals": [
+                {
+                    "SerialNumber": serial,
+                    "DeviceType": "Zone Sensor",
+                    "RemainingBatteryCapacity_pc": battery,
+                }
+                for serial, battery in (peripherals or {}).items()
+            ]
+        },
+        "RemoteZoneInfo": [
+            {"NV_Exists": True, "LiveTemp_oC": zone_temperature}
+            for _ in range(zone_count)
+        ],
+    }
+    status = ActronAirStatus.model_validate({"lastKnownState": state})
+    status.parse_nested_components()
+    return status
+
+
+def mock_api(serials: list[str]) -> Mock:
+    """Build an API mock whose state manager knows the given systems."""
+    api = Mock()
+    api.state_manager = StateManager()
+    for serial in serials:
+        api.state_manager.process_status_update(serial, mock_status())
+    api.update_status = AsyncMock()
+    return api
+
+
+def mock_config_entry(options: dict[str, Any] | None = None) -> MockConfigEntry:
+    """Build a config entry for the integration."""
+    return MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_API_TOKEN: "refresh-token"},
+        options=options or {},
+    )
+
+
+def mock_rate_limiter(serials: list[str]) -> ActronAirRateLimiter:
+    """Build a rate limiter for the given systems."""
+    return ActronAirRateLimiter(serials, 0)
+
+
+def mock_push_status(**kwargs: Any) -> ActronAirStatus:
+    """Build a status snapshot pushed for the abc1 system."""
+    status = mock_status(**kwargs)
+    status.serial_number = "abc1"
+    return status
+
+
+def mock_system_coordinator(
+    hass: HomeAssistant,
+    options: dict[str, Any] | None = None,
+    *,
+    push: bool = False,
+) -> ActronAirSystemCoordinator:
+    """Build the coordinator of the abc1 system."""
+    return ActronAirSystemCoordinator(
+        hass,
+        mock_config_entry(options),
+        mock_api(["abc1"]),
+        mock_rate_limiter(["abc1"]),
+        ActronAirSystemInfo(serial="abc1"),
+        push_updates_enabled=push,
+    )
@@ -0,0 +1,96 @@
+"""Tests for Actron Air availability."""
+
+from datetime import timedelta
+from unittest.mock import Mock
+
+from freezegun.api import FrozenDateTimeFactory
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.actronair.const import CONF_STALE_TIMEOUT_AUTO
+from custom_components.actronair.coordinator import (
+    SCAN_INTERVAL_IDLE,
+    STALE_DEVICE_MIN_TIMEOUT,
+    STALE_DEVICE_MISSED_UPDATES,
+    STALE_DEVICE_TIMEOUT,
+)
+
+from .common import mock_status, mock_system_coordinator
+
+
+async def test_system_goes_unavailable_on_time(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test listeners hear once when a quiet system goes stale and recovers."""
+    coordinator = mock_system_coordinator(hass)
+    listener = Mock()
+    unsub = coordinator.async_add_listener(listener)
+
+    freezer.tick(STALE_DEVICE_TIMEOUT / 2)
+    coordinator.async_set_polled_status(mock_status())
+    assert listener.call_count == 1
+
+    freezer.tick(STALE_DEVICE_TIMEOUT / 2)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert coordinator.available
+    assert listener.call_count == 1
+
+    freezer.tick(STALE_DEVICE_TIMEOUT / 2)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert not coordinator.available
+    assert listener.call_count == 2
+
+    freezer.tick(STALE_DEVICE_TIMEOUT)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert listener.call_count == 2
+
+    coordinator.async_set_polled_status(mock_status())
+    assert coordinator.available
+    assert listener.call_count == 3
+    unsub()
+
+
+async def test_stale_timeout_follows_update_rate(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the adaptive timeout tracks the gaps between updates."""
+    coordinator = mock_system_coordinator(hass, {CONF_STALE_TIMEOUT_AUTO: True})
+    assert coordinator.stale_timeout == STALE_DEVICE_TIMEOUT
+
+    gap = timedelta(minutes=2)
+    for _ in range(3):
+        freezer.tick(gap)
+        coordinator.async_set_polled_status(mock_status())
+    assert coordinator.stale_timeout == gap * STALE_DEVICE_MISSED_UPDATES
+
+    for _ in range(20):
+        freezer.tick(timedelta(seconds=5))
+        coordinator.async_set_polled_status(mock_status())
+    assert coordinator.stale_timeout == STALE_DEVICE_MIN_TIMEOUT
+
+
+async def test_idle_system_stays_available_between_polls(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test a system backed off to the idle interval does not flap."""
+    coordinator = mock_system_coordinator(hass, {CONF_STALE_TIMEOUT_AUTO: True})
+    for _ in range(20):
+        freezer.tick(timedelta(seconds=5))
+        coordinator.async_set_polled_status(mock_status())
+    assert coordinator.stale_timeout == STALE_DEVICE_MIN_TIMEOUT
+
+    # The first idle poll lands a little after it is due.
+    freezer.tick(SCAN_INTERVAL_IDLE + timedelta(seconds=10))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert coordinator.available
+    coordinator.async_set_polled_status(mock_status())
+
+    freezer.tick(SCAN_INTERVAL_IDLE + timedelta(seconds=10))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert coordinator.available
@@ -0,0 +1,182 @@
+"""Benchmarks for Actron Air against stored baselines.
+
+Times and memory depend on the machine, so they are only compared with
+the baselines when run with ACTRON_AIR_BENCHMARKS=1; the request and state
+write counts are always checked. Run with ACTRON_AIR_UPDATE_BASELINES=1 to
+record new baselines after an intended change in performance.
+"""
+
+from collections.abc import AsyncGenerator
+import json
+import os
+from pathlib import Path
+import time
+import tracemalloc
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockEntityPlatform
+
+from homeassistant.const import EVENT_STATE_CHANGED, Platform
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import Entity
+
+from custom_components.actronair import (
+    async_setup_entry,
+    binary_sensor,
+    climate,
+    cover,
+    sensor,
+    switch,
+)
+from custom_components.actronair.const import CONF_PUSH_COALESCE_WINDOW, DOMAIN
+from custom_components.actronair.coordinator import ActronAirConfigEntry
+from script.fleet import FakeActronAirAPI
+
+from .common import RUN_BENCHMARKS, mock_config_entry
+
+BASELINES_PATH = Path(__file__).with_name("benchmark_baselines.json")
+UPDATE_BASELINES = os.environ.get("ACTRON_AIR_UPDATE_BASELINES") == "1"
+# Allowed slowdown against the baseline, generous for shared CI runners.
+TIME_TOLERANCE = 3.0
+MEMORY_TOLERANCE = 1.5
+# Within the account burst, so the rate limiter does not pace the fetches.
+FLEET_SYSTEMS = 8
+FLEET_ZONES = 8
+FLEET_PERIPHERALS = 4
+PUSH_ROUNDS = 20
+PLATFORM_MODULES = {
+    Platform.BINARY_SENSOR: binary_sensor,
+    Platform.CLIMATE: climate,
+    Platform.COVER: cover,
+    Platform.SENSOR: sensor,
+    Platform.SWITCH: switch,
+}
+
+
+def _check_baseline(name: str, value: float, *, higher_is_better: bool) -> None:
+    """Fail if value regressed against its baseline, or record it."""
+    if not RUN_BENCHMARKS and not UPDATE_BASELINES:
+        return
+    baselines: dict[str, float] = json.loads(BASELINES_PATH.read_text())
+    if UPDATE_BASELINES:
+        baselines[name] = round(value, 6)
+        BASELINES_PATH.write_text(json.dumps(baselines, indent=2) + "\n")
+        return
+    tolerance = MEMORY_TOLERANCE if name.startswith("memory") else TIME_TOLERANCE
+    baseline = baselines[name]
+    if higher_is_better:
+        assert value >= baseline / tolerance, f"{name}: {value} vs {baseline}"
+    else:
+        assert value <= baseline * tolerance, f"{name}: {value} vs {baseline}"
+
+
+async def _async_setup_fleet(
+    hass: HomeAssistant, api: FakeActronAirAPI
+) -> ActronAirConfigEntry:
+    """Set up the integration for a synthetic fleet."""
+    entry = mock_config_entry({CONF_PUSH_COALESCE_WINDOW: 0})
+    entry.add_to_hass(hass)
+    with (
+        patch("custom_components.actronair.api.ActronAirAPI", return_value=api),
+        patch.object(hass.config_entries, "async_forward_entry_setups"),
+    ):
+        assert await async_setup_entry(hass, entry)
+    return entry
+
+
+async def _async_add_entities(
+    hass: HomeAssistant, entry: ActronAirConfigEntry
+) -> list[Entity]:
+    """Add the entities of every forwarded platform to the state machine."""
+    added: list[Entity] = []
+    for platform in entry.runtime_data.platforms:
+        entities: list[Entity] = []
+        await PLATFORM_MODULES[platform].async_setup_entry(hass, entry, entities.extend)
+        await MockEntityPlatform(
+            hass, domain=platform, platform_name=DOMAIN
+        ).async_add_entities(entities)
+        added.extend(entities)
+    return added
+
+
+@pytest.fixture
+async def fleet_entry(
+    hass: HomeAssistant,
+) -> AsyncGenerator[tuple[ActronAirConfigEntry, FakeActronAirAPI]]:
+    """Set up a synthetic fleet with all of its entities."""
+    api = FakeActronAirAPI(FLEET_SYSTEMS, FLEET_ZONES, FLEET_PERIPHERALS)
+    entry = await _async_setup_fleet(hass, api)
+    await _async_add_entities(hass, entry)
+    await hass.async_block_till_done()
+    yield entry, api
+    await entry._async_process_on_unload(hass)
+
+
+async def test_benchmark_setup_time(hass: HomeAssistant) -> None:
+    """Benchmark setting up a fleet, best of three runs."""
+    durations = []
+    for _ in range(3):
+        api = FakeActronAirAPI(FLEET_SYSTEMS, FLEET_ZONES, FLEET_PERIPHERALS)
+        started = time.perf_counter()
+        entry = await _async_setup_fleet(hass, api)
+        durations.append(time.perf_counter() - started)
+        assert api.fetches == FLEET_SYSTEMS
+        await entry._async_process_on_unload(hass)
+        await hass.config_entries.async_remove(entry.entry_id)
+
+    _check_baseline("setup_time", min(durations), higher_is_better=False)
+
+
+async def test_benchmark_push_updates(
+    hass: HomeAssistant,
+    fleet_entry: tuple[ActronAirConfigEntry, FakeActronAirAPI],
+) -> None:
+    """Benchmark the cost of a push and the state writes it causes."""
+    _, api = fleet_entry
+    writes = 0
+
+    def count_write(_: Any) -> None:
+        nonlocal writes
+        writes += 1
+
+    unsub = hass.bus.async_listen(EVENT_STATE_CHANGED, count_write)
+    started = time.perf_counter()
+    for _ in range(PUSH_ROUNDS):
+        for serial in api.ticks:
+            api.push(serial)
+    await hass.async_block_till_done()
+    duration = time.perf_counter() - started
+    unsub()
+
+    pushes = PUSH_ROUNDS * FLEET_SYSTEMS
+    # Each tick moves the system and zone temperatures and the readings of
+    # every peripheral; throttled compressor sensors wait out their interval.
+    assert writes == pushes * (1 + FLEET_ZONES + 2 * FLEET_PERIPHERALS)
+    _check_baseline("push_update_time", duration / pushes, higher_is_better=False)
+    _check_baseline("state_writes_per_second", writes / duration, higher_is_better=True)
+
+
+@pytest.mark.skipif(
+    not RUN_BENCHMARKS and not UPDATE_BASELINES,
+    reason="Memory use is only benchmarked with ACTRON_AIR_BENCHMARKS=1",
+)
+async def test_benchmark_memory_per_system(hass: HomeAssistant) -> None:
+    """Benchmark the memory held per system once set up."""
+    api = FakeActronAirAPI(FLEET_SYSTEMS, FLEET_ZONES, FLEET_PERIPHERALS)
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        entry = await _async_setup_fleet(hass, api)
+        await _async_add_entities(hass, entry)
+        await hass.async_block_till_done()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+
+    _check_baseline(
+        "memory_per_system", allocated / FLEET_SYSTEMS, higher_is_better=False
+    )
+    await entry._async_process_on_unload(hass)
@@ -0,0 +1,90 @@
+"""Tests for Actron Air command handling."""
+
+from unittest.mock import Mock
+
+from freezegun.api import FrozenDateTimeFactory
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.actronair.coordinator import (
+    OPTIMISTIC_CONFIRM_TIMEOUT,
+    ActronAirSystemCoordinator,
+)
+
+from .common import mock_status, mock_system_coordinator
+
+
+def _coordinator(hass: HomeAssistant) -> ActronAirSystemCoordinator:
+    """Build a coordinator with one pending setpoint change to 20 degrees."""
+    coordinator = mock_system_coordinator(hass)
+    status = coordinator.data
+    before = coordinator.async_capture_settings()
+    # The API client updates its model once the command is accepted.
+    status.user_aircon_settings.temperature_setpoint_cool_c = 20.0
+    coordinator.async_expect_settings(status, before)
+    return coordinator
+
+
+def _setpoint(coordinator: ActronAirSystemCoordinator) -> float:
+    """Return the cooling setpoint shown by the coordinator."""
+    return coordinator.data.user_aircon_settings.temperature_setpoint_cool_c
+
+
+async def test_command_value_held_until_confirmed(hass: HomeAssistant) -> None:
+    """Test a stale snapshot does not undo a command before confirmation."""
+    coordinator = _coordinator(hass)
+
+    coordinator.async_set_polled_status(mock_status(setpoint=22.0))
+    assert _setpoint(coordinator) == 20.0
+    assert coordinator.pending_commands == 1
+
+    coordinator.async_set_polled_status(mock_status(setpoint=20.0))
+    assert _setpoint(coordinator) == 20.0
+    assert coordinator.pending_commands == 0
+    assert coordinator.confirmed_commands == 1
+    await coordinator.async_shutdown()
+
+
+async def test_command_value_superseded(hass: HomeAssistant) -> None:
+    """Test a value changed elsewhere replaces the held value."""
+    coordinator = _coordinator(hass)
+
+    coordinator.async_set_polled_status(mock_status(setpoint=24.0))
+    assert _setpoint(coordinator) == 24.0
+    assert coordinator.pending_commands == 0
+    assert coordinator.rolled_back_commands == 0
+
+
+async def test_unconfirmed_command_rolled_back(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test a value the cloud never reports is rolled back and refreshed."""
+    coordinator = _coordinator(hass)
+
+    freezer.tick(OPTIMISTIC_CONFIRM_TIMEOUT)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    assert _setpoint(coordinator) == 22.0
+    assert coordinator.pending_commands == 0
+    assert coordinator.rolled_back_commands == 1
+    coordinator.api.update_status.assert_awaited_once_with("abc1")
+    await coordinator.async_shutdown()
+
+
+async def test_commands_completing_together_update_once(
+    hass: HomeAssistant,
+) -> None:
+    """Test commands finishing in the same iteration notify listeners once."""
+    coordinator = _coordinator(hass)
+    listener = Mock()
+    coordinator.async_add_listener(listener)
+
+    for _ in range(8):
+        coordinator.async_schedule_command_update()
+    await hass.async_block_till_done()
+
+    assert listener.call_count == 1
+    assert coordinator.coalesced_command_updates == 7
+    await coordinator.async_shutdown()
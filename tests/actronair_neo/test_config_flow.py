@@ -16,9 +16,12 @@ from .const import DOMAIN
 @pytest.fixture
 def mock_actron_api():
     """Mock the ActronAirAPI class."""
-    with patch(
-        "custom_components.actronair.config_flow.ActronAirAPI", autospec=True
-    ) as mock_api:
+    with (
+        patch(
+            "custom_components.actronair.api.ActronAirAPI", autospec=True
+        ) as mock_api,
+        patch("custom_components.actronair.api.async_get_clientsession"),
+    ):
         yield mock_api
 
 
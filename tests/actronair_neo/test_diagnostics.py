@@ -0,0 +1,125 @@
+"""Tests for Actron Air diagnostics."""
+
+from unittest.mock import patch
+
+from actron_neo_api import ActronAirAPIError
+from actron_neo_api.models.system import ActronAirSystemInfo
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from custom_components.actronair.coordinator import (
+    ActronAirAccountCoordinator,
+    ActronAirRuntimeData,
+    ActronAirSystemCoordinator,
+)
+from custom_components.actronair.diagnostics import async_get_config_entry_diagnostics
+from custom_components.actronair.metrics import (
+    PUSH_RATE_WINDOW,
+    ActronAirConnectionStats,
+    ActronAirMetrics,
+)
+from custom_components.actronair.sensor import METRIC_SENSORS, ActronAirMetricSensor
+
+from .common import mock_api, mock_config_entry, mock_rate_limiter, mock_status
+
+
+def test_metrics_summaries() -> None:
+    """Test poll percentiles and the push rate window."""
+    metrics = ActronAirMetrics()
+    assert metrics.poll_duration(50) is None
+
+    for duration in range(1, 21):
+        metrics.record_poll(duration, duration / 2)
+    assert metrics.poll_duration(50) == 10
+    assert metrics.poll_duration(95) == 19
+    assert metrics.last_fetch_latency == 10
+
+    for second in range(10):
+        metrics.record_push(float(second))
+    assert metrics.push_rate(10.0) == 10 * 60 / PUSH_RATE_WINDOW
+    assert metrics.push_rate(PUSH_RATE_WINDOW + 10) == 0
+
+
+async def test_diagnostics_include_performance(hass: HomeAssistant) -> None:
+    """Test diagnostics carry each system with its performance metrics."""
+    serials = ["abc1", "abc2"]
+    api = mock_api(serials)
+    rate_limiter = mock_rate_limiter(serials)
+    entry = mock_config_entry()
+    coordinators = {
+        serial: ActronAirSystemCoordinator(
+            hass,
+            entry,
+            api,
+            rate_limiter,
+            ActronAirSystemInfo(serial=serial),
+            push_updates_enabled=False,
+        )
+        for serial in serials
+    }
+    account = ActronAirAccountCoordinator(hass, entry, api, rate_limiter, coordinators)
+    entry.runtime_data = ActronAirRuntimeData(
+        api=api,
+        rate_limiter=rate_limiter,
+        connection_stats=ActronAirConnectionStats(),
+        account_coordinator=account,
+        system_coordinators=coordinators,
+        push_updates_enabled=False,
+    )
+    await account._async_fetch(list(coordinators.values()), None)
+    api.update_status.side_effect = ActronAirAPIError("offline")
+    with pytest.raises(UpdateFailed):
+        await account._async_fetch([coordinators["abc2"]], "abc2")
+    coordinators["abc1"].handle_push_update(
+        api.state_manager.process_status_update("abc1", mock_status(setpoint=20))
+    )
+
+    # Live models are dumped on the loop so pushes cannot mutate them midway.
+    with patch.object(hass, "async_add_executor_job") as executor:
+        diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+    executor.assert_not_called()
+
+    assert diagnostics["coordinators"][0]["system"]["serial"] == "**REDACTED**"
+    assert "user_aircon_settings" in diagnostics["coordinators"][1]["status"]
+    performance = diagnostics["performance"]["coordinators"]
+    assert performance[0]["last_fetch_latency"] is not None
+    assert performance[0]["push_rate"] > 0
+    assert performance[1]["failed_updates"] == 1
+    assert performance[1]["push_rate"] == 0
+    assert diagnostics["performance"]["connections"]["reuse_ratio"] is None
+    assert diagnostics["performance"]["serialization_time"] >= 0
+    for coordinator in coordinators.values():
+        await coordinator.async_shutdown()
+
+
+async def test_metric_sensors(hass: HomeAssistant) -> None:
+    """Test metric sensors read the coordinator metrics and stay available."""
+    coordinator = ActronAirSystemCoordinator(
+        hass,
+        mock_config_entry(),
+        mock_api(["abc1"]),
+        mock_rate_limiter(["abc1"]),
+        ActronAirSystemInfo(serial="abc1"),
+        push_updates_enabled=False,
+    )
+    sensors = {
+        description.key: ActronAirMetricSensor(coordinator, description)
+        for description in METRIC_SENSORS
+    }
+    assert all(
+        not description.entity_registry_enabled_default
+        for description in METRIC_SENSORS
+    )
+    assert sensors["fan_out_time"].native_value is None
+
+    coordinator.async_set_polled_status(mock_status())
+    coordinator.metrics.record_command(0.25)
+    coordinator.available = False
+
+    assert sensors["fan_out_time"].native_value >= 0
+    assert sensors["command_latency"].native_value == 250
+    assert sensors["failed_updates"].native_value == 0
+    assert sensors["last_push"].native_value == coordinator.last_push
+    assert sensors["push_rate"].available
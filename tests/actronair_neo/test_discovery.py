@@ -0,0 +1,159 @@
+"""Tests for Actron Air discovery of new and removed hardware."""
+
+from unittest.mock import AsyncMock, patch
+
+from actron_neo_api import ActronAirStatus
+from actron_neo_api.models.system import ActronAirSystemInfo
+import pytest
+
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.entity import Entity
+
+from custom_components.actronair import (
+    async_remove_config_entry_device,
+    async_setup_entry,
+    sensor,
+)
+from custom_components.actronair.climate import ActronZoneClimate
+from custom_components.actronair.const import DOMAIN
+from custom_components.actronair.coordinator import (
+    ActronAirRuntimeData,
+    ActronAirSystemCoordinator,
+)
+from custom_components.actronair.metrics import ActronAirConnectionStats
+
+from .common import mock_api, mock_config_entry, mock_rate_limiter, mock_status
+
+
+def _status(peripherals: dict[str, float], firmware: str = "1.0") -> ActronAirStatus:
+    """Build a status with the given peripherals and controller firmware."""
+    status = mock_status(peripherals=peripherals)
+    status.ac_system.master_wc_firmware_version = firmware
+    return status
+
+
+async def test_hardware_is_discovered_and_goes_missing(
+    hass: HomeAssistant, device_registry: dr.DeviceRegistry
+) -> None:
+    """Test peripherals are added and go unavailable as the system reports them."""
+    api = mock_api([])
+    api.state_manager.process_status_update("abc1", _status({"SN1": 80}))
+    rate_limiter = mock_rate_limiter(["abc1"])
+    entry = mock_config_entry()
+    entry.add_to_hass(hass)
+    coordinator = ActronAirSystemCoordinator(
+        hass,
+        entry,
+        api,
+        rate_limiter,
+        ActronAirSystemInfo(serial="abc1"),
+        push_updates_enabled=False,
+    )
+    entry.runtime_data = ActronAirRuntimeData(
+        api=api,
+        rate_limiter=rate_limiter,
+        connection_stats=ActronAirConnectionStats(),
+        account_coordinator=AsyncMock(),
+        system_coordinators={"abc1": coordinator},
+        push_updates_enabled=False,
+    )
+    system_device = device_registry.async_get_or_create(
+        config_entry_id=entry.entry_id,
+        identifiers={(DOMAIN, "abc1")},
+        sw_version="1.0",
+    )
+    device_registry.async_get_or_create(
+        config_entry_id=entry.entry_id, identifiers={(DOMAIN, "SN1")}
+    )
+    entities: list[Entity] = []
+    await sensor.async_setup_entry(hass, entry, entities.extend)
+    added = len(entities)
+    assert sum(entity.unique_id.startswith("SN1_") for entity in entities) == len(
+        sensor.PERIPHERAL_SENSORS
+    )
+
+    # An unchanged status adds nothing and leaves the device untouched.
+    coordinator.async_set_polled_status(_status({"SN1": 80}))
+    assert len(entities) == added
+
+    coordinator.async_set_polled_status(_status({"SN1": 80, "SN2": 50}))
+    assert [entity.unique_id for entity in entities[added:]] == [
+        f"SN2_{description.key}" for description in sensor.PERIPHERAL_SENSORS
+    ]
+
+    # A missing sensor keeps its device, and its entities go unavailable.
+    coordinator.async_set_polled_status(_status({"SN2": 50}, firmware="2.0"))
+    sensor_device = device_registry.async_get_device(identifiers={(DOMAIN, "SN1")})
+    assert sensor_device is not None
+    assert not any(
+        entity.available for entity in entities if entity.unique_id.startswith("SN1_")
+    )
+    assert device_registry.async_get(system_device.id).sw_version == "2.0"
+    assert coordinator.device_identifiers() == {"abc1", "abc1_zone_0", "SN2"}
+    assert await async_remove_config_entry_device(hass, entry, sensor_device)
+
+    # Coming back restores its entities without adding them again.
+    added = len(entities)
+    coordinator.async_set_polled_status(_status({"SN1": 80, "SN2": 50}))
+    assert len(entities) == added
+    assert all(entity.available for entity in entities)
+    await entry._async_process_on_unload(hass)
+    await coordinator.async_shutdown()
+
+
+async def test_first_zone_reloads_for_new_platforms(hass: HomeAssistant) -> None:
+    """Test a system without zones reloads once a zone appears."""
+    api = mock_api([])
+    api.state_manager.process_status_update("abc1", mock_status(zone_count=0))
+    api.get_ac_systems = AsyncMock(return_value=[ActronAirSystemInfo(serial="abc1")])
+    api.start_push = AsyncMock(return_value=False)
+    entry = mock_config_entry()
+    entry.add_to_hass(hass)
+
+    with (
+        patch("custom_components.actronair.api.ActronAirAPI", return_value=api),
+        patch.object(hass.config_entries, "async_forward_entry_setups"),
+        patch.object(hass.config_entries, "async_schedule_reload") as mock_reload,
+    ):
+        assert await async_setup_entry(hass, entry)
+        assert Platform.COVER not in entry.runtime_data.platforms
+        coordinator = entry.runtime_data.system_coordinators["abc1"]
+
+        coordinator.async_set_polled_status(mock_status(zone_count=0))
+        mock_reload.assert_not_called()
+        coordinator.async_set_polled_status(mock_status(zone_count=1))
+
+    mock_reload.assert_called_once_with(entry.entry_id)
+    await entry._async_process_on_unload(hass)
+
+
+async def test_missing_zone_is_unavailable(hass: HomeAssistant) -> None:
+    """Test a zone entity is unavailable once its zone is no longer reported."""
+    api = mock_api([])
+    api.state_manager.process_status_update("abc1", mock_status(zone_count=2))
+    coordinator = ActronAirSystemCoordinator(
+        hass,
+        mock_config_entry(),
+        api,
+        mock_rate_limiter(["abc1"]),
+        ActronAirSystemInfo(serial="abc1"),
+        push_updates_enabled=False,
+    )
+    zone = ActronZoneClimate(coordinator, coordinator.data.remote_zone_info[1])
+    assert zone.available
+
+    coordinator.async_set_polled_status(mock_status(zone_count=1))
+    assert not zone.available
+    assert zone.current_temperature is None
+    assert (zone.min_temp, zone.max_temp) == (
+        coordinator.data.min_temp,
+        coordinator.data.max_temp,
+    )
+    with pytest.raises(ServiceValidationError) as err:
+        await zone.async_set_temperature(temperature=21)
+    assert err.value.translation_key == "zone_not_found"
+    assert err.value.translation_placeholders == {"zone": zone.device_info["name"]}
+    await coordinator.async_shutdown()
@@ -0,0 +1,80 @@
+"""Tests for the Actron Air compressor energy sensor."""
+
+from datetime import timedelta
+
+from freezegun.api import FrozenDateTimeFactory
+from pytest_homeassistant_custom_component.common import (
+    async_fire_time_changed,
+    mock_restore_cache_with_extra_data,
+)
+
+from homeassistant.core import HomeAssistant, State
+from homeassistant.util import dt as dt_util
+
+from custom_components.actronair.const import CONF_PUSH_COALESCE_WINDOW
+from custom_components.actronair.coordinator import ActronAirEnergyMeter
+from custom_components.actronair.sensor import ENERGY_SENSOR, ActronAirEnergySensor
+
+from .common import mock_push_status, mock_system_coordinator
+
+
+def test_energy_meter_holds_readings_up_to_max_gap() -> None:
+    """Test readings are held until the next sample, capped at max_gap."""
+    meter = ActronAirEnergyMeter()
+    meter.add_sample(3600, 0, 300)
+    assert meter.energy == 0
+
+    meter.add_sample(1800, 100, 300)
+    assert meter.energy == 0.1
+
+    # Nothing is counted past max_gap while the system is silent.
+    meter.add_sample(0, 1100, 300)
+    assert meter.energy == 0.25
+
+    meter.restore(1.0)
+    meter.restore(1.0)
+    assert meter.energy == 1.25
+
+
+async def test_energy_counts_coalesced_pushes(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test every push in a coalesced burst is integrated."""
+    coordinator = mock_system_coordinator(
+        hass, {CONF_PUSH_COALESCE_WINDOW: 0.25}, push=True
+    )
+    coordinator.handle_push_update(mock_push_status(compressor_power=3600))
+    freezer.tick(timedelta(seconds=0.1))
+    coordinator.handle_push_update(mock_push_status(compressor_power=0, setpoint=21.0))
+    freezer.tick(timedelta(seconds=0.1))
+    coordinator.handle_push_update(mock_push_status(compressor_power=0, setpoint=20.0))
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+
+    assert coordinator.coalesced_pushes == 2
+    assert round(coordinator.energy_meter.energy * 3_600_000) == 360
+    await coordinator.async_shutdown()
+
+
+async def test_energy_sensor_restores_total(hass: HomeAssistant) -> None:
+    """Test the energy sensor continues from the total before a restart."""
+    mock_restore_cache_with_extra_data(
+        hass,
+        [
+            (
+                State("sensor.compressor_energy", "12.5"),
+                {"native_value": 12.5, "native_unit_of_measurement": "kWh"},
+            )
+        ],
+    )
+    coordinator = mock_system_coordinator(
+        hass, {CONF_PUSH_COALESCE_WINDOW: 0.25}, push=True
+    )
+    sensor = ActronAirEnergySensor(coordinator, ENERGY_SENSOR)
+    sensor.hass = hass
+    sensor.entity_id = "sensor.compressor_energy"
+
+    await sensor.async_added_to_hass()
+
+    assert sensor.native_value == 12.5
+    await coordinator.async_shutdown()
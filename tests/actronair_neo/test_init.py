@@ -0,0 +1,185 @@
+"""Tests for Actron Air setup."""
+
+import asyncio
+from datetime import timedelta
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+from actron_neo_api import ActronAirAPIError
+from actron_neo_api.models.system import ActronAirSystemInfo
+import pytest
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util import dt as dt_util
+
+from custom_components.actronair import STARTUP_CONCURRENCY, async_setup_entry
+from custom_components.actronair.cache import (
+    CACHED_STATE_SECTIONS,
+    SAVE_DELAY,
+    STORAGE_VERSION,
+    ActronAirStatusCache,
+)
+from custom_components.actronair.const import DOMAIN
+
+from .common import mock_api, mock_config_entry, mock_status
+
+
+async def test_setup_fetches_each_system_once_in_parallel(
+    hass: HomeAssistant,
+) -> None:
+    """Test startup fetches every system once, concurrently up to the cap."""
+    serials = [f"abc{index}" for index in range(STARTUP_CONCURRENCY + 2)]
+    api = mock_api(serials)
+    api.get_ac_systems = AsyncMock(
+        return_value=[ActronAirSystemInfo(serial=serial) for serial in serials]
+    )
+    api.start_push = AsyncMock(return_value=False)
+    running = 0
+    most_running = 0
+
+    async def update_status(serial_number: str | None = None) -> None:
+        nonlocal running, most_running
+        running += 1
+        most_running = max(most_running, running)
+        await asyncio.sleep(0)
+        running -= 1
+
+    api.update_status = AsyncMock(side_effect=update_status)
+    entry = mock_config_entry()
+    entry.add_to_hass(hass)
+
+    with (
+        patch(
+            "custom_components.actronair.api.ActronAirAPI", return_value=api
+        ) as mock_api_class,
+        patch.object(hass.config_entries, "async_forward_entry_setups"),
+    ):
+        assert await async_setup_entry(hass, entry)
+
+    session = mock_api_class.call_args.kwargs["session"]
+    assert session.connector is async_get_clientsession(hass).connector
+    assert sorted(call.args[0] for call in api.update_status.await_args_list) == (
+        serials
+    )
+    assert most_running == STARTUP_CONCURRENCY
+    api.start_push.assert_awaited_once_with(serials)
+    assert set(entry.runtime_data.system_coordinators) == set(serials)
+    assert set(entry.runtime_data.setup_timings) == {"discovery", "status", "total"}
+    await entry._async_process_on_unload(hass)
+
+
+async def test_failed_setup_stops_push(hass: HomeAssistant) -> None:
+    """Test push started alongside a failed status fetch is stopped again."""
+    api = mock_api(["abc1"])
+    api.get_ac_systems = AsyncMock(return_value=[ActronAirSystemInfo(serial="abc1")])
+    api.start_push = AsyncMock(return_value=True)
+    api.stop_push = AsyncMock()
+    api.update_status = AsyncMock(side_effect=ActronAirAPIError("offline"))
+    entry = mock_config_entry()
+    entry.add_to_hass(hass)
+
+    with (
+        patch("custom_components.actronair.api.ActronAirAPI", return_value=api),
+        pytest.raises(ConfigEntryNotReady),
+    ):
+        await async_setup_entry(hass, entry)
+
+    api.start_push.assert_awaited_once()
+    api.stop_push.assert_awaited_once()
+
+
+async def test_setup_warm_starts_from_cache(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test entities are set up from the cache while the cloud is slow."""
+    entry = mock_config_entry()
+    entry.add_to_hass(hass)
+    hass_storage[f"{DOMAIN}.{entry.entry_id}"] = {
+        "version": STORAGE_VERSION,
+        "key": f"{DOMAIN}.{entry.entry_id}",
+        "data": {
+            "systems": [{"serial": "abc1"}],
+            "statuses": {
+                "abc1": {
+                    "last_seen": dt_util.utcnow().isoformat(),
+                    "status": mock_status(setpoint=19.0).model_dump(by_alias=True),
+                }
+            },
+        },
+    }
+    api = mock_api([])
+    cloud_ready = asyncio.Event()
+
+    async def get_ac_systems() -> list[ActronAirSystemInfo]:
+        await cloud_ready.wait()
+        return [ActronAirSystemInfo(serial="abc1")]
+
+    api.get_ac_systems = AsyncMock(side_effect=get_ac_systems)
+    api.start_push = AsyncMock(return_value=True)
+
+    async def update_status(serial_number: str) -> None:
+        api.state_manager.process_status_update(serial_number, mock_status())
+
+    api.update_status = AsyncMock(side_effect=update_status)
+
+    with (
+        patch("custom_components.actronair.api.ActronAirAPI", return_value=api),
+        patch.object(hass.config_entries, "async_forward_entry_setups"),
+    ):
+        assert await async_setup_entry(hass, entry)
+        coordinator = entry.runtime_data.system_coordinators["abc1"]
+        assert entry.runtime_data.warm_start
+        assert coordinator.data.user_aircon_settings.temperature_setpoint_cool_c == 19
+        assert not coordinator.push_updates_enabled
+        api.update_status.assert_not_awaited()
+
+        # Cached statuses are not polled or refreshed before the cloud answers.
+        account_coordinator = entry.runtime_data.account_coordinator
+        assert account_coordinator.update_interval is None
+        last_seen = coordinator.last_seen
+        await account_coordinator.async_refresh()
+        api.update_status.assert_not_awaited()
+        assert coordinator.last_seen == last_seen
+
+        cloud_ready.set()
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert coordinator.data.user_aircon_settings.temperature_setpoint_cool_c == 22
+    assert coordinator.push_updates_enabled
+    api.update_status.assert_awaited_once_with("abc1")
+    assert "live" in entry.runtime_data.setup_timings
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=SAVE_DELAY))
+    await hass.async_block_till_done()
+    cached = hass_storage[f"{DOMAIN}.{entry.entry_id}"]["data"]["statuses"]["abc1"]
+    assert set(cached["status"]["lastKnownState"]) <= set(CACHED_STATE_SECTIONS)
+    await entry._async_process_on_unload(hass)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"systems": [{"serial": "abc1"}]},
+        {"systems": [{"serial": ["abc1"]}], "statuses": {}},
+        {
+            "systems": [{"serial": "abc1"}],
+            "statuses": {"abc1": {"last_seen": "yesterday", "status": {}}},
+        },
+        {"systems": None, "statuses": {}},
+    ],
+)
+async def test_unreadable_cache_is_ignored(
+    hass: HomeAssistant, hass_storage: dict[str, Any], data: dict[str, Any]
+) -> None:
+    """Test a cache in an unexpected shape falls back to a cold start."""
+    entry = mock_config_entry()
+    hass_storage[f"{DOMAIN}.{entry.entry_id}"] = {
+        "version": STORAGE_VERSION,
+        "key": f"{DOMAIN}.{entry.entry_id}",
+        "data": data,
+    }
+
+    assert await ActronAirStatusCache(hass, entry.entry_id).async_load() is None
@@ -0,0 +1,115 @@
+"""Import and setup guards for Actron Air.
+
+The time budgets are only checked with ACTRON_AIR_BENCHMARKS=1.
+"""
+
+import subprocess
+import sys
+import time
+from unittest.mock import AsyncMock, patch
+
+from actron_neo_api.models.system import ActronAirSystemInfo
+
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant
+
+from custom_components.actronair import PLATFORMS, async_setup_entry
+
+from .common import RUN_BENCHMARKS, mock_api, mock_config_entry, mock_status
+
+IMPORT_BUDGET = 0.25
+SETUP_BUDGET = 1.0
+# Within the account burst, so the rate limiter does not pace the fetches.
+FLEET_SIZE = 8
+FLEET_ZONES = 8
+
+IMPORT_SCRIPT = """
+import sys
+import time
+
+import actron_neo_api
+import homeassistant.config_entries
+import homeassistant.helpers.event
+import homeassistant.helpers.storage
+import homeassistant.helpers.update_coordinator
+
+started = time.perf_counter()
+import custom_components.actronair
+
+print(time.perf_counter() - started)
+print(",".join(sorted(sys.modules)))
+"""
+
+
+def test_import_time() -> None:
+    """Test importing the integration adds little on top of its dependencies."""
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    duration, modules = result.stdout.splitlines()
+
+    # Platforms are imported by Home Assistant only when forwarded.
+    assert not {
+        f"custom_components.actronair.{platform}" for platform in PLATFORMS
+    } & set(modules.split(","))
+    if RUN_BENCHMARKS:
+        assert float(duration) < IMPORT_BUDGET
+
+
+def _fleet_api(zone_count: int) -> AsyncMock:
+    """Build an API for a fleet of systems with zone_count zones each."""
+    serials = [f"abc{index}" for index in range(FLEET_SIZE)]
+    api = mock_api([])
+    for serial in serials:
+        api.state_manager.process_status_update(
+            serial, mock_status(zone_count=zone_count)
+        )
+    api.get_ac_systems = AsyncMock(
+        return_value=[ActronAirSystemInfo(serial=serial) for serial in serials]
+    )
+    api.start_push = AsyncMock(return_value=True)
+    return api
+
+
+async def test_setup_time(hass: HomeAssistant) -> None:
+    """Test setting up a large fleet fetches each system once, within budget."""
+    entry = mock_config_entry()
+    entry.add_to_hass(hass)
+    api = _fleet_api(FLEET_ZONES)
+
+    with (
+        patch("custom_components.actronair.api.ActronAirAPI", return_value=api),
+        patch.object(hass.config_entries, "async_forward_entry_setups") as forward,
+    ):
+        started = time.perf_counter()
+        assert await async_setup_entry(hass, entry)
+        duration = time.perf_counter() - started
+
+    assert api.update_status.await_count == FLEET_SIZE
+    api.get_ac_systems.assert_awaited_once()
+    forward.assert_called_once()
+    assert Platform.COVER in forward.call_args.args[1]
+    if RUN_BENCHMARKS:
+        assert duration < SETUP_BUDGET
+    await entry._async_process_on_unload(hass)
+
+
+async def test_setup_skips_platforms_without_entities(hass: HomeAssistant) -> None:
+    """Test the cover platform is not loaded for systems without zones."""
+    entry = mock_config_entry()
+    entry.add_to_hass(hass)
+
+    with (
+        patch(
+            "custom_components.actronair.api.ActronAirAPI", return_value=_fleet_api(0)
+        ),
+        patch.object(hass.config_entries, "async_forward_entry_setups") as forward,
+    ):
+        assert await async_setup_entry(hass, entry)
+
+    assert Platform.COVER not in forward.call_args.args[1]
+    assert Platform.CLIMATE in forward.call_args.args[1]
+    await entry._async_process_on_unload(hass)
@@ -0,0 +1,193 @@
+"""Tests for Actron Air polling."""
+
+import asyncio
+from unittest.mock import Mock
+
+from actron_neo_api import ActronAirAPIError
+from actron_neo_api.models.system import ActronAirSystemInfo
+from freezegun.api import FrozenDateTimeFactory
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.actronair.coordinator import (
+    SCAN_INTERVAL,
+    SCAN_INTERVAL_ACTIVE,
+    SCAN_INTERVAL_IDLE,
+    ActronAirAccountCoordinator,
+    ActronAirPollScheduler,
+    ActronAirSystemCoordinator,
+)
+
+from .common import mock_api, mock_config_entry, mock_rate_limiter, mock_status
+
+
+def test_first_sample_uses_default_interval() -> None:
+    """Test the scheduler starts at the default interval."""
+    scheduler = ActronAirPollScheduler()
+
+    assert scheduler.observe(mock_status()) == SCAN_INTERVAL
+
+
+def test_running_compressor_polls_fast() -> None:
+    """Test a running compressor switches to the active interval."""
+    scheduler = ActronAirPollScheduler()
+
+    assert scheduler.observe(mock_status(is_on=True, compressor_on=True)) == (
+        SCAN_INTERVAL_ACTIVE
+    )
+
+
+def test_changes_poll_fast() -> None:
+    """Test setpoint and zone temperature changes switch to the active interval."""
+    scheduler = ActronAirPollScheduler()
+    scheduler.observe(mock_status())
+
+    assert scheduler.observe(mock_status(setpoint=21.0)) == SCAN_INTERVAL_ACTIVE
+    assert scheduler.observe(mock_status(setpoint=21.0, zone_temperature=24.5)) == (
+        SCAN_INTERVAL_ACTIVE
+    )
+
+
+def test_small_zone_temperature_jitter_is_ignored() -> None:
+    """Test zone temperature noise does not count as activity."""
+    scheduler = ActronAirPollScheduler()
+    scheduler.observe(mock_status(is_on=True))
+
+    assert scheduler.observe(mock_status(is_on=True, zone_temperature=24.1)) == (
+        SCAN_INTERVAL
+    )
+
+
+def test_idle_system_backs_off() -> None:
+    """Test an idle system backs off to the idle interval and recovers."""
+    scheduler = ActronAirPollScheduler()
+    scheduler.observe(mock_status())
+
+    intervals = [scheduler.observe(mock_status()) for _ in range(6)]
+
+    assert intervals[0] == SCAN_INTERVAL * 2
+    assert intervals == sorted(intervals)
+    assert intervals[-1] == SCAN_INTERVAL_IDLE
+    assert scheduler.observe(mock_status(is_on=True)) == SCAN_INTERVAL_ACTIVE
+
+
+def _coordinators(
+    hass: HomeAssistant, api: Mock, serials: list[str]
+) -> dict[str, ActronAirSystemCoordinator]:
+    """Build polling system coordinators for the given systems."""
+    return {
+        serial: ActronAirSystemCoordinator(
+            hass,
+            mock_config_entry(),
+            api,
+            mock_rate_limiter(serials),
+            ActronAirSystemInfo(serial=serial),
+            push_updates_enabled=False,
+        )
+        for serial in serials
+    }
+
+
+def _account(
+    hass: HomeAssistant,
+    api: Mock,
+    coordinators: dict[str, ActronAirSystemCoordinator],
+) -> ActronAirAccountCoordinator:
+    """Build the account coordinator polling the given system coordinators."""
+    return ActronAirAccountCoordinator(
+        hass,
+        mock_config_entry(),
+        api,
+        mock_rate_limiter(list(coordinators)),
+        coordinators,
+    )
+
+
+async def test_account_poll_batches_all_systems(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test one batched fetch refreshes every system and fans out."""
+    serials = ["abc1", "abc2", "abc3"]
+    api = mock_api(serials)
+    coordinators = _coordinators(hass, api, serials)
+    account = _account(hass, api, coordinators)
+    listeners = {serial: Mock() for serial in serials}
+    for serial, coordinator in coordinators.items():
+        coordinator.async_add_listener(listeners[serial])
+
+    assert account.update_interval == SCAN_INTERVAL
+
+    freezer.tick(SCAN_INTERVAL)
+    await account.async_refresh()
+
+    api.update_status.assert_awaited_once_with(None)
+    for listener in listeners.values():
+        listener.assert_called_once()
+    for coordinator in coordinators.values():
+        await coordinator.async_shutdown()
+
+
+async def test_account_poll_skips_systems_not_due(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test systems backing off are left out of the fetch."""
+    serials = ["abc1", "abc2"]
+    api = mock_api(serials)
+    coordinators = _coordinators(hass, api, serials)
+    coordinators["abc2"].poll_scheduler.interval = SCAN_INTERVAL_IDLE
+    account = _account(hass, api, coordinators)
+
+    freezer.tick(SCAN_INTERVAL)
+    await account.async_refresh()
+
+    api.update_status.assert_awaited_once_with("abc1")
+
+
+async def test_account_fetches_due_systems_together(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test systems due together are fetched concurrently, failures apart."""
+    serials = ["abc1", "abc2", "abc3"]
+    api = mock_api(serials)
+    coordinators = _coordinators(hass, api, serials)
+    coordinators["abc3"].poll_scheduler.interval = SCAN_INTERVAL_IDLE
+    account = _account(hass, api, coordinators)
+    listeners = {serial: Mock() for serial in serials}
+    for serial, coordinator in coordinators.items():
+        coordinator.async_add_listener(listeners[serial])
+    running = 0
+    most_running = 0
+
+    async def update_status(serial_number: str | None = None) -> None:
+        nonlocal running, most_running
+        running += 1
+        most_running = max(most_running, running)
+        await asyncio.sleep(0)
+        running -= 1
+        if serial_number == "abc2":
+            raise ActronAirAPIError("offline")
+
+    api.update_status.side_effect = update_status
+    freezer.tick(SCAN_INTERVAL)
+    await account.async_refresh()
+
+    assert most_running == 2
+    assert not account.last_update_success
+    listeners["abc1"].assert_called_once()
+    listeners["abc2"].assert_called_once()
+    listeners["abc3"].assert_not_called()
+    assert coordinators["abc1"].metrics.failed_updates == 0
+    assert coordinators["abc2"].metrics.failed_updates == 1
+    for coordinator in coordinators.values():
+        await coordinator.async_shutdown()
+
+
+async def test_account_does_not_poll_push_systems(hass: HomeAssistant) -> None:
+    """Test the account coordinator stays idle when every system pushes."""
+    api = mock_api(["abc1"])
+    coordinators = _coordinators(hass, api, ["abc1"])
+    coordinators["abc1"].push_updates_enabled = True
+
+    account = _account(hass, api, coordinators)
+
+    assert account.update_interval is None
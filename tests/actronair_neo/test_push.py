@@ -0,0 +1,121 @@
+"""Tests for Actron Air realtime push handling."""
+
+from datetime import timedelta
+from unittest.mock import Mock
+
+from actron_neo_api.models.system import ActronAirSystemInfo
+from freezegun.api import FrozenDateTimeFactory
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.actronair.const import CONF_PUSH_COALESCE_WINDOW
+from custom_components.actronair.coordinator import (
+    PUSH_COALESCE_MAX_WINDOW,
+    PUSH_COALESCE_MIN_WINDOW,
+    PUSH_LIVENESS_TIMEOUT,
+    ActronAirAccountCoordinator,
+    ActronAirPushWindowTuner,
+    ActronAirSystemCoordinator,
+)
+
+from .common import (
+    mock_api,
+    mock_config_entry,
+    mock_push_status,
+    mock_rate_limiter,
+    mock_status,
+    mock_system_coordinator,
+)
+
+
+async def test_duplicate_push_is_dropped(hass: HomeAssistant) -> None:
+    """Test a push repeating the current snapshot does not fan out."""
+    coordinator = mock_system_coordinator(
+        hass, {CONF_PUSH_COALESCE_WINDOW: 0}, push=True
+    )
+    listener = Mock()
+    coordinator.async_add_listener(listener)
+
+    coordinator.handle_push_update(mock_push_status())
+    assert listener.call_count == 0
+    assert coordinator.duplicate_pushes == 1
+
+    coordinator.handle_push_update(mock_push_status(setpoint=21.0))
+    coordinator.handle_push_update(mock_push_status(setpoint=21.0))
+    assert listener.call_count == 1
+    assert coordinator.duplicate_pushes == 2
+    await coordinator.async_shutdown()
+
+
+async def test_push_burst_is_coalesced(hass: HomeAssistant) -> None:
+    """Test a burst of pushes results in one fan-out of the latest status."""
+    coordinator = mock_system_coordinator(
+        hass, {CONF_PUSH_COALESCE_WINDOW: 0.25}, push=True
+    )
+    listener = Mock()
+    coordinator.async_add_listener(listener)
+
+    for setpoint in (21.0, 20.5, 20.0):
+        coordinator.handle_push_update(mock_push_status(setpoint=setpoint))
+    assert listener.call_count == 0
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+
+    assert listener.call_count == 1
+    assert coordinator.coalesced_pushes == 2
+    assert coordinator.data.user_aircon_settings.temperature_setpoint_cool_c == 20.0
+    await coordinator.async_shutdown()
+
+
+def test_push_window_tuner() -> None:
+    """Test the window follows the gaps inside bursts."""
+    tuner = ActronAirPushWindowTuner(0.25)
+
+    assert tuner.observe(0.0) == 0.25
+    assert tuner.observe(0.1) == 0.2
+    assert tuner.observe(10.0) == 0.2
+    assert tuner.observe(10.001) >= PUSH_COALESCE_MIN_WINDOW
+    for second in range(20, 30):
+        tuner.observe(second + 0.0)
+        tuner.observe(second + 0.9)
+    assert tuner.window <= PUSH_COALESCE_MAX_WINDOW
+
+
+async def test_quiet_push_falls_back_to_polling(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test a quiet system is polled on its own until pushes resume."""
+    api = mock_api(["abc1", "abc2"])
+    entry = mock_config_entry({CONF_PUSH_COALESCE_WINDOW: 0})
+    rate_limiter = mock_rate_limiter(["abc1", "abc2"])
+    coordinators = {
+        serial: ActronAirSystemCoordinator(
+            hass, entry, api, rate_limiter, ActronAirSystemInfo(serial=serial), True
+        )
+        for serial in ("abc1", "abc2")
+    }
+    account = ActronAirAccountCoordinator(hass, entry, api, rate_limiter, coordinators)
+    assert account.update_interval is None
+
+    freezer.tick(PUSH_LIVENESS_TIMEOUT / 2)
+    coordinators["abc1"].handle_push_update(mock_push_status())
+    freezer.tick(PUSH_LIVENESS_TIMEOUT / 2)
+    await account.async_check_push_liveness(dt_util.utcnow())
+
+    assert coordinators["abc1"].push_updates_enabled
+    assert not coordinators["abc2"].push_updates_enabled
+    assert coordinators["abc2"].push_fallbacks == 1
+    assert account.update_interval is not None
+    api.update_status.assert_awaited_once_with("abc2")
+
+    pushed = mock_status()
+    pushed.serial_number = "abc2"
+    coordinators["abc2"].handle_push_update(pushed)
+    await account.async_check_push_liveness(dt_util.utcnow())
+
+    assert coordinators["abc2"].push_updates_enabled
+    assert account.update_interval is None
+    await account.async_shutdown()
@@ -0,0 +1,165 @@
+"""Tests for Actron Air rate limiting."""
+
+import asyncio
+from collections.abc import Generator
+from unittest.mock import AsyncMock, patch
+
+from actron_neo_api import ActronAirAPIError
+import pytest
+
+from custom_components.actronair.ratelimit import (
+    MAX_THROTTLE_RETRIES,
+    SYSTEM_BURST,
+    SYSTEM_RATE,
+    ActronAirRateLimiter,
+    ActronAirTokenBucket,
+)
+
+# The real sleep, to yield to the event loop while asyncio.sleep is faked.
+REAL_SLEEP = asyncio.sleep
+
+
+class FakeClock:
+    """Monotonic clock that only moves when the limiter sleeps."""
+
+    def __init__(self) -> None:
+        """Initialize the clock."""
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        """Return the current time."""
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        """Advance the clock instead of sleeping."""
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+@pytest.fixture(autouse=True)
+def clock() -> Generator[FakeClock]:
+    """Run the limiter on a fake clock."""
+    fake = FakeClock()
+    with (
+        patch("custom_components.actronair.ratelimit.time.monotonic", fake.monotonic),
+        patch("custom_components.actronair.ratelimit.asyncio.sleep", fake.sleep),
+    ):
+        yield fake
+
+
+def test_token_bucket_refills(clock: FakeClock) -> None:
+    """Test tokens are taken and refilled at the bucket rate."""
+    bucket = ActronAirTokenBucket(rate=1.0, capacity=2)
+    now = clock.now
+    bucket.take(now, 2)
+
+    assert bucket.tokens(now) == 0
+    assert bucket.delay(now, 1) == 1.0
+    assert bucket.delay(now, 1, factor=0.5) == 2.0
+    assert bucket.tokens(now + 5) == 2
+
+
+async def test_calls_wait_for_tokens(clock: FakeClock) -> None:
+    """Test calls beyond the burst wait in line instead of failing."""
+    limiter = ActronAirRateLimiter(["abc1"], 0)
+    func = AsyncMock(return_value="ok")
+
+    for _ in range(SYSTEM_BURST + 1):
+        assert await limiter.async_call(func, "abc1") == "ok"
+
+    assert func.await_count == SYSTEM_BURST + 1
+    assert clock.sleeps == [pytest.approx(1 / SYSTEM_RATE)]
+    assert limiter.queue_depth == 0
+
+
+async def test_empty_bucket_only_holds_up_its_system(clock: FakeClock) -> None:
+    """Test a system waiting for tokens does not hold up other systems."""
+    limiter = ActronAirRateLimiter(["abc1", "abc2"], 0)
+    func = AsyncMock()
+    for _ in range(SYSTEM_BURST):
+        await limiter.async_call(func, "abc1")
+    sleeping = asyncio.Event()
+    resume = asyncio.Event()
+
+    async def sleep(delay: float) -> None:
+        sleeping.set()
+        await resume.wait()
+        clock.now += delay
+
+    with patch("custom_components.actronair.ratelimit.asyncio.sleep", sleep):
+        waiting = asyncio.create_task(limiter.async_call(func, "abc1"))
+        await sleeping.wait()
+        other = asyncio.create_task(limiter.async_call(func, "abc2"))
+        await REAL_SLEEP(0)
+        assert other.done()
+        assert not waiting.done()
+        assert limiter.queue_depth == 1
+
+        resume.set()
+        await waiting
+
+    assert func.await_count == SYSTEM_BURST + 2
+
+
+async def test_commands_share_a_token() -> None:
+    """Test commands within the collection window share one token."""
+    limiter = ActronAirRateLimiter(["abc1"], 60)
+    func = AsyncMock()
+
+    for _ in range(SYSTEM_BURST * 2):
+        await limiter.async_call(func, "abc1", command=True)
+
+    assert limiter.system_tokens("abc1") == SYSTEM_BURST - 1
+
+
+async def test_throttling_pauses_granted_commands(clock: FakeClock) -> None:
+    """Test commands sharing a token still wait out a throttling pause."""
+    limiter = ActronAirRateLimiter(["abc1", "abc2"], 60)
+    func = AsyncMock()
+    await limiter.async_call(func, "abc1", command=True)
+    sleeping = asyncio.Event()
+    resume = asyncio.Event()
+
+    async def sleep(delay: float) -> None:
+        sleeping.set()
+        await resume.wait()
+        clock.now += delay
+
+    throttled = AsyncMock(side_effect=[ActronAirAPIError("Status: 429"), None])
+    with patch("custom_components.actronair.ratelimit.asyncio.sleep", sleep):
+        retrying = asyncio.create_task(limiter.async_call(throttled, "abc2"))
+        await sleeping.wait()
+        command = asyncio.create_task(limiter.async_call(func, "abc1", command=True))
+        await REAL_SLEEP(0)
+        assert not command.done()
+
+        resume.set()
+        await asyncio.gather(retrying, command)
+
+    assert func.await_count == 2
+
+
+async def test_throttling_slows_down_and_retries(clock: FakeClock) -> None:
+    """Test a throttled call pauses, lowers the rate and is retried."""
+    limiter = ActronAirRateLimiter(["abc1"], 0)
+    func = AsyncMock(
+        side_effect=[ActronAirAPIError("Status: 429, Retry-After: 7"), "ok"]
+    )
+
+    assert await limiter.async_call(func, "abc1") == "ok"
+
+    assert limiter.throttled_responses == 1
+    assert limiter.rate_factor == pytest.approx(0.55)
+    assert clock.sleeps == [pytest.approx(7)]
+
+
+async def test_persistent_throttling_raises() -> None:
+    """Test the error is raised once retries are exhausted."""
+    limiter = ActronAirRateLimiter(["abc1"], 0)
+    func = AsyncMock(side_effect=ActronAirAPIError("Status: 429"))
+
+    with pytest.raises(ActronAirAPIError):
+        await limiter.async_call(func, "abc1")
+
+    assert func.await_count == MAX_THROTTLE_RETRIES + 1
@@ -0,0 +1,240 @@
+"""Tests for the Actron Air services."""
+
+from unittest.mock import AsyncMock, call
+
+from actron_neo_api.models.system import ActronAirSystemInfo
+import pytest
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import ATTR_DEVICE_ID
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import device_registry as dr
+
+from custom_components.actronair.const import DOMAIN
+from custom_components.actronair.coordinator import (
+    ActronAirRuntimeData,
+    ActronAirSystemCoordinator,
+)
+from custom_components.actronair.metrics import ActronAirConnectionStats
+from custom_components.actronair.services import (
+    ATTR_ZONES,
+    SERVICE_RESTORE,
+    SERVICE_SET_ZONES,
+    SERVICE_SNAPSHOT,
+    async_setup_services,
+)
+
+from .common import mock_api, mock_config_entry, mock_rate_limiter, mock_status
+
+
+@pytest.fixture
+async def system(
+    hass: HomeAssistant, device_registry: dr.DeviceRegistry
+) -> tuple[ActronAirSystemCoordinator, str]:
+    """Set up a loaded entry with one three zone system and its device."""
+    api = mock_api([])
+    api.state_manager.process_status_update("abc1", mock_status(zone_count=3))
+    api.send_command = AsyncMock()
+    rate_limiter = mock_rate_limiter(["abc1"])
+    entry = mock_config_entry()
+    entry.add_to_hass(hass)
+    coordinator = ActronAirSystemCoordinator(
+        hass,
+        entry,
+        api,
+        rate_limiter,
+        ActronAirSystemInfo(serial="abc1"),
+        push_updates_enabled=False,
+    )
+    entry.runtime_data = ActronAirRuntimeData(
+        api=api,
+        rate_limiter=rate_limiter,
+        connection_stats=ActronAirConnectionStats(),
+        account_coordinator=AsyncMock(),
+        system_coordinators={"abc1": coordinator},
+        push_updates_enabled=False,
+    )
+    entry.mock_state(hass, ConfigEntryState.LOADED)
+    device = device_registry.async_get_or_create(
+        config_entry_id=entry.entry_id, identifiers={(DOMAIN, "abc1")}
+    )
+    async_setup_services(hass)
+    return coordinator, device.id
+
+
+async def test_set_zones_sends_one_command(
+    hass: HomeAssistant, system: tuple[ActronAirSystemCoordinator, str]
+) -> None:
+    """Test several zones are changed by a single command."""
+    coordinator, device_id = system
+    zone = coordinator.data.remote_zone_info[0]
+    temperature = zone.max_temp
+
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_SET_ZONES,
+        {
+            ATTR_DEVICE_ID: device_id,
+            ATTR_ZONES: {
+                "1": {"temperature": temperature},
+                "2": {"enabled": True},
+                "3": {"enabled": False},
+            },
+        },
+        blocking=True,
+    )
+
+    coordinator.api.send_command.assert_awaited_once_with(
+        "abc1",
+        {
+            "command": {
+                "type": "set-settings",
+                "RemoteZoneInfo[0].TemperatureSetpoint_Cool_oC": temperature,
+                "UserAirconSettings.EnabledZones": [True, True, False],
+            }
+        },
+    )
+    assert coordinator.data.remote_zone_info[0].temperature_setpoint_cool_c == (
+        temperature
+    )
+    assert coordinator.data.user_aircon_settings.enabled_zones == [True, True, False]
+    assert coordinator.pending_commands == 2
+    await coordinator.async_shutdown()
+
+
+async def test_set_zones_validates_every_zone(
+    hass: HomeAssistant, system: tuple[ActronAirSystemCoordinator, str]
+) -> None:
+    """Test nothing is sent when any zone setting is invalid."""
+    coordinator, device_id = system
+    too_hot = coordinator.data.remote_zone_info[1].max_temp + 1
+
+    with pytest.raises(ServiceValidationError) as err:
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_SET_ZONES,
+            {
+                ATTR_DEVICE_ID: device_id,
+                ATTR_ZONES: {"1": {"enabled": False}, "2": {"temperature": too_hot}},
+            },
+            blocking=True,
+        )
+    assert err.value.translation_key == "zone_temperature_out_of_range"
+
+    with pytest.raises(ServiceValidationError) as err:
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_SET_ZONES,
+            {ATTR_DEVICE_ID: device_id, ATTR_ZONES: {"4": {"enabled": True}}},
+            blocking=True,
+        )
+    assert err.value.translation_key == "zone_not_found"
+    coordinator.api.send_command.assert_not_awaited()
+    await coordinator.async_shutdown()
+
+
+async def test_restore_sends_only_changes(
+    hass: HomeAssistant, system: tuple[ActronAirSystemCoordinator, str]
+) -> None:
+    """Test restoring sends the changed settings, turning the system on first."""
+    coordinator, device_id = system
+    settings = coordinator.data.user_aircon_settings
+    zone = coordinator.data.remote_zone_info[2]
+    settings.is_on = True
+    await hass.services.async_call(
+        DOMAIN, SERVICE_SNAPSHOT, {ATTR_DEVICE_ID: device_id}, blocking=True
+    )
+    saved_setpoint = zone.temperature_setpoint_cool_c
+
+    # An unchanged system needs no commands at all.
+    await hass.services.async_call(
+        DOMAIN, SERVICE_RESTORE, {ATTR_DEVICE_ID: device_id}, blocking=True
+    )
+    coordinator.api.send_command.assert_not_awaited()
+
+    settings.is_on = False
+    settings.enabled_zones = [True, True, False]
+    zone.temperature_setpoint_cool_c = saved_setpoint + 1
+    await hass.services.async_call(
+        DOMAIN, SERVICE_RESTORE, {ATTR_DEVICE_ID: device_id}, blocking=True
+    )
+
+    assert coordinator.api.send_command.await_args_list == [
+        call(
+            "abc1",
+            {"command": {"type": "set-settings", "UserAirconSettings.isOn": True}},
+        ),
+        call(
+            "abc1",
+            {
+                "command": {
+                    "type": "set-settings",
+                    "UserAirconSettings.EnabledZones": [True, True, True],
+                    "RemoteZoneInfo[2].TemperatureSetpoint_Cool_oC": saved_setpoint,
+                }
+            },
+        ),
+    ]
+    assert settings.is_on
+    assert zone.temperature_setpoint_cool_c == saved_setpoint
+
+    await hass.services.async_call(
+        DOMAIN, SERVICE_RESTORE, {ATTR_DEVICE_ID: device_id}, blocking=True
+    )
+    assert coordinator.api.send_command.await_count == 2
+    await coordinator.async_shutdown()
+
+
+async def test_restore_requires_snapshot(
+    hass: HomeAssistant, system: tuple[ActronAirSystemCoordinator, str]
+) -> None:
+    """Test restoring before any snapshot is rejected."""
+    coordinator, device_id = system
+
+    with pytest.raises(ServiceValidationError) as err:
+        await hass.services.async_call(
+            DOMAIN, SERVICE_RESTORE, {ATTR_DEVICE_ID: device_id}, blocking=True
+        )
+    assert err.value.translation_key == "no_snapshot"
+    await coordinator.async_shutdown()
+
+
+async def test_restore_after_reload(
+    hass: HomeAssistant, system: tuple[ActronAirSystemCoordinator, str]
+) -> None:
+    """Test snapshots outlive the coordinator and follow replaced statuses."""
+    coordinator, device_id = system
+    coordinator.data.user_aircon_settings.is_on = True
+    await hass.services.async_call(
+        DOMAIN, SERVICE_SNAPSHOT, {ATTR_DEVICE_ID: device_id}, blocking=True
+    )
+    await coordinator.async_shutdown()
+
+    # A reload builds a new coordinator for the same system.
+    entry = coordinator.config_entry
+    reloaded = ActronAirSystemCoordinator(
+        hass,
+        entry,
+        coordinator.api,
+        coordinator.rate_limiter,
+        coordinator.system,
+        push_updates_enabled=False,
+    )
+    entry.runtime_data.system_coordinators["abc1"] = reloaded
+    reloaded.async_set_polled_status(mock_status(zone_count=3, setpoint=25))
+
+    async def send_command(serial_number: str, command: dict) -> None:
+        # A poll lands while the system is being turned on.
+        if reloaded.api.send_command.await_count == 1:
+            reloaded.async_set_polled_status(mock_status(zone_count=3, setpoint=25))
+
+    reloaded.api.send_command.side_effect = send_command
+    await hass.services.async_call(
+        DOMAIN, SERVICE_RESTORE, {ATTR_DEVICE_ID: device_id}, blocking=True
+    )
+
+    assert reloaded.api.send_command.await_count == 2
+    settings = reloaded.data.user_aircon_settings
+    assert settings.temperature_setpoint_cool_c == 22
+    await reloaded.async_shutdown()
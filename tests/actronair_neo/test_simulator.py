@@ -0,0 +1,62 @@
+"""Tests for the local Actron Air cloud simulator."""
+
+import asyncio
+from collections.abc import AsyncGenerator
+
+from aiohttp import web
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.actronair.api import CLOUD_URL_ENV, create_api
+from custom_components.actronair.metrics import ActronAirConnectionStats
+from script.simulator import ActronAirCloudSimulator, SimulatorConfig
+
+
+@pytest.fixture
+async def simulator(
+    socket_enabled: None,
+    monkeypatch: pytest.MonkeyPatch,
+) -> AsyncGenerator[ActronAirCloudSimulator]:
+    """Serve a simulated cloud and point the integration at it."""
+    simulator = ActronAirCloudSimulator(
+        SimulatorConfig(systems=2, zones=3, push_interval=0)
+    )
+    runner = web.AppRunner(simulator.create_app())
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    monkeypatch.setenv(CLOUD_URL_ENV, f"http://127.0.0.1:{port}")
+    yield simulator
+    await runner.cleanup()
+
+
+async def test_client_against_simulator(
+    hass: HomeAssistant, simulator: ActronAirCloudSimulator
+) -> None:
+    """Test the client discovers, fetches, commands and receives pushes."""
+    connection_stats = ActronAirConnectionStats()
+    api = create_api(hass, connection_stats, refresh_token="token")
+    pushed = asyncio.Event()
+    systems = await api.get_ac_systems()
+    assert [system.serial for system in systems] == list(simulator.states)
+    serial = systems[0].serial
+
+    await api.update_status(serial)
+    status = api.state_manager.get_status(serial)
+    assert status.remote_zone_info[2].title == "Zone 3"
+
+    assert await api.start_push([serial])
+    api.subscribe_system_updates(serial, lambda _: pushed.set())
+    await status.user_aircon_settings.set_temperature(18.0)
+    await asyncio.wait_for(pushed.wait(), 5)
+    assert (
+        simulator.states[serial]["UserAirconSettings"]["TemperatureSetpoint_Cool_oC"]
+        == 18.0
+    )
+    await api.stop_push()
+
+    # Token refresh, discovery, status and command share one connection.
+    assert connection_stats.new_connections == 1
+    assert connection_stats.reused_connections == 3
@@ -0,0 +1,221 @@
+"""Tests for Actron Air entity state reads and writes."""
+
+from dataclasses import replace
+from unittest.mock import Mock, patch
+
+from actron_neo_api.models.system import ActronAirSystemInfo
+from freezegun.api import FrozenDateTimeFactory
+from pytest_homeassistant_custom_component.common import (
+    MockEntityPlatform,
+    async_fire_time_changed,
+)
+
+from homeassistant.components.climate import HVACMode
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.actronair.binary_sensor import (
+    BINARY_SENSORS,
+    ActronAirBinarySensor,
+)
+from custom_components.actronair.climate import ActronSystemClimate, ActronZoneClimate
+from custom_components.actronair.const import DOMAIN
+from custom_components.actronair.coordinator import ActronAirSystemCoordinator
+from custom_components.actronair.sensor import (
+    COMPRESSOR_WRITE_INTERVAL,
+    ENERGY_SENSOR,
+    PERIPHERAL_SENSORS,
+    SENSORS,
+    ActronAirEnergySensor,
+    ActronAirPeripheralSensor,
+    ActronAirSensor,
+)
+
+from .common import mock_api, mock_config_entry, mock_rate_limiter, mock_status
+
+
+async def test_unchanged_state_is_not_written(hass: HomeAssistant) -> None:
+    """Test identical coordinator updates skip the state write."""
+    api = mock_api(["abc1"])
+    coordinator = ActronAirSystemCoordinator(
+        hass,
+        mock_config_entry(),
+        api,
+        mock_rate_limiter(["abc1"]),
+        ActronAirSystemInfo(serial="abc1"),
+        False,
+    )
+    entity = ActronAirBinarySensor(coordinator, BINARY_SENSORS[0])
+
+    with patch.object(entity, "async_write_ha_state") as write_state:
+        entity._handle_coordinator_update()
+        entity._handle_coordinator_update()
+        assert write_state.call_count == 1
+        assert coordinator.suppressed_state_writes == 1
+
+        coordinator.data.alerts.clean_filter = True
+        entity._handle_coordinator_update()
+        assert write_state.call_count == 2
+
+        coordinator.async_set_polled_status(mock_status())
+        entity._handle_coordinator_update()
+        assert write_state.call_count == 3
+
+
+async def test_peripheral_lookup_follows_snapshot(hass: HomeAssistant) -> None:
+    """Test peripheral entities read from the index of the latest snapshot."""
+    api = mock_api([])
+    api.state_manager.process_status_update(
+        "abc1", mock_status(peripherals={"p1": 80, "p2": 60})
+    )
+    coordinator = ActronAirSystemCoordinator(
+        hass,
+        mock_config_entry(),
+        api,
+        mock_rate_limiter(["abc1"]),
+        ActronAirSystemInfo(serial="abc1"),
+        False,
+    )
+    peripheral = coordinator.index.peripherals["p2"]
+    entity = ActronAirPeripheralSensor(coordinator, peripheral, PERIPHERAL_SENSORS[2])
+    assert entity.native_value == 60
+
+    coordinator.async_set_polled_status(mock_status(peripherals={"p2": 55}))
+    assert entity.native_value == 55
+    assert set(coordinator.index.peripherals) == {"p2"}
+
+    coordinator.async_set_polled_status(mock_status())
+    assert entity.native_value is None
+
+
+async def test_updates_are_routed_to_changed_parts(hass: HomeAssistant) -> None:
+    """Test listeners are only called for the parts of the status they show."""
+    api = mock_api([])
+    api.state_manager.process_status_update(
+        "abc1", mock_status(zone_count=3, peripherals={"p1": 80, "p2": 60})
+    )
+    coordinator = ActronAirSystemCoordinator(
+        hass,
+        mock_config_entry(),
+        api,
+        mock_rate_limiter(["abc1"]),
+        ActronAirSystemInfo(serial="abc1"),
+        False,
+    )
+    entities = [
+        ActronSystemClimate(coordinator),
+        ActronAirEnergySensor(coordinator, ENERGY_SENSOR),
+        *(
+            ActronZoneClimate(coordinator, zone)
+            for zone in coordinator.data.remote_zone_info
+        ),
+        *(
+            ActronAirPeripheralSensor(coordinator, peripheral, PERIPHERAL_SENSORS[2])
+            for peripheral in coordinator.data.peripherals
+        ),
+    ]
+    listeners = [Mock() for _ in entities]
+    for entity, listener in zip(entities, listeners, strict=True):
+        coordinator.async_add_listener(listener, entity.coordinator_context)
+
+    def called() -> list[int]:
+        calls = [index for index, listener in enumerate(listeners) if listener.called]
+        for listener in listeners:
+            listener.reset_mock()
+        return calls
+
+    status = mock_status(zone_count=3, peripherals={"p1": 80, "p2": 60})
+    status.last_known_state["RemoteZoneInfo"][1]["LiveTemp_oC"] = 25.0
+    status.parse_nested_components()
+    coordinator.async_set_polled_status(status)
+    # The energy sensor hears every update, the other zones and peripherals do not.
+    assert called() == [1, 3]
+    assert coordinator.skipped_listener_calls == 5
+
+    coordinator.async_set_polled_status(
+        mock_status(zone_count=3, peripherals={"p1": 80, "p2": 55})
+    )
+    assert called() == [1, 3, 6]
+
+    coordinator.async_set_polled_status(
+        mock_status(is_on=True, zone_count=3, peripherals={"p1": 80, "p2": 55})
+    )
+    assert called() == [0, 1, 2, 3, 4]
+
+    coordinator.available = False
+    coordinator.async_update_listeners()
+    assert called() == list(range(len(listeners)))
+    await coordinator.async_shutdown()
+
+
+async def test_derived_climate_values_follow_snapshot(hass: HomeAssistant) -> None:
+    """Test climate entities share derived values until the next snapshot."""
+    api = mock_api([])
+    api.state_manager.process_status_update("abc1", mock_status(zone_count=2))
+    coordinator = ActronAirSystemCoordinator(
+        hass,
+        mock_config_entry(),
+        api,
+        mock_rate_limiter(["abc1"]),
+        ActronAirSystemInfo(serial="abc1"),
+        False,
+    )
+    system = ActronSystemClimate(coordinator)
+    zones = [
+        ActronZoneClimate(coordinator, zone)
+        for zone in coordinator.data.remote_zone_info
+    ]
+    hvac_modes = system.hvac_modes
+
+    assert hvac_modes[-1] == HVACMode.OFF
+    assert all(zone.hvac_modes is hvac_modes for zone in zones)
+    assert system.hvac_mode == HVACMode.OFF
+
+    coordinator.async_set_polled_status(mock_status(is_on=True, zone_count=2))
+    assert system.hvac_modes is not hvac_modes
+    assert system.hvac_mode == HVACMode.COOL
+    assert zones[0].min_temp == coordinator.data.remote_zone_info[0].min_temp
+
+
+async def test_sensor_writes_are_throttled(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test small changes are skipped and others wait for the write interval."""
+    coordinator = ActronAirSystemCoordinator(
+        hass,
+        mock_config_entry(),
+        mock_api(["abc1"]),
+        mock_rate_limiter(["abc1"]),
+        ActronAirSystemInfo(serial="abc1"),
+        False,
+    )
+    description = next(
+        description for description in SENSORS if description.key == "compressor_power"
+    )
+    entity = ActronAirSensor(
+        coordinator, replace(description, entity_registry_enabled_default=True)
+    )
+    await MockEntityPlatform(
+        hass, domain=Platform.SENSOR, platform_name=DOMAIN
+    ).async_add_entities([entity])
+    assert hass.states.get(entity.entity_id).state == "0"
+
+    coordinator.async_set_polled_status(mock_status(compressor_power=1000))
+    coordinator.async_set_polled_status(mock_status(compressor_power=1020))
+    assert hass.states.get(entity.entity_id).state == "0"
+
+    freezer.tick(COMPRESSOR_WRITE_INTERVAL)
+    async_fire_time_changed(hass, dt_util.utcnow())
+    await hass.async_block_till_done()
+    assert hass.states.get(entity.entity_id).state == "1020"
+
+    freezer.tick(COMPRESSOR_WRITE_INTERVAL * 2)
+    coordinator.async_set_polled_status(mock_status(compressor_power=1040))
+    assert hass.states.get(entity.entity_id).state == "1020"
+    assert coordinator.suppressed_state_writes == 3
+
+    coordinator.async_set_polled_status(mock_status(compressor_power=2000))
+    assert hass.states.get(entity.entity_id).state == "2000"
+    await entity.async_remove()
+    await coordinator.async_shutdown()